@@ -27,7 +27,7 @@ async def main() -> None:
             print(error)
             return
 
-    print(f"Measurement stations: {gios.measurement_stations}")
+    print(f"Measurement stations: {dict(gios.measurement_stations)}")
     print(f"Station: {gios.station_name} ({gios.latitude}, {gios.longitude})")
     print(data)
 
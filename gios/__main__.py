@@ -0,0 +1,184 @@
+"""Command line bulk dumper for GIOS data."""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, TextIO
+
+from aiohttp import ClientSession
+
+from .client import Gios
+from .const import DEFAULT_CONCURRENCY, GATEWAY_HOST, GATEWAY_PORT
+from .sensor_index import SensorIndex
+from .sharding import ShardedPoller, StationResult
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m gios",
+        description="Dump GIOS air quality data as NDJSON.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="maximum number of stations updated at the same time",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="number of worker processes sharing the stations to update",
+    )
+    parser.add_argument(
+        "--sensor-index",
+        type=Path,
+        help="file with the persistent index of station sensors",
+    )
+    parser.add_argument(
+        "--sensor-index-max-age",
+        type=float,
+        help="seconds after which station sensors in the index are fetched again",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stations", help="dump the measurement stations catalog")
+    station = subparsers.add_parser("station", help="dump one station readings")
+    station.add_argument("station_id", type=int)
+    gateway = subparsers.add_parser(
+        "gateway", help="run the caching gateway server in front of the GIOS API"
+    )
+    gateway.add_argument("--host", default=GATEWAY_HOST)
+    gateway.add_argument("--port", type=int, default=GATEWAY_PORT)
+    every = subparsers.add_parser("all", help="dump all stations readings")
+    every.add_argument(
+        "station_ids",
+        type=int,
+        nargs="*",
+        help="limit the dump to these stations",
+    )
+    return parser.parse_args(argv)
+
+
+def _write(out: TextIO, record: dict[str, Any]) -> None:
+    """Write one NDJSON record."""
+    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    out.flush()
+
+
+async def _update_stations(
+    gios: Gios, station_ids: list[int], concurrency: int
+) -> AsyncIterator[StationResult]:
+    """Update stations in this process, yield results in the order of completion."""
+    started: dict[int, float] = {}
+
+    def pending() -> Iterator[int]:
+        # A station is taken from the iterator when its update starts
+        for station_id in station_ids:
+            started[station_id] = time.perf_counter()
+            yield station_id
+
+    async for station_id, result in gios.async_iter_updates(pending(), concurrency):
+        latency = time.perf_counter() - started[station_id]
+        if isinstance(result, Exception):
+            yield StationResult(station_id, None, repr(result), latency, 0)
+        else:
+            yield StationResult(station_id, result, None, latency, 0)
+
+
+async def run(
+    args: argparse.Namespace,
+    session: ClientSession,
+    out: TextIO = sys.stdout,
+    err: TextIO = sys.stderr,
+) -> int:
+    """Run the command and return the exit code."""
+    if args.command == "gateway":
+        # The web server is only needed by the gateway, keep other commands light
+        from .gateway import Gateway  # noqa: PLC0415
+
+        await Gateway(session).async_serve(args.host, args.port)
+        return 0
+
+    start = time.perf_counter()
+    sensor_index = (
+        SensorIndex(args.sensor_index_max_age)
+        if args.sensor_index is None
+        else SensorIndex.load(args.sensor_index, args.sensor_index_max_age)
+    )
+    gios = await Gios.create(session, sensor_index=sensor_index)
+
+    if args.command == "stations":
+        for station in gios.measurement_stations.values():
+            _write(out, asdict(station))
+        return 0
+
+    station_ids = (
+        [args.station_id]
+        if args.command == "station"
+        else args.station_ids or list(gios.measurement_stations)
+    )
+    latencies: list[float] = []
+    failed = 0
+
+    results = (
+        ShardedPoller(
+            gios, processes=args.processes, concurrency=args.concurrency
+        ).async_poll(station_ids)
+        if args.processes > 1
+        else _update_stations(gios, station_ids, args.concurrency)
+    )
+    async for result in results:
+        latencies.append(result.latency)
+        if result.sensors is None:
+            failed += 1
+            _write(out, {"station_id": result.station_id, "error": result.error})
+        else:
+            _write(
+                out, {"station_id": result.station_id, "data": asdict(result.sensors)}
+            )
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "stations": len(station_ids),
+        "failed": failed,
+        "elapsed": round(elapsed, 3),
+    }
+    if station_ids and elapsed > 0:
+        summary["stations_per_second"] = round(len(station_ids) / elapsed, 2)
+    if latencies:
+        summary["latency_median"] = round(statistics.median(latencies), 3)
+        summary["latency_max"] = round(max(latencies), 3)
+    if len(latencies) > 1:
+        summary["latency_p95"] = round(
+            statistics.quantiles(latencies, n=20, method="inclusive")[-1], 3
+        )
+    _write(err, summary)
+
+    if args.sensor_index is not None:
+        gios.sensor_index.save(args.sensor_index)
+
+    # Nothing to dump isn't a failure
+    return 1 if station_ids and failed == len(station_ids) else 0
+
+
+async def async_main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface."""
+    args = parse_args(argv)
+    async with ClientSession() as session:
+        return await run(args, session)
+
+
+def main() -> None:
+    """Run the command line interface."""
+    sys.exit(asyncio.run(async_main()))
+
+
+if __name__ == "__main__":
+    main()
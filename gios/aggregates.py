@@ -0,0 +1,270 @@
+"""Incremental rolling aggregates of sensor measurements."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Final
+
+from .model import GiosSensors, Sensor
+from .normalize import HOURS_PER_DAY, hour_number
+
+EIGHT_HOURS: Final[int] = 8
+# Minimum number of hourly values for a valid 24-hour and 8-hour mean (75%)
+MIN_DAY_VALUES: Final[int] = 18
+MIN_EIGHT_HOUR_VALUES: Final[int] = 6
+DEFAULT_RETENTION_DAYS: Final[int] = 400
+
+# Daily limits (µg/m³) of the daily mean, for ozone of the maximum 8-hour mean
+DAILY_LIMITS: Final[dict[str, float]] = {"o3": 120, "pm10": 50, "pm25": 25}
+EIGHT_HOUR_POLLUTANTS: Final[frozenset[str]] = frozenset({"o3"})
+
+
+@dataclass(frozen=True, slots=True)
+class SensorAggregates:
+    """Data class for sensor aggregates."""
+
+    mean_24h: float | None
+    daily_mean: float | None
+    max_8h_mean: float | None
+    exceedance_days: int
+
+
+@dataclass(slots=True)
+class _Day:
+    """Hourly values and statistics of one day."""
+
+    values: list[float | None] = field(default_factory=lambda: [None] * HOURS_PER_DAY)
+    total: float = 0.0
+    count: int = 0
+    eight_hour_means: list[float | None] | None = None
+
+
+class SensorAggregator:
+    """Rolling aggregates of one sensor updated in O(1) per data point."""
+
+    def __init__(
+        self,
+        limit: float | None = None,
+        eight_hour: bool = False,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+    ) -> None:
+        """Initialize."""
+        self.limit = limit
+        self.eight_hour = eight_hour
+        self.retention_days = retention_days
+        self.latest: int | None = None
+        self._days: dict[int, _Day] = {}
+        self._oldest_day: int | None = None
+        self._window_total = 0.0
+        self._window_count = 0
+        self._exceedances: set[int] = set()
+
+    def _value(self, hour: int) -> float | None:
+        """Return the stored value for the hour."""
+        if (day := self._days.get(hour // HOURS_PER_DAY)) is None:
+            return None
+        return day.values[hour % HOURS_PER_DAY]
+
+    def _in_window(self, hour: int) -> bool:
+        """Return True if the hour is in the rolling 24-hour window."""
+        latest = self.latest
+        return latest is not None and latest - HOURS_PER_DAY < hour <= latest
+
+    def add(self, hour: int, value: float | None) -> bool:
+        """Add or correct the value for the hour, return True if anything changed."""
+        if (
+            self.latest is not None
+            and hour < self.latest - self.retention_days * HOURS_PER_DAY
+        ):
+            return False
+
+        old = self._value(hour)
+        advanced = self.latest is None or hour > self.latest
+        if advanced:
+            self._advance(hour)
+        if old == value:
+            return advanced
+
+        day_number, hour_of_day = divmod(hour, HOURS_PER_DAY)
+        if (day := self._days.get(day_number)) is None:
+            day = self._days[day_number] = _Day()
+        day.values[hour_of_day] = value
+        delta_total = (value or 0.0) - (old or 0.0)
+        delta_count = (value is not None) - (old is not None)
+        day.total += delta_total
+        day.count += delta_count
+        if self._in_window(hour):
+            self._window_total += delta_total
+            self._window_count += delta_count
+
+        if self.eight_hour:
+            self._update_eight_hour_means(hour)
+        self._update_exceedance(day_number)
+        return True
+
+    def _advance(self, hour: int) -> None:
+        """Move the rolling window end to the hour, evict values leaving it."""
+        if self.latest is not None:
+            for leaving in range(
+                self.latest - HOURS_PER_DAY + 1,
+                min(hour - HOURS_PER_DAY, self.latest) + 1,
+            ):
+                if (value := self._value(leaving)) is not None:
+                    self._window_total -= value
+                    self._window_count -= 1
+        self.latest = hour
+
+        oldest_day = hour // HOURS_PER_DAY - self.retention_days
+        if self._oldest_day is not None:
+            # Days leave the retention period one by one, after a long gap it's
+            # cheaper to scan the stored days
+            leaving: Iterable[int] = (
+                [number for number in self._days if number < oldest_day]
+                if oldest_day - self._oldest_day > len(self._days)
+                else range(self._oldest_day, oldest_day)
+            )
+            for day_number in leaving:
+                self._days.pop(day_number, None)
+                self._exceedances.discard(day_number)
+        self._oldest_day = oldest_day
+
+    def _update_eight_hour_means(self, hour: int) -> None:
+        """Recompute 8-hour means which include the hour."""
+        for end in range(hour, min(hour + EIGHT_HOURS, (self.latest or hour) + 1)):
+            values = [
+                value
+                for past in range(end - EIGHT_HOURS + 1, end + 1)
+                if (value := self._value(past)) is not None
+            ]
+            mean = (
+                sum(values) / len(values)
+                if len(values) >= MIN_EIGHT_HOUR_VALUES
+                else None
+            )
+            day_number, hour_of_day = divmod(end, HOURS_PER_DAY)
+            if (day := self._days.get(day_number)) is None:
+                if mean is None:
+                    continue
+                day = self._days[day_number] = _Day()
+            if day.eight_hour_means is None:
+                day.eight_hour_means = [None] * HOURS_PER_DAY
+            day.eight_hour_means[hour_of_day] = mean
+            if day_number != hour // HOURS_PER_DAY:
+                self._update_exceedance(day_number)
+
+    def _daily_metric(self, day_number: int) -> float | None:
+        """Return the daily value compared with the limit."""
+        if (day := self._days.get(day_number)) is None:
+            return None
+        if self.eight_hour:
+            means = [mean for mean in day.eight_hour_means or () if mean is not None]
+            return max(means) if means else None
+        return day.total / day.count if day.count >= MIN_DAY_VALUES else None
+
+    def _update_exceedance(self, day_number: int) -> None:
+        """Update the exceedance flag of the day."""
+        if self.limit is None:
+            return
+        if (metric := self._daily_metric(day_number)) is not None and (
+            metric > self.limit
+        ):
+            self._exceedances.add(day_number)
+        else:
+            self._exceedances.discard(day_number)
+
+    def results(self) -> SensorAggregates:
+        """Return current aggregates."""
+        if self.latest is None:
+            return SensorAggregates(None, None, None, 0)
+
+        today = self.latest // HOURS_PER_DAY
+        day = self._days.get(today)
+        year = datetime.fromordinal(today).year
+        return SensorAggregates(
+            self._window_total / self._window_count
+            if self._window_count >= MIN_DAY_VALUES
+            else None,
+            day.total / day.count if day is not None and day.count else None,
+            self._daily_metric(today) if self.eight_hour else None,
+            sum(
+                1
+                for day_number in self._exceedances
+                if datetime.fromordinal(day_number).year == year
+            ),
+        )
+
+
+class AggregateEngine:
+    """Rolling aggregates of many sensors.
+
+    Per sensor it keeps the 24-hour mean, the daily mean, the daily maximum of
+    8-hour means (ozone) and the number of days in the year exceeding the
+    daily limit.
+    """
+
+    def __init__(self, limits: Mapping[str, float] = DAILY_LIMITS) -> None:
+        """Initialize."""
+        self.limits = limits
+        self._sensors: dict[int, SensorAggregator] = {}
+
+    def sensor(self, sensor_id: int, pollutant: str | None = None) -> SensorAggregator:
+        """Return the aggregator of the sensor, create it if needed."""
+        if (aggregator := self._sensors.get(sensor_id)) is None:
+            aggregator = self._sensors[sensor_id] = SensorAggregator(
+                self.limits.get(pollutant or ""),
+                pollutant in EIGHT_HOUR_POLLUTANTS,
+            )
+        return aggregator
+
+    def ingest(
+        self,
+        sensor_id: int,
+        entries: Iterable[dict[str, Any]],
+        pollutant: str | None = None,
+    ) -> int:
+        """Add raw measurement entries (newest first), return the changed count.
+
+        Entries older than the retention period are skipped, new values and
+        late corrections of retained days are added, unchanged values cost
+        nothing but the lookup.
+        """
+        aggregator = self.sensor(sensor_id, pollutant)
+        cutoff = (
+            None
+            if aggregator.latest is None
+            else aggregator.latest - aggregator.retention_days * HOURS_PER_DAY
+        )
+        changed = 0
+        for entry in entries:
+            if not (timestamp := entry.get("Data")):
+                continue
+            hour = hour_number(timestamp)
+            if cutoff is not None and hour < cutoff:
+                break
+            changed += aggregator.add(hour, entry.get("Wartość"))
+        return changed
+
+    def results(self, sensor_id: int) -> SensorAggregates | None:
+        """Return aggregates of the sensor."""
+        if (aggregator := self._sensors.get(sensor_id)) is None:
+            return None
+        return aggregator.results()
+
+    def update(
+        self, sensors: GiosSensors, entries: Mapping[int, Iterable[dict[str, Any]]]
+    ) -> dict[str, SensorAggregates]:
+        """Ingest entries of sensors selected in the update, return aggregates.
+
+        `entries` are raw measurements by sensor ID, for example
+        Gios.sensor_entries after async_update().
+        """
+        results: dict[str, SensorAggregates] = {}
+        for item in fields(sensors):
+            sensor: Sensor | None = getattr(sensors, item.name)
+            if sensor is None or sensor.id is None:
+                continue
+            if (sensor_entries := entries.get(sensor.id)) is not None:
+                self.ingest(sensor.id, sensor_entries, item.name)
+            if (result := self.results(sensor.id)) is not None:
+                results[item.name] = result
+        return results
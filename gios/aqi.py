@@ -0,0 +1,95 @@
+"""Local computation of the Polish air quality index."""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Final
+
+from .model import GiosSensors, Sensor
+
+# Index categories from the best to the worst, values of STATE_MAP
+CATEGORIES: Final[tuple[str, ...]] = (
+    "very_good",
+    "good",
+    "moderate",
+    "sufficient",
+    "bad",
+    "very_bad",
+)
+
+# Upper bounds (inclusive, µg/m³) of all index categories but the last one
+BREAKPOINTS: Final[dict[str, tuple[float, ...]]] = {
+    "no2": (40, 100, 150, 230, 400),
+    "o3": (70, 120, 150, 180, 240),
+    "pm10": (20, 50, 80, 110, 150),
+    "pm25": (13, 35, 55, 75, 110),
+    "so2": (50, 100, 200, 350, 500),
+}
+
+NO_INDEX: Final[int] = -1
+
+
+def index_levels(pollutant: str, values: Iterable[float | None]) -> array[int]:
+    """Return index levels (positions in CATEGORIES) for pollutant values.
+
+    Missing values (None or NaN) get NO_INDEX level.
+    """
+    breakpoints = BREAKPOINTS[pollutant]
+    return array(
+        "b",
+        (
+            NO_INDEX
+            if value is None or math.isnan(value)
+            else bisect_left(breakpoints, value)
+            for value in values
+        ),
+    )
+
+
+def aqi_levels(levels: Iterable[Sequence[int]]) -> array[int]:
+    """Return the overall index levels, the worst of pollutant levels."""
+    return array("b", (max(items) for items in zip(*levels, strict=True)))
+
+
+def categories(levels: Iterable[int]) -> list[str | None]:
+    """Return index categories for index levels."""
+    return [None if level == NO_INDEX else CATEGORIES[level] for level in levels]
+
+
+def station_levels(
+    values: Mapping[str, Sequence[float | None]],
+) -> tuple[dict[str, array[int]], array[int]]:
+    """Return index levels of pollutants and the overall index for series.
+
+    `values` maps pollutants to aligned value series, for example many stations
+    or many time steps of one station.
+    """
+    levels = {
+        pollutant: index_levels(pollutant, series)
+        for pollutant, series in values.items()
+        if pollutant in BREAKPOINTS
+    }
+    return levels, aqi_levels(levels.values())
+
+
+def sensors_indexes(sensors: GiosSensors) -> tuple[dict[str, str], str | None]:
+    """Return index categories of pollutants and the overall index."""
+    values: dict[str, list[float | None]] = {}
+    for pollutant in BREAKPOINTS:
+        sensor: Sensor | None = getattr(sensors, pollutant)
+        if (
+            sensor is not None
+            and isinstance(sensor.value, int | float)
+            and not math.isnan(sensor.value)
+        ):
+            values[pollutant] = [sensor.value]
+
+    if not values:
+        return {}, None
+
+    levels, aqi = station_levels(values)
+    return (
+        {pollutant: CATEGORIES[series[0]] for pollutant, series in levels.items()},
+        CATEGORIES[aqi[0]],
+    )
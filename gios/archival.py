@@ -0,0 +1,198 @@
+"""Resumable download of GIOS archival sensor data."""
+
+import asyncio
+import csv
+import itertools
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Final, Protocol, Self, TextIO
+
+from aiohttp import ClientError
+
+from .client import Gios
+from .const import ARCHIVAL_DATE_FORMAT, ARCHIVAL_PAGE_SIZE, DEFAULT_CONCURRENCY
+from .exceptions import ApiError
+from .ratelimit import RateLimiter
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_RATE: Final[float] = 2.0
+DEFAULT_WINDOW: Final = timedelta(days=31)
+
+
+class ArchivalSink(Protocol):
+    """Protocol for objects storing downloaded measurements."""
+
+    def ingest(self, sensor_id: int, entries: Iterable[dict[str, Any]]) -> int:
+        """Store measurement entries of a sensor."""
+        ...
+
+
+class CsvSink:
+    """Append downloaded measurements to a CSV file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize."""
+        path = Path(path)
+        new = not path.exists() or path.stat().st_size == 0
+        self._file: TextIO = path.open("a", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        if new:
+            self._writer.writerow(("sensor_id", "timestamp", "value"))
+
+    def ingest(self, sensor_id: int, entries: Iterable[dict[str, Any]]) -> int:
+        """Append measurement entries of a sensor."""
+        count = 0
+        for entry in entries:
+            self._writer.writerow((sensor_id, entry.get("Data"), entry.get("Wartość")))
+            count += 1
+        self._file.flush()
+        return count
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the file."""
+        self.close()
+
+
+Chunk = tuple[int, datetime, datetime]
+
+
+class ArchivalDownloader:
+    """Download archival data of many sensors in bounded memory.
+
+    The date range is split into windows, windows of all sensors are processed
+    by a fixed number of workers and pages of a window are fetched concurrently
+    within the rate limit, so memory is bounded by the window size. A window is
+    handed to the sink only when all its pages are downloaded and is then
+    recorded in the checkpoint file, so an interrupted backfill resumes where
+    it stopped without storing any entries twice.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        gios: Gios,
+        sink: ArchivalSink,
+        *,
+        checkpoint: str | Path | None = None,
+        rate: float = DEFAULT_RATE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        window: timedelta = DEFAULT_WINDOW,
+        page_size: int = ARCHIVAL_PAGE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.gios = gios
+        self.sink = sink
+        self.checkpoint = None if checkpoint is None else Path(checkpoint)
+        self.concurrency = concurrency
+        self.window = window
+        self.page_size = page_size
+        self._limiter = RateLimiter(rate, burst=concurrency)
+        self._requests = asyncio.Semaphore(concurrency)
+        self.failed: list[Chunk] = []
+
+    def _completed(self) -> set[Chunk]:
+        """Return windows completed in previous runs."""
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return set()
+        completed: set[Chunk] = set()
+        with self.checkpoint.open(encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                completed.add(
+                    (
+                        item["sensor"],
+                        datetime.strptime(item["from"], ARCHIVAL_DATE_FORMAT),  # noqa: DTZ007
+                        datetime.strptime(item["to"], ARCHIVAL_DATE_FORMAT),  # noqa: DTZ007
+                    )
+                )
+        return completed
+
+    def _chunks(
+        self, sensor_ids: Iterable[int], date_from: datetime, date_to: datetime
+    ) -> Iterator[Chunk]:
+        """Yield (sensor ID, window start, window end) to download."""
+        completed = self._completed()
+        for sensor_id in sensor_ids:
+            start = date_from
+            while start <= date_to:
+                end = min(start + self.window - timedelta(hours=1), date_to)
+                if (sensor_id, start, end) not in completed:
+                    yield sensor_id, start, end
+                start = end + timedelta(hours=1)
+
+    async def _fetch(self, chunk: Chunk, page: int) -> tuple[list[dict[str, Any]], int]:
+        """Fetch one page of a window."""
+        sensor_id, start, end = chunk
+        async with self._requests, self._limiter:
+            return await self.gios.async_get_archival_data(
+                sensor_id, start, end, page, self.page_size
+            )
+
+    async def _download(self, chunk: Chunk) -> int:
+        """Download all pages of a window, then hand them to the sink."""
+        entries, pages = await self._fetch(chunk, 0)
+        others = await asyncio.gather(
+            *(self._fetch(chunk, page) for page in range(1, pages))
+        )
+        return self.sink.ingest(
+            chunk[0], itertools.chain(entries, *(page for page, _ in others))
+        )
+
+    def _mark_completed(self, chunk: Chunk) -> None:
+        """Record the completed window in the checkpoint file."""
+        if self.checkpoint is None:
+            return
+        sensor_id, start, end = chunk
+        with self.checkpoint.open("a", encoding="utf-8") as file:
+            file.write(
+                json.dumps(
+                    {
+                        "sensor": sensor_id,
+                        "from": start.strftime(ARCHIVAL_DATE_FORMAT),
+                        "to": end.strftime(ARCHIVAL_DATE_FORMAT),
+                    }
+                )
+                + "\n"
+            )
+
+    async def async_download(
+        self, sensor_ids: Iterable[int], date_from: datetime, date_to: datetime
+    ) -> int:
+        """Download archival data of sensors, return the number of entries."""
+        chunks = self._chunks(sensor_ids, date_from, date_to)
+        total = 0
+
+        async def worker() -> None:
+            nonlocal total
+            for chunk in chunks:
+                try:
+                    total += await self._download(chunk)
+                except (ApiError, ClientError, TimeoutError) as error:
+                    # The window isn't marked as completed, the next run retries it
+                    _LOGGER.warning("Archival data %s not downloaded: %s", chunk, error)
+                    self.failed.append(chunk)
+                    continue
+                self._mark_completed(chunk)
+                _LOGGER.debug("Downloaded archival data %s", chunk)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return total
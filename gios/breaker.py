@@ -0,0 +1,101 @@
+"""Circuit breaker for GIOS API requests."""
+
+import logging
+import time
+from types import TracebackType
+from typing import Final, Self
+
+from aiohttp import ClientError
+
+from .exceptions import ApiError, CircuitOpenError, InvalidSensorsDataError
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD: Final[int] = 5
+DEFAULT_RESET_TIMEOUT: Final[float] = 60.0
+
+# Errors of an unhealthy upstream, other errors don't count as failures
+FAILURES: Final = (ApiError, InvalidSensorsDataError, ClientError, TimeoutError)
+
+STATE_CLOSED: Final[str] = "closed"
+STATE_HALF_OPEN: Final[str] = "half_open"
+STATE_OPEN: Final[str] = "open"
+
+
+class CircuitBreaker:
+    """Stop requests to a failing upstream for a cool-down period.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are rejected with CircuitOpenError. After `reset_timeout` seconds
+    one trial request is let through, its success closes the circuit and its
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        """Return the circuit state."""
+        if self._opened is None:
+            return STATE_CLOSED
+        if self._trial or time.monotonic() - self._opened >= self.reset_timeout:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def allow(self) -> bool:
+        """Return True if a request is allowed, start the trial when half open."""
+        if self._opened is None:
+            return True
+        if self._trial or time.monotonic() - self._opened < self.reset_timeout:
+            return False
+        self._trial = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        if self._opened is not None:
+            _LOGGER.info("Circuit closed")
+        self.failures = 0
+        self._opened = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.failures += 1
+        if self._trial or self.failures >= self.failure_threshold:
+            if self._opened is None or self._trial:
+                _LOGGER.warning("Circuit opened after %s failures", self.failures)
+            self._opened = time.monotonic()
+            self._trial = False
+
+    async def __aenter__(self) -> Self:
+        """Enter the runtime context, raise CircuitOpenError if the circuit is open."""
+        if not self.allow():
+            msg = "Circuit open"
+            raise CircuitOpenError(msg)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Record the result of the request."""
+        if exc_val is None:
+            self.record_success()
+        elif isinstance(exc_val, FAILURES):
+            self.record_failure()
+        else:
+            # The request didn't reach a verdict, let the next one try
+            self._trial = False
@@ -0,0 +1,134 @@
+"""Memory-compact catalog of GIOS measurement stations."""
+
+import math
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Final
+
+from .model import GiosStation
+
+EARTH_RADIUS: Final[float] = 6371.0088
+
+
+class StationCatalog(Mapping[int, GiosStation]):
+    """Columnar catalog of measurement stations.
+
+    Station IDs and coordinates are kept in typed arrays and names are
+    interned. GiosStation objects are created only on access.
+    """
+
+    __slots__ = ("_ids", "_latitudes", "_longitudes", "_names", "_positions")
+
+    def __init__(self, stations: Iterable[GiosStation] = ()) -> None:
+        """Initialize."""
+        self._ids: array[int] = array("q")
+        self._latitudes: array[float] = array("d")
+        self._longitudes: array[float] = array("d")
+        self._names: list[str] = []
+        self._positions: dict[int, int] = {}
+        for station in stations:
+            self.add(station.id, station.name, station.latitude, station.longitude)
+
+    def add(
+        self, station_id: int, name: str, latitude: float, longitude: float
+    ) -> None:
+        """Add a station to the catalog or replace the existing one."""
+        if (position := self._positions.get(station_id)) is not None:
+            self._names[position] = sys.intern(name)
+            self._latitudes[position] = latitude
+            self._longitudes[position] = longitude
+            return
+
+        self._positions[station_id] = len(self._ids)
+        self._ids.append(station_id)
+        self._names.append(sys.intern(name))
+        self._latitudes.append(latitude)
+        self._longitudes.append(longitude)
+
+    def __getitem__(self, station_id: int) -> GiosStation:
+        """Return the station with the ID."""
+        position = self._positions[station_id]
+        return GiosStation(
+            station_id,
+            self._names[position],
+            self._latitudes[position],
+            self._longitudes[position],
+        )
+
+    def __contains__(self, station_id: object) -> bool:
+        """Return True if the station is in the catalog."""
+        return station_id in self._positions
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over station IDs."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Return the number of stations."""
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        """Return the representation of the catalog."""
+        return f"{type(self).__name__}({len(self)} stations)"
+
+    @property
+    def ids(self) -> array[int]:
+        """Return station IDs column."""
+        return self._ids
+
+    @property
+    def latitudes(self) -> array[float]:
+        """Return station latitudes column."""
+        return self._latitudes
+
+    @property
+    def longitudes(self) -> array[float]:
+        """Return station longitudes column."""
+        return self._longitudes
+
+    @property
+    def names(self) -> list[str]:
+        """Return station names column."""
+        return self._names
+
+    def within(self, south: float, west: float, north: float, east: float) -> list[int]:
+        """Return IDs of stations within the bounding box."""
+        return [
+            station_id
+            for station_id, latitude, longitude in zip(
+                self._ids, self._latitudes, self._longitudes, strict=True
+            )
+            if south <= latitude <= north and west <= longitude <= east
+        ]
+
+    def name_startswith(self, prefix: str) -> list[int]:
+        """Return IDs of stations with the name starting with the prefix.
+
+        The comparison is case-insensitive.
+        """
+        prefix = prefix.casefold()
+        return [
+            station_id
+            for station_id, name in zip(self._ids, self._names, strict=True)
+            if name.casefold().startswith(prefix)
+        ]
+
+    def distances(self, latitude: float, longitude: float) -> array[float]:
+        """Return great-circle distances (km) from the point to all stations."""
+        phi = math.radians(latitude)
+        cos_phi = math.cos(phi)
+        lam = math.radians(longitude)
+        result: array[float] = array("d")
+        for station_lat, station_lon in zip(
+            self._latitudes, self._longitudes, strict=True
+        ):
+            station_phi = math.radians(station_lat)
+            half_chord = (
+                math.sin((station_phi - phi) / 2) ** 2
+                + cos_phi
+                * math.cos(station_phi)
+                * math.sin((math.radians(station_lon) - lam) / 2) ** 2
+            )
+            result.append(2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(half_chord))))
+        return result
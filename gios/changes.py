@@ -0,0 +1,97 @@
+"""Change feed of pollutant data between consecutive updates."""
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Final, cast
+
+from .client import Gios
+from .model import GiosSensors, Sensor
+
+# Names of compared sensor attributes (value, index, id) used in changes
+ATTRIBUTES: Final[tuple[str, ...]] = ("value", "index", "sensor_id")
+POLLUTANTS: Final[tuple[str, ...]] = tuple(item.name for item in fields(GiosSensors))
+
+SensorState = tuple[float | str | None, str | None, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class PollutantChange:
+    """Data class for changed pollutant data.
+
+    `changed` holds names of changed attributes, when a pollutant is no longer
+    reported all attributes are None.
+    """
+
+    station_id: int
+    pollutant: str
+    changed: tuple[str, ...]
+    value: float | str | None
+    index: str | None
+    sensor_id: int | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the change as a JSON serializable dictionary."""
+        result = asdict(self)
+        result["changed"] = list(self.changed)
+        return result
+
+
+def _state(sensor: Sensor | None) -> SensorState | None:
+    """Return compared attributes of the sensor."""
+    if sensor is None:
+        return None
+    return sensor.value, sensor.index, sensor.id
+
+
+class ChangeFeed:
+    """Pollutant changes between consecutive updates of measuring stations."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._states: dict[int, dict[str, SensorState]] = {}
+
+    def diff(self, station_id: int, sensors: GiosSensors) -> list[PollutantChange]:
+        """Return pollutants changed since the previous update of the station."""
+        previous = self._states.get(station_id, {})
+        current: dict[str, SensorState] = {}
+        changes: list[PollutantChange] = []
+
+        for pollutant in POLLUTANTS:
+            state = _state(getattr(sensors, pollutant))
+            if state is not None:
+                current[pollutant] = state
+            old = previous.get(pollutant)
+            if state == old:
+                continue
+            new = state or (None, None, None)
+            old = old or (None, None, None)
+            changes.append(
+                PollutantChange(
+                    station_id,
+                    pollutant,
+                    tuple(
+                        name
+                        for name, new_item, old_item in zip(
+                            ATTRIBUTES, new, old, strict=True
+                        )
+                        if new_item != old_item
+                    ),
+                    *new,
+                )
+            )
+
+        self._states[station_id] = current
+        return changes
+
+    async def async_update(
+        self, gios: Gios, local_indexes: bool = False
+    ) -> list[PollutantChange]:
+        """Update GIOS data of the station, return changed pollutants."""
+        sensors = await gios.async_update(local_indexes)
+        return self.diff(cast(int, gios.station_id), sensors)
+
+    def reset(self, station_id: int | None = None) -> None:
+        """Forget the state of the station or of all stations."""
+        if station_id is None:
+            self._states.clear()
+        else:
+            self._states.pop(station_id, None)
@@ -0,0 +1,765 @@
+"""GIOS API client."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Generator, Iterable, Mapping
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Final, Self, cast
+
+from aiohttp import ClientError, ClientSession
+from yarl import URL
+
+from .aqi import CATEGORIES, NO_INDEX, station_levels
+from .catalog import StationCatalog
+from .const import (
+    ARCHIVAL_DATE_FORMAT,
+    ARCHIVAL_PAGE_SIZE,
+    ATTR_AQI,
+    ATTR_ID,
+    ATTR_INDEX,
+    ATTR_NAME,
+    ATTR_VALUE,
+    DEFAULT_CONCURRENCY,
+    STATE_MAP,
+    STATIONS_PAGE_SIZE,
+    UPDATE_STAGE_WEIGHTS,
+    URL_API_BASE,
+    URL_ARCHIVAL,
+    URL_INDEXES,
+    URL_SENSOR,
+    URL_STATION,
+    URL_STATIONS,
+)
+from .coverage import DEFAULT_NEAREST, CoverageIndex
+from .exceptions import ApiError, GiosError, InvalidSensorsDataError, NoStationError
+from .metrics import active_metrics, endpoint_name
+from .model import GiosSensors, GiosStation, PartialUpdate
+from .normalize import index_level_key, pollutant_key
+from .retry import RetryPolicy
+from .sensor_index import SensorIndex, StationPollutant, station_pollutants
+from .tracing import CATEGORY_REQUEST, CATEGORY_UPDATE, span
+from .transport import SessionTransport, Transport, TransportResponse
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class Gios:
+    """Main class to perform GIOS API requests."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        station_id: int | None,
+        session: ClientSession,
+        transport: Transport | None = None,
+        *,
+        measurement_stations: Mapping[int, GiosStation] | None = None,
+        sensor_index: SensorIndex | None = None,
+        base_url: str = URL_API_BASE,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        """Initialize.
+
+        `base_url` replaces URL_API_BASE in requested URLs, for example to use a
+        gateway in front of the GIOS API. With `retry` failed requests are
+        retried according to the policy.
+        """
+        self.station_id = station_id
+        self.latitude: float | None = None
+        self.longitude: float | None = None
+        self.station_name: str | None = None
+        self._pollutants: dict[str, StationPollutant] = {}
+        self._measurement_stations = StationCatalog()
+        self._sensor_entries: dict[int, list[dict[str, Any]]] = {}
+        self._coverage: CoverageIndex | None = None
+
+        self.session = session
+        self.transport = transport or SessionTransport(session)
+        self.sensor_index = SensorIndex() if sensor_index is None else sensor_index
+        self.base_url = base_url.rstrip("/")
+        self.retry = retry
+
+        if measurement_stations is not None:
+            self._measurement_stations = (
+                measurement_stations
+                if isinstance(measurement_stations, StationCatalog)
+                else StationCatalog(measurement_stations.values())
+            )
+            if station_id is not None:
+                self._set_station(station_id)
+
+    @classmethod
+    async def create(  # noqa: PLR0913
+        cls: type[Self],
+        session: ClientSession,
+        station_id: int | None = None,
+        transport: Transport | None = None,
+        sensor_index: SensorIndex | None = None,
+        *,
+        base_url: str = URL_API_BASE,
+        retry: RetryPolicy | None = None,
+    ) -> Self:
+        """Create a new instance."""
+        instance = cls(
+            station_id,
+            session,
+            transport,
+            sensor_index=sensor_index,
+            base_url=base_url,
+            retry=retry,
+        )
+
+        await instance.initialize()
+
+        return instance
+
+    async def initialize(self) -> None:
+        """Initialize."""
+        msg = "Initializing GIOS"
+        if self.station_id:
+            msg += f" for station ID: {self.station_id}"
+        _LOGGER.debug(msg)
+
+        stations = await self._get_stations()
+        self._measurement_stations = StationCatalog(self._parse_stations(stations))
+
+        if self.station_id is None:
+            return
+
+        self._set_station(self.station_id)
+
+    def for_station(self, station_id: int) -> Self:
+        """Return a new instance for the station sharing the stations catalog."""
+        return type(self)(
+            station_id,
+            self.session,
+            self.transport,
+            measurement_stations=self._measurement_stations,
+            sensor_index=self.sensor_index,
+            base_url=self.base_url,
+            retry=self.retry,
+        )
+
+    async def async_prefetch_sensors(
+        self,
+        station_ids: Iterable[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_age: float | None = None,
+    ) -> int:
+        """Load sensors of many stations into the sensor index.
+
+        Stations already known and not older than `max_age` are skipped. Return
+        the number of stations fetched.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        pending = [
+            station_id
+            for station_id in (
+                self._measurement_stations if station_ids is None else station_ids
+            )
+            if not self.sensor_index.is_fresh(station_id, max_age)
+        ]
+
+        async def prefetch(station_id: int) -> bool:
+            async with semaphore:
+                try:
+                    data = await self._fetch_station(station_id)
+                except (ApiError, ClientError, TimeoutError) as error:
+                    _LOGGER.info(
+                        "Sensors of station %s not fetched: %s", station_id, error
+                    )
+                    return False
+            if not data:
+                return False
+            self.sensor_index.set_station_data(station_id, data)
+            return True
+
+        results = await asyncio.gather(
+            *(prefetch(station_id) for station_id in pending)
+        )
+        _LOGGER.debug("Prefetched sensors of %s stations", sum(results))
+        return sum(results)
+
+    async def async_iter_updates(
+        self,
+        station_ids: Iterable[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        local_indexes: bool = False,
+    ) -> AsyncGenerator[tuple[int, GiosSensors | Exception]]:
+        """Update many stations, yield results as soon as stations are updated.
+
+        At most `concurrency` stations are being updated or waiting for the
+        consumer at once, so a slow consumer pauses the updates. Errors of
+        station updates are yielded instead of raised.
+        """
+        pending = iter(
+            self._measurement_stations if station_ids is None else station_ids
+        )
+        capacity = asyncio.Semaphore(concurrency)
+        results: asyncio.Queue[tuple[int, GiosSensors | Exception] | None] = (
+            asyncio.Queue()
+        )
+
+        async def worker() -> None:
+            try:
+                while True:
+                    # Take the next station only when it can be updated, so its
+                    # update starts when it's taken from station_ids
+                    await capacity.acquire()
+                    if (station_id := next(pending, None)) is None:
+                        capacity.release()
+                        break
+                    try:
+                        result: GiosSensors | Exception = await self.for_station(
+                            station_id
+                        ).async_update(local_indexes)
+                    except (GiosError, ClientError, TimeoutError) as error:
+                        result = error
+                    results.put_nowait((station_id, result))
+            finally:
+                results.put_nowait(None)
+
+        with span("fleet", CATEGORY_UPDATE, concurrency=concurrency):
+            workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+            try:
+                running = len(workers)
+                while running:
+                    if (item := await results.get()) is None:
+                        running -= 1
+                        continue
+                    yield item
+                    capacity.release()
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    def _set_station(self, station_id: int) -> None:
+        """Set measuring station details from the stations catalog."""
+        if (station := self.measurement_stations.get(station_id)) is None:
+            msg = f"{station_id} is not a valid measuring station ID"
+            raise NoStationError(msg)
+
+        self.latitude = station.latitude
+        self.longitude = station.longitude
+        self.station_name = station.name
+
+    @property
+    def measurement_stations(self) -> StationCatalog:
+        """Return measurement stations catalog."""
+        return self._measurement_stations
+
+    @property
+    def coverage(self) -> CoverageIndex:
+        """Return index of measurement stations by measured pollutant."""
+        if self._coverage is None or self._coverage.stations is not (
+            self._measurement_stations
+        ):
+            self._coverage = CoverageIndex(
+                self._measurement_stations, self.sensor_index
+            )
+        return self._coverage
+
+    async def async_find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        pollutant: str,
+        count: int = DEFAULT_NEAREST,
+        max_age: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """Return nearest stations measuring the pollutant with distances in km.
+
+        Sensors of stations missing in the sensor index or older than `max_age`
+        are fetched first.
+        """
+        await self.async_prefetch_sensors(max_age=max_age)
+        return self.coverage.nearest(latitude, longitude, pollutant, count)
+
+    @property
+    def sensor_entries(self) -> dict[int, list[dict[str, Any]]]:
+        """Return raw measurement entries fetched in the last update by sensor ID."""
+        return self._sensor_entries
+
+    async def async_update(self, local_indexes: bool = False) -> GiosSensors:
+        """Update GIOS data.
+
+        With `local_indexes` index categories are computed from the pollutant
+        values instead of being requested from the GIOS API.
+        """
+        if self.station_id is None:
+            msg = "Measuring station ID is not set"
+            raise NoStationError(msg)
+
+        metrics = active_metrics()
+        started = time.perf_counter()
+        with span("async_update", CATEGORY_UPDATE, station_id=self.station_id):
+            try:
+                result = await self._update(local_indexes)
+            except (GiosError, ClientError, TimeoutError):
+                if metrics is not None:
+                    metrics.updates.inc("error")
+                raise
+        if metrics is not None:
+            metrics.updates.inc("ok")
+            metrics.update_duration.observe(time.perf_counter() - started)
+        return result
+
+    async def _update(self, local_indexes: bool) -> GiosSensors:
+        """Update GIOS data of the station."""
+        if not self._pollutants:
+            with span("station"):
+                self._pollutants = await self._get_station()
+
+        if not self._pollutants:
+            msg = "Invalid measuring station data from GIOS API"
+            raise InvalidSensorsDataError(msg)
+
+        data = self._pollutants_data()
+        sensor_ids = self._sensor_ids()
+        with span("sensors", sensors=len(sensor_ids)):
+            results = await asyncio.gather(
+                *(self._get_sensor(sensor_id) for sensor_id in sensor_ids)
+            )
+        with span("values"):
+            sensors = self._select_sensors(
+                data, dict(zip(sensor_ids, results, strict=True))
+            )
+            self._apply_values(data, sensors)
+
+        if not data:
+            msg = "Invalid sensor data from GIOS API"
+            raise InvalidSensorsDataError(msg)
+
+        with span("indexes", local=local_indexes):
+            if local_indexes:
+                self._apply_local_indexes(data)
+            else:
+                self._apply_indexes(data, await self._get_indexes())
+
+        with span("build"):
+            return self._build_sensors(data)
+
+    async def async_update_partial(
+        self, budget: float, local_indexes: bool = False
+    ) -> PartialUpdate:
+        """Update GIOS data within the time budget in seconds.
+
+        The budget is split across the station, sensors and indexes stages, time
+        not used by a stage is passed on to the next ones. When a stage fails or
+        runs out of time, the update returns what is available with errors by
+        stage or pollutant field instead of raising.
+        """
+        if self.station_id is None:
+            msg = "Measuring station ID is not set"
+            raise NoStationError(msg)
+
+        with span(
+            "async_update_partial",
+            CATEGORY_UPDATE,
+            station_id=self.station_id,
+            budget=budget,
+        ):
+            return await self._update_partial(budget, local_indexes)
+
+    async def _update_partial(
+        self, budget: float, local_indexes: bool
+    ) -> PartialUpdate:
+        """Update GIOS data of the station within the time budget."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        stages = [
+            stage
+            for stage in UPDATE_STAGE_WEIGHTS
+            if stage != "indexes" or not local_indexes
+        ]
+
+        def stage_timeout(stage: str) -> float:
+            """Return the share of the remaining budget for the stage."""
+            weights = [UPDATE_STAGE_WEIGHTS[name] for name in stages]
+            share = UPDATE_STAGE_WEIGHTS[stage] / sum(weights)
+            stages.remove(stage)
+            return max(deadline - loop.time(), 0) * share
+
+        errors: dict[str, str] = {}
+
+        if not self._pollutants:
+            timeout = stage_timeout("station")
+            with span("station", timeout=timeout) as details:
+                try:
+                    async with asyncio.timeout(timeout):
+                        self._pollutants = await self._get_station()
+                except (ApiError, ClientError, TimeoutError) as error:
+                    errors["station"] = details["error"] = _error_message(error)
+        else:
+            stages.remove("station")
+
+        if not self._pollutants:
+            errors.setdefault("station", "Invalid measuring station data")
+            return PartialUpdate(None, {}, errors)
+
+        data = self._pollutants_data()
+        sensor_ids = self._sensor_ids()
+        timeout = stage_timeout("sensors")
+        with span("sensors", sensors=len(sensor_ids), timeout=timeout) as details:
+            results, sensor_errors = await self._fetch_sensors(sensor_ids, timeout)
+            details["errors"] = len(sensor_errors)
+        with span("values"):
+            sensors = self._select_sensors(data, results)
+            for pollutant in data:
+                if not sensors[pollutant] and (
+                    failed := [
+                        sensor_errors[sensor_id]
+                        for sensor_id in self._pollutants[pollutant].sensor_ids
+                        if sensor_id in sensor_errors
+                    ]
+                ):
+                    errors[pollutant_key(pollutant)] = failed[0]
+            measured = self._apply_values(data, sensors)
+
+        if not data:
+            errors.setdefault("sensors", "Invalid sensor data")
+            return PartialUpdate(None, {}, errors)
+
+        if local_indexes:
+            with span("indexes", local=True):
+                self._apply_local_indexes(data)
+        else:
+            timeout = stage_timeout("indexes")
+            with span("indexes", local=False, timeout=timeout) as details:
+                try:
+                    async with asyncio.timeout(timeout):
+                        indexes = await self._get_indexes()
+                except (ApiError, ClientError, TimeoutError) as error:
+                    errors["indexes"] = details["error"] = _error_message(error)
+                else:
+                    self._apply_indexes(data, indexes)
+
+        with span("build"):
+            return PartialUpdate(
+                self._build_sensors(data),
+                {
+                    pollutant_key(pollutant): time
+                    for pollutant, time in measured.items()
+                },
+                errors,
+            )
+
+    def _pollutants_data(self) -> dict[str, dict[str, Any]]:
+        """Return pollutants data to fill in the update."""
+        return {
+            key: {ATTR_NAME: pollutant.name}
+            for key, pollutant in self._pollutants.items()
+        }
+
+    def _apply_values(
+        self, data: dict[str, dict[str, Any]], sensors: dict[str, Any]
+    ) -> dict[str, str | None]:
+        """Add sensor values to pollutants data, drop pollutants without a value.
+
+        Return measurement timestamps of the values by pollutant.
+        """
+        measured: dict[str, str | None] = {}
+        invalid_sensors: list[str] = []
+
+        # The GIOS server sends null values for sensors several minutes before
+        # adding new data from measuring station. If the newest value is null
+        # we take the earlier value.
+        for pollutant, pollutant_data in data.items():
+            try:
+                sensor_entry = sensors[pollutant]["Lista danych pomiarowych"]
+                entry = sensor_entry[0]
+                if entry["Wartość"] is None:
+                    entry = sensor_entry[1]
+                if entry["Wartość"] is not None:
+                    pollutant_data[ATTR_VALUE] = entry["Wartość"]
+                    measured[pollutant] = entry.get("Data")
+                else:
+                    invalid_sensors.append(pollutant)
+            except (IndexError, KeyError, TypeError):
+                invalid_sensors.append(pollutant)
+
+        for pollutant in invalid_sensors:
+            data.pop(pollutant)
+
+        if invalid_sensors and (metrics := active_metrics()) is not None:
+            metrics.invalid_sensors.inc(amount=len(invalid_sensors))
+
+        return measured
+
+    def _build_sensors(self, data: dict[str, Any]) -> GiosSensors:
+        """Build the sensors model from pollutants data."""
+        if data.get("pm2.5"):
+            data["pm25"] = data.pop("pm2.5")
+
+        # dacite is only needed to build the final model, import it lazily to keep
+        # the package import cheap
+        from dacite import from_dict  # noqa: PLC0415
+
+        result: GiosSensors = from_dict(data_class=GiosSensors, data=data)
+        return result
+
+    def _apply_indexes(self, data: dict[str, Any], indexes: dict[str, Any]) -> None:
+        """Add index categories from the GIOS API to pollutants data."""
+        for pollutant, pollutant_data in data.items():
+            if index_value := indexes.get("AqIndex", {}).get(
+                index_level_key(pollutant)
+            ):
+                pollutant_data[ATTR_INDEX] = STATE_MAP[index_value]
+
+        if (aq_index := indexes.get("AqIndex", {})).get(
+            "Status indeksu ogólnego dla stacji pomiarowej"
+        ) and (index_value := aq_index.get("Nazwa kategorii indeksu")):
+            data[ATTR_AQI.lower()] = {
+                ATTR_NAME: ATTR_AQI,
+                ATTR_VALUE: STATE_MAP[index_value],
+            }
+
+    def _apply_local_indexes(self, data: dict[str, Any]) -> None:
+        """Add index categories computed from pollutant values to pollutants data."""
+        keys = {pollutant_key(pollutant): pollutant for pollutant in data}
+        levels, aqi = station_levels(
+            {key: [data[pollutant][ATTR_VALUE]] for key, pollutant in keys.items()}
+        )
+
+        for key, series in levels.items():
+            if series[0] != NO_INDEX:
+                data[keys[key]][ATTR_INDEX] = CATEGORIES[series[0]]
+
+        if aqi and aqi[0] != NO_INDEX:
+            data[ATTR_AQI.lower()] = {
+                ATTR_NAME: ATTR_AQI,
+                ATTR_VALUE: CATEGORIES[aqi[0]],
+            }
+
+    async def _get_stations(self) -> Any:
+        """Retrieve list of measurement stations."""
+        first = await self._async_get(
+            self._url(URL_STATIONS).with_query(page=0, size=STATIONS_PAGE_SIZE)
+        )
+        # Responses may be shared by a caching transport, don't modify them
+        stations: list[Any] = list(first.get("Lista stacji pomiarowych", []))
+        total_pages: int = int(first.get("totalPages", 1) or 1)
+
+        for page in range(1, total_pages):
+            result = await self._async_get(
+                self._url(URL_STATIONS).with_query(page=page, size=STATIONS_PAGE_SIZE)
+            )
+            stations.extend(result.get("Lista stacji pomiarowych", []))
+
+        return stations
+
+    def _parse_stations(self, stations: list[dict[str, Any]]) -> Generator[GiosStation]:
+        """Parse stations data."""
+        for station in stations:
+            yield GiosStation(
+                cast(int, station["Identyfikator stacji"]),
+                station["Nazwa stacji"],
+                float(station["WGS84 φ N"]),
+                float(station["WGS84 λ E"]),
+            )
+
+    async def _get_station(self) -> dict[str, StationPollutant]:
+        """Retrieve measuring station pollutants, use the sensor index if fresh."""
+        station_id = cast(int, self.station_id)
+        if not self.sensor_index.is_fresh(station_id):
+            if not (data := await self._fetch_station(station_id)):
+                return {}
+            self.sensor_index.set_station_data(station_id, data)
+        return station_pollutants(self.sensor_index[station_id])
+
+    async def _fetch_station(self, station_id: int) -> Any:
+        """Retrieve measuring station data from GIOS API."""
+        url = self._url(URL_STATION) / str(station_id)
+        result = await self._async_get(url)
+        return result.get("Lista stanowisk pomiarowych dla podanej stacji", [])
+
+    def _sensor_ids(self) -> list[int]:
+        """Return unique sensor IDs of the station pollutants."""
+        return list(
+            dict.fromkeys(
+                sensor_id
+                for pollutant in self._pollutants.values()
+                for sensor_id in pollutant.sensor_ids
+            )
+        )
+
+    async def _fetch_sensors(
+        self, sensor_ids: list[int], budget: float | None = None
+    ) -> tuple[dict[int, Any], dict[int, str]]:
+        """Retrieve sensors data within the time budget, return results and errors."""
+        tasks = {
+            sensor_id: asyncio.ensure_future(self._get_sensor(sensor_id))
+            for sensor_id in sensor_ids
+        }
+        if not tasks:
+            return {}, {}
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=budget)
+        for task in pending:
+            task.cancel()
+
+        results: dict[int, Any] = {}
+        errors: dict[int, str] = {}
+        for sensor_id, task in tasks.items():
+            if task in pending:
+                errors[sensor_id] = "Timeout"
+            elif (error := task.exception()) is not None:
+                errors[sensor_id] = _error_message(error)
+            else:
+                results[sensor_id] = task.result()
+        return results, errors
+
+    def _select_sensors(
+        self, pollutants: dict[str, Any], id_to_result: dict[int, Any]
+    ) -> dict[str, Any]:
+        """Select sensors with data for pollutants, record their entries."""
+        self._sensor_entries = {
+            sensor_id: sensor_result["Lista danych pomiarowych"]
+            for sensor_id, sensor_result in id_to_result.items()
+            if isinstance(sensor_result, dict)
+            and isinstance(sensor_result.get("Lista danych pomiarowych"), list)
+        }
+
+        result: dict[str, Any] = {}
+        for pollutant, pollutant_data in pollutants.items():
+            for sensor_id in self._pollutants[pollutant].sensor_ids:
+                sensor_result = id_to_result.get(sensor_id)
+                if not isinstance(sensor_result, dict):
+                    continue
+                if "Lista danych pomiarowych" not in sensor_result:
+                    continue
+                values = [
+                    entry.get("Wartość")
+                    for entry in sensor_result["Lista danych pomiarowych"]
+                ]
+                if not any(v is not None for v in values):
+                    continue
+                result[pollutant] = sensor_result
+                pollutant_data[ATTR_ID] = sensor_id
+                break
+            if pollutant not in result:
+                result[pollutant] = {}
+
+        return result
+
+    async def _get_sensor(self, sensor: int) -> Any:
+        """Retrieve sensor data."""
+        url = self._url(URL_SENSOR) / str(sensor)
+        result = await self._async_get(url, do_not_raise=True)
+
+        if isinstance(result, dict) and "error_code" in result:
+            _LOGGER.debug(
+                "No data for sensor %s: %s", sensor, result.get("error_result")
+            )
+            return {}
+
+        return result
+
+    async def _get_indexes(self) -> Any:
+        """Retrieve indexes data."""
+        url = self._url(URL_INDEXES) / str(self.station_id)
+        return await self._async_get(url)
+
+    async def async_get_archival_data(
+        self,
+        sensor_id: int,
+        date_from: datetime,
+        date_to: datetime,
+        page: int = 0,
+        size: int = ARCHIVAL_PAGE_SIZE,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Retrieve a page of sensor archival data, return entries and pages count."""
+        url = (self._url(URL_ARCHIVAL) / str(sensor_id)).with_query(
+            dateFrom=date_from.strftime(ARCHIVAL_DATE_FORMAT),
+            dateTo=date_to.strftime(ARCHIVAL_DATE_FORMAT),
+            page=page,
+            size=size,
+        )
+        result = await self._async_get(url)
+        return (
+            result.get("Lista archiwalnych wyników pomiarów", []),
+            int(result.get("totalPages", 1) or 1),
+        )
+
+    def _url(self, url: str) -> URL:
+        """Return the URL of the endpoint with the configured base URL."""
+        return URL(self.base_url + url.removeprefix(URL_API_BASE))
+
+    async def _async_get(self, url: URL, do_not_raise: bool = False) -> Any:
+        """Retrieve data from GIOS API, retry failed requests if configured."""
+        retry = self.retry
+        if retry is not None:
+            retry.budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                resp = await self._request(url)
+            except (ClientError, TimeoutError) as error:
+                if retry is None or not retry.allow(attempt):
+                    raise
+                delay = retry.delay(attempt)
+                reason = repr(error)
+            else:
+                if (
+                    resp.status == HTTPStatus.OK.value
+                    or retry is None
+                    or not retry.retryable(resp.status)
+                    or not retry.allow(attempt)
+                ):
+                    break
+                delay = retry.delay(attempt, resp.headers.get("Retry-After"))
+                reason = str(resp.status)
+
+            attempt += 1
+            _LOGGER.debug(
+                "Retrying %s in %.2f s after %s (attempt %s)",
+                url,
+                delay,
+                reason,
+                attempt + 1,
+            )
+            if (metrics := active_metrics()) is not None:
+                metrics.retries.inc(endpoint_name(url))
+            await asyncio.sleep(delay)
+
+        _LOGGER.debug("Data retrieved from %s, status: %s", url, resp.status)
+        if resp.status != HTTPStatus.OK.value:
+            msg = f"Invalid response from GIOS API: {resp.status}"
+
+            if do_not_raise:
+                _LOGGER.info(msg)
+                return {}
+
+            _LOGGER.warning(msg)
+            raise ApiError(str(resp.status))
+
+        return resp.data
+
+    async def _request(self, url: URL) -> TransportResponse:
+        """Perform one request with the transport."""
+        metrics = active_metrics()
+        started = time.perf_counter()
+        with span("GET", CATEGORY_REQUEST, url=str(url)) as details:
+            try:
+                resp = await self.transport.get(url)
+            except (ClientError, TimeoutError) as error:
+                if metrics is not None:
+                    metrics.requests.inc(endpoint_name(url), type(error).__name__)
+                raise
+            details["status"] = resp.status
+        if metrics is not None:
+            endpoint = endpoint_name(url)
+            metrics.requests.inc(endpoint, str(resp.status))
+            metrics.request_duration.observe(time.perf_counter() - started, endpoint)
+        return resp
+
+
+def _error_message(error: BaseException) -> str:
+    """Return the error description for partial update results."""
+    if isinstance(error, TimeoutError):
+        return "Timeout"
+    return str(error) or type(error).__name__
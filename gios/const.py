@@ -2,8 +2,6 @@
 
 from typing import Final
 
-from yarl import URL
-
 ATTR_AQI: Final[str] = "AQI"
 ATTR_ID: Final[str] = "id"
 ATTR_IDS: Final[str] = "ids"
@@ -12,13 +10,29 @@ ATTR_INDEX_LEVEL: Final[str] = "Nazwa kategorii indeksu dla wskażnika {}"
 ATTR_NAME: Final[str] = "name"
 ATTR_VALUE: Final[str] = "value"
 
-URL_API_BASE: Final[URL] = URL("https://api.gios.gov.pl/pjp-api/v1/rest")
+URL_API_BASE: Final[str] = "https://api.gios.gov.pl/pjp-api/v1/rest"
 
-URL_INDEXES: Final[URL] = URL_API_BASE / "aqindex" / "getIndex"
-URL_SENSOR: Final[URL] = URL_API_BASE / "data" / "getData"
-URL_STATION: Final[URL] = URL_API_BASE / "station" / "sensors"
-URL_STATIONS: Final[URL] = URL_API_BASE / "station" / "findAll"
+URL_INDEXES: Final[str] = f"{URL_API_BASE}/aqindex/getIndex"
+URL_SENSOR: Final[str] = f"{URL_API_BASE}/data/getData"
+URL_STATION: Final[str] = f"{URL_API_BASE}/station/sensors"
+URL_STATIONS: Final[str] = f"{URL_API_BASE}/station/findAll"
+URL_ARCHIVAL: Final[str] = f"{URL_API_BASE}/archivalData/getDataBySensor"
 STATIONS_PAGE_SIZE: Final[int] = 500
+DEFAULT_CONCURRENCY: Final[int] = 10
+ARCHIVAL_PAGE_SIZE: Final[int] = 500
+ARCHIVAL_DATE_FORMAT: Final[str] = "%Y-%m-%d %H:%M"
+# Shares of the partial update time budget by stage
+UPDATE_STAGE_WEIGHTS: Final[dict[str, float]] = {
+    "station": 1,
+    "sensors": 2,
+    "indexes": 1,
+}
+
+GATEWAY_HOST: Final[str] = "127.0.0.1"
+GATEWAY_PORT: Final[int] = 8080
+
+# Timestamps in GIOS API responses are in local time
+TIMEZONE: Final[str] = "Europe/Warsaw"
 
 
 POLLUTANT_MAP = {
@@ -0,0 +1,79 @@
+"""Index of measuring stations by measured pollutant."""
+
+import heapq
+from array import array
+from typing import Final
+
+from .catalog import StationCatalog
+from .const import POLLUTANT_MAP
+from .normalize import pollutant_key
+from .sensor_index import SensorIndex
+
+DEFAULT_NEAREST: Final[int] = 1
+
+
+class CoverageIndex:
+    """Inverted index from pollutant to stations measuring it.
+
+    Pollutants can be given as POLLUTANT_MAP keys (for example "benzen") or as
+    GiosSensors field names (for example "c6h6"). The index is rebuilt when the
+    sensor index or the stations catalog change.
+    """
+
+    def __init__(self, stations: StationCatalog, sensor_index: SensorIndex) -> None:
+        """Initialize."""
+        self.stations = stations
+        self.sensor_index = sensor_index
+        self._positions: dict[str, array[int]] = {}
+        self._state: tuple[int, int] | None = None
+
+    def _refresh(self) -> None:
+        """Rebuild the index if the sources changed."""
+        state = (self.sensor_index.version, len(self.stations))
+        if state == self._state:
+            return
+
+        catalog_positions = {
+            station_id: position for position, station_id in enumerate(self.stations)
+        }
+        positions: dict[str, array[int]] = {}
+        for station_id, sensors in self.sensor_index.items():
+            if (position := catalog_positions.get(station_id)) is None:
+                continue
+            for key in {
+                key
+                for sensor in sensors
+                if sensor.indicator in POLLUTANT_MAP
+                for key in (sensor.indicator, pollutant_key(sensor.formula))
+            }:
+                positions.setdefault(key, array("q")).append(position)
+
+        self._positions = positions
+        self._state = state
+
+    def stations_measuring(self, pollutant: str) -> list[int]:
+        """Return IDs of stations measuring the pollutant."""
+        self._refresh()
+        ids = self.stations.ids
+        return [ids[position] for position in self._positions.get(pollutant, ())]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        pollutant: str,
+        count: int = DEFAULT_NEAREST,
+    ) -> list[tuple[int, float]]:
+        """Return nearest stations measuring the pollutant with distances in km."""
+        self._refresh()
+        if not (candidates := self._positions.get(pollutant)):
+            return []
+
+        distances = self.stations.distances(latitude, longitude)
+        ids = self.stations.ids
+        return [
+            (ids[position], distances[position])
+            for position in heapq.nsmallest(
+                count, candidates, key=distances.__getitem__
+            )
+        ]
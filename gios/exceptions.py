@@ -20,3 +20,7 @@ class InvalidSensorsDataError(GiosError):
 
 class NoStationError(GiosError):
     """Raised when no measuring station error."""
+
+
+class CircuitOpenError(GiosError):
+    """Raised when requests are stopped by an open circuit breaker."""
@@ -0,0 +1,127 @@
+"""Columnar export of GIOS fleet snapshots."""
+
+import csv
+from collections.abc import Iterable, Iterator
+from dataclasses import fields
+from datetime import UTC, datetime
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Final, Literal
+
+from .model import GiosSensors, GiosStation, Sensor
+
+ExportFormat = Literal["arrow", "csv", "parquet"]
+
+COLUMNS: Final[tuple[str, ...]] = (
+    "station_id",
+    "station_name",
+    "latitude",
+    "longitude",
+    "pollutant",
+    "value",
+    "index",
+    "timestamp",
+)
+POLLUTANTS: Final[tuple[str, ...]] = tuple(field.name for field in fields(GiosSensors))
+BATCH_SIZE: Final[int] = 65536
+
+Row = tuple[int, str, float, float, str, Any, Any, datetime]
+
+
+def export_snapshots(
+    snapshots: Iterable[tuple[GiosStation, GiosSensors]],
+    path: str | Path,
+    timestamp: datetime | None = None,
+    fmt: ExportFormat | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> ExportFormat:
+    """Write station snapshots to a columnar file and return the used format.
+
+    Parquet is used by default when pyarrow is installed, CSV otherwise.
+    """
+    if fmt is None:
+        fmt = "parquet" if find_spec("pyarrow") is not None else "csv"
+    if timestamp is None:
+        timestamp = datetime.now(tz=UTC)
+
+    rows = iter_rows(snapshots, timestamp)
+    if fmt == "csv":
+        _write_csv(rows, Path(path))
+    else:
+        _write_arrow(rows, Path(path), fmt, batch_size)
+
+    return fmt
+
+
+def iter_rows(
+    snapshots: Iterable[tuple[GiosStation, GiosSensors]], timestamp: datetime
+) -> Iterator[Row]:
+    """Flatten station snapshots into one row per measured pollutant."""
+    for station, sensors in snapshots:
+        for pollutant in POLLUTANTS:
+            sensor: Sensor | None = getattr(sensors, pollutant)
+            if sensor is None:
+                continue
+            # The overall AQI carries its category as the value
+            value, index = (
+                (None, sensor.value)
+                if pollutant == "aqi"
+                else (sensor.value, sensor.index)
+            )
+            yield (
+                station.id,
+                station.name,
+                station.latitude,
+                station.longitude,
+                pollutant,
+                value,
+                index,
+                timestamp,
+            )
+
+
+def _write_csv(rows: Iterable[Row], path: Path) -> None:
+    """Stream rows to a CSV file."""
+    with path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for row in rows:
+            writer.writerow((*row[:-1], row[-1].isoformat()))
+
+
+def _write_arrow(
+    rows: Iterable[Row], path: Path, fmt: ExportFormat, batch_size: int
+) -> None:
+    """Write rows to an Arrow IPC or Parquet file in record batches."""
+    import pyarrow as pa  # noqa: PLC0415  # ty: ignore[unresolved-import]
+
+    schema = pa.schema(
+        [
+            ("station_id", pa.int64()),
+            ("station_name", pa.string()),
+            ("latitude", pa.float64()),
+            ("longitude", pa.float64()),
+            ("pollutant", pa.string()),
+            ("value", pa.float64()),
+            ("index", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq  # noqa: PLC0415  # ty: ignore[unresolved-import]
+
+        writer: Any = pq.ParquetWriter(path, schema)
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    with writer:
+        columns: list[list[Any]] = [[] for _ in COLUMNS]
+        for row in rows:
+            for column, item in zip(columns, row, strict=True):
+                column.append(item)
+            if len(columns[0]) >= batch_size:
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                columns = [[] for _ in COLUMNS]
+        if columns[0]:
+            writer.write_batch(pa.record_batch(columns, schema=schema))
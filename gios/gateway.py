@@ -0,0 +1,174 @@
+"""Caching gateway server in front of the GIOS API."""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict
+from http import HTTPStatus
+from typing import Final
+
+from aiohttp import ClientError, ClientSession, web
+from yarl import URL
+
+from .client import Gios
+from .const import (
+    GATEWAY_HOST,
+    GATEWAY_PORT,
+    URL_API_BASE,
+    URL_INDEXES,
+    URL_SENSOR,
+    URL_STATION,
+    URL_STATIONS,
+)
+from .exceptions import GiosError, NoStationError
+from .metrics import CONTENT_TYPE, active_metrics
+from .ratelimit import RateLimiter
+from .transport import CachingTransport, SessionTransport, Transport
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_RATE: Final[float] = 5.0
+DEFAULT_BURST: Final[int] = 10
+# Cache TTLs in seconds by endpoint, the stations and their sensors rarely change
+GATEWAY_TTLS: Final[dict[str, float]] = {
+    URL_STATIONS: 24 * 3600,
+    URL_STATION: 24 * 3600,
+    URL_SENSOR: 300,
+    URL_INDEXES: 300,
+}
+API_PATH: Final[str] = URL(URL_API_BASE).path
+SNAPSHOT_PATH: Final[str] = "/snapshot"
+METRICS_PATH: Final[str] = "/metrics"
+
+
+class Gateway:
+    """Local server exposing GIOS API endpoints with a shared cache.
+
+    Requests for the same URL are served from the cache or share one upstream
+    request, upstream requests are rate limited. Besides the GIOS API endpoints
+    the gateway serves compact station snapshots at /snapshot/<station ID> and
+    library metrics at /metrics when they are enabled.
+    Point Gios at the gateway with `base_url=f"http://{host}:{port}{API_PATH}"`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session: ClientSession,
+        *,
+        transport: Transport | None = None,
+        upstream: str = URL_API_BASE,
+        ttls: dict[str, float] = GATEWAY_TTLS,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+    ) -> None:
+        """Initialize."""
+        self.session = session
+        self.upstream = upstream.rstrip("/")
+        self.transport = CachingTransport(
+            transport or SessionTransport(session),
+            {
+                self.upstream + url.removeprefix(URL_API_BASE): ttl
+                for url, ttl in ttls.items()
+            },
+            limiter=RateLimiter(rate, burst),
+        )
+        self._gios: Gios | None = None
+        self._catalog_expires = 0.0
+        self._catalog_lock = asyncio.Lock()
+
+        self.app = web.Application()
+        for url in (URL_STATION, URL_SENSOR, URL_INDEXES):
+            self.app.router.add_get(URL(url).path + r"/{id:\d+}", self._proxy)
+        self.app.router.add_get(URL(URL_STATIONS).path, self._proxy)
+        self.app.router.add_get(SNAPSHOT_PATH + r"/{station_id:\d+}", self._snapshot)
+        self.app.router.add_get(METRICS_PATH, self._metrics)
+
+    async def _proxy(self, request: web.Request) -> web.Response:
+        """Serve a GIOS API endpoint."""
+        url = URL(self.upstream + request.path.removeprefix(API_PATH)).with_query(
+            request.query
+        )
+        try:
+            response = await self.transport.get(url)
+        except (ClientError, TimeoutError) as error:
+            _LOGGER.warning("Request to %s failed: %s", url, error)
+            return web.json_response(
+                {"error": repr(error)}, status=HTTPStatus.BAD_GATEWAY.value
+            )
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() == "retry-after"
+        }
+        if response.data is None:
+            return web.Response(status=response.status, headers=headers)
+        return web.json_response(response.data, status=response.status, headers=headers)
+
+    async def _station_gios(self, station_id: int) -> Gios:
+        """Return Gios for the station, refresh the stations catalog if expired."""
+        async with self._catalog_lock:
+            if self._gios is None or time.monotonic() >= self._catalog_expires:
+                gios = Gios(None, self.session, self.transport, base_url=self.upstream)
+                await gios.initialize()
+                self._gios = gios
+                self._catalog_expires = time.monotonic() + self.transport.ttl(
+                    self.upstream + URL_STATIONS.removeprefix(URL_API_BASE)
+                )
+        return self._gios.for_station(station_id)
+
+    async def _snapshot(self, request: web.Request) -> web.Response:
+        """Serve the current readings of a station."""
+        try:
+            gios = await self._station_gios(int(request.match_info["station_id"]))
+        except NoStationError as error:
+            return web.json_response(
+                {"error": str(error)}, status=HTTPStatus.NOT_FOUND.value
+            )
+        except (GiosError, ClientError, TimeoutError) as error:
+            return web.json_response(
+                {"error": repr(error)}, status=HTTPStatus.BAD_GATEWAY.value
+            )
+
+        try:
+            sensors = await gios.async_update()
+        except (GiosError, ClientError, TimeoutError) as error:
+            return web.json_response(
+                {"error": repr(error)}, status=HTTPStatus.BAD_GATEWAY.value
+            )
+
+        return web.json_response(
+            {
+                "station_id": gios.station_id,
+                "name": gios.station_name,
+                "latitude": gios.latitude,
+                "longitude": gios.longitude,
+                "sensors": {
+                    name: sensor
+                    for name, sensor in asdict(sensors).items()
+                    if sensor is not None
+                },
+            }
+        )
+
+    async def _metrics(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        """Serve library metrics if they are enabled."""
+        if (metrics := active_metrics()) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND.value)
+        return web.Response(
+            body=metrics.registry.render().encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    async def async_serve(
+        self, host: str = GATEWAY_HOST, port: int = GATEWAY_PORT
+    ) -> None:
+        """Serve requests until cancelled."""
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+            _LOGGER.info("GIOS gateway listening on http://%s:%s", host, port)
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
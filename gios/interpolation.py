@@ -0,0 +1,157 @@
+"""Spatial interpolation of pollutant levels between measurement stations."""
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from .catalog import StationCatalog
+from .model import GiosSensors, GiosStation, Sensor
+
+DEFAULT_NEIGHBORS: Final[int] = 8
+DEFAULT_POWER: Final[float] = 2.0
+# Distance (km) below which the query point is treated as the station location
+SAME_LOCATION: Final[float] = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class NeighborWeights:
+    """Sparse (CSR) matrix of station weights for query points.
+
+    Row `i` holds weights of the nearest stations of the query point `i`,
+    columns are positions in `station_ids`. A station at the location of the
+    query point has an infinite weight.
+    """
+
+    station_ids: array[int]
+    indptr: array[int]
+    indices: array[int]
+    weights: array[float]
+
+    def __len__(self) -> int:
+        """Return the number of query points."""
+        return len(self.indptr) - 1
+
+
+class IdwEstimator:
+    """Inverse distance weighting estimator with a k-nearest cutoff."""
+
+    def __init__(
+        self,
+        stations: Mapping[int, GiosStation],
+        neighbors: int = DEFAULT_NEIGHBORS,
+        power: float = DEFAULT_POWER,
+        max_distance: float | None = None,
+    ) -> None:
+        """Initialize."""
+        self.stations = (
+            stations
+            if isinstance(stations, StationCatalog)
+            else StationCatalog(stations.values())
+        )
+        self.neighbors = neighbors
+        self.power = power
+        self.max_distance = max_distance
+
+    def weights(
+        self,
+        points: Sequence[tuple[float, float]],
+        station_ids: Iterable[int] | None = None,
+    ) -> NeighborWeights:
+        """Precompute neighbor weights for (latitude, longitude) query points.
+
+        Neighbors are chosen among `station_ids` if given, for example stations
+        measuring the pollutant from CoverageIndex.stations_measuring(), so
+        sparse pollutants get weights of the nearest stations measuring them.
+        """
+        if station_ids is None:
+            candidates: Sequence[int] = range(len(self.stations))
+        else:
+            catalog_positions = {
+                station_id: position
+                for position, station_id in enumerate(self.stations.ids)
+            }
+            candidates = [
+                catalog_positions[station_id]
+                for station_id in station_ids
+                if station_id in catalog_positions
+            ]
+        indptr: array[int] = array("q", [0])
+        indices: array[int] = array("q")
+        weights: array[float] = array("d")
+
+        for latitude, longitude in points:
+            distances = self.stations.distances(latitude, longitude)
+            nearest = heapq.nsmallest(
+                self.neighbors, candidates, key=distances.__getitem__
+            )
+            if self.max_distance is not None:
+                nearest = [
+                    index for index in nearest if distances[index] <= self.max_distance
+                ]
+            for index in nearest:
+                indices.append(index)
+                weights.append(
+                    math.inf
+                    if distances[index] < SAME_LOCATION
+                    else distances[index] ** -self.power
+                )
+            indptr.append(len(indices))
+
+        return NeighborWeights(array("q", self.stations.ids), indptr, indices, weights)
+
+    @staticmethod
+    def estimate(
+        weights: NeighborWeights, values: Mapping[int, float | None]
+    ) -> array[float]:
+        """Return estimated values at the query points.
+
+        Stations without a value are skipped and the remaining weights are
+        renormalized. A point at a station location gets the station value if
+        it's known. Points without any neighbor value get NaN.
+        """
+        column: array[float] = array(
+            "d",
+            (
+                math.nan if (value := values.get(station_id)) is None else value
+                for station_id in weights.station_ids
+            ),
+        )
+        result: array[float] = array("d")
+        start = 0
+        for end in weights.indptr[1:]:
+            total = 0.0
+            norm = 0.0
+            exact = math.nan
+            for position in range(start, end):
+                value = column[weights.indices[position]]
+                if math.isnan(value):
+                    continue
+                weight = weights.weights[position]
+                if math.isinf(weight):
+                    exact = value
+                    break
+                total += weight * value
+                norm += weight
+            if not math.isnan(exact):
+                result.append(exact)
+            else:
+                result.append(total / norm if norm else math.nan)
+            start = end
+        return result
+
+    def estimate_pollutant(
+        self,
+        weights: NeighborWeights,
+        sensors: Mapping[int, GiosSensors],
+        pollutant: str,
+    ) -> array[float]:
+        """Return estimated pollutant values from GiosSensors by station ID."""
+        values: dict[int, float | None] = {}
+        for station_id, data in sensors.items():
+            sensor: Sensor | None = getattr(data, pollutant)
+            if sensor is not None and isinstance(sensor.value, int | float):
+                values[station_id] = sensor.value
+        return self.estimate(weights, values)
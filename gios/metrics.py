@@ -0,0 +1,228 @@
+"""Metrics of GIOS library internals in the OpenMetrics text format."""
+
+import math
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Final
+
+from yarl import URL
+
+# Request latency buckets in seconds
+DEFAULT_BUCKETS: Final[tuple[float, ...]] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+CONTENT_TYPE: Final[str] = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape the label value."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Return the label set of a sample."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _number(value: float) -> str:
+    """Return the sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Monotonically increasing counter with labels."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> None:
+        """Initialize."""
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increase the counter of the label values."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the counter value of the label values."""
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield sample lines."""
+        for values, value in sorted(self._values.items()):
+            yield f"{self.name}_total{_labels(self.labels, values)} {_number(value)}"
+
+
+class Histogram:
+    """Histogram of observed values with labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize."""
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Bucket counts, the last one for values above all bounds, sum and count
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Add the observed value of the label values."""
+        if (series := self._values.get(labels)) is None:
+            series = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observed values of the label values."""
+        if (series := self._values.get(labels)) is None:
+            return 0
+        return sum(series[0])
+
+    def samples(self) -> Iterator[str]:
+        """Yield sample lines."""
+        names = (*self.labels, "le")
+        for values, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                labels = _labels(names, (*values, _number(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _labels(self.labels, values)
+            yield f"{self.name}_count{labels} {cumulative}"
+            yield f"{self.name}_sum{labels} {_number(total[0])}"
+
+
+class MetricsRegistry:
+    """Registry of metrics rendered in the OpenMetrics text format."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """Return the registered counter, register it if needed."""
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = Counter(name, documentation, labels)
+        if not isinstance(metric, Counter):
+            msg = f"Metric {name} is not a counter"
+            raise TypeError(msg)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the registered histogram, register it if needed."""
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = Histogram(
+                name, documentation, labels, buckets
+            )
+        if not isinstance(metric, Histogram):
+            msg = f"Metric {name} is not a histogram"
+            raise TypeError(msg)
+        return metric
+
+    def render(self) -> str:
+        """Return metrics in the OpenMetrics text format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class GiosMetrics:
+    """Metrics updated by the GIOS client."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Initialize."""
+        self.registry = registry
+        self.requests = registry.counter(
+            "gios_requests", "Requests to the GIOS API.", ("endpoint", "status")
+        )
+        self.request_duration = registry.histogram(
+            "gios_request_duration_seconds",
+            "Duration of requests to the GIOS API.",
+            ("endpoint",),
+        )
+        self.retries = registry.counter(
+            "gios_retries", "Retried requests to the GIOS API.", ("endpoint",)
+        )
+        self.updates = registry.counter("gios_updates", "Station updates.", ("result",))
+        self.update_duration = registry.histogram(
+            "gios_update_duration_seconds", "Duration of station updates."
+        )
+        self.invalid_sensors = registry.counter(
+            "gios_invalid_sensors", "Pollutants dropped for lack of valid values."
+        )
+        self.cache_requests = registry.counter(
+            "gios_cache_requests", "Requests to the response cache.", ("result",)
+        )
+
+
+_metrics: GiosMetrics | None = None
+
+
+def enable_metrics(registry: MetricsRegistry | None = None) -> GiosMetrics:
+    """Start updating metrics of the library in the registry."""
+    global _metrics  # noqa: PLW0603
+    _metrics = GiosMetrics(MetricsRegistry() if registry is None else registry)
+    return _metrics
+
+
+def disable_metrics() -> None:
+    """Stop updating metrics of the library."""
+    global _metrics  # noqa: PLW0603
+    _metrics = None
+
+
+def active_metrics() -> GiosMetrics | None:
+    """Return the enabled library metrics."""
+    return _metrics
+
+
+def endpoint_name(url: URL) -> str:
+    """Return the endpoint of the GIOS API URL without IDs, for example data/getData."""
+    return "/".join(
+        [part for part in url.parts if part != "/" and not part.isdigit()][-2:]
+    )
@@ -1,6 +1,6 @@
 """Type definitions for GIOS."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -29,7 +29,7 @@ class GiosSensors:
     so2: Sensor | None
 
 
-@dataclass
+@dataclass(slots=True)
 class GiosStation:
     """Data class for measeurement station."""
 
@@ -37,3 +37,21 @@ class GiosStation:
     name: str
     latitude: float
     longitude: float
+
+
+@dataclass(slots=True)
+class PartialUpdate:
+    """Data class for update results within a time budget.
+
+    `measured` holds measurement timestamps of values by field, `errors` error
+    descriptions by stage ("station", "sensors", "indexes") or field.
+    """
+
+    sensors: GiosSensors | None
+    measured: dict[str, str | None] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Return True if all stages succeeded."""
+        return self.sensors is not None and not self.errors
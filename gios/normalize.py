@@ -0,0 +1,67 @@
+"""Memoized normalization of GIOS API timestamps and pollutant keys."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Final
+from zoneinfo import ZoneInfo
+
+from .const import ATTR_INDEX_LEVEL, TIMEZONE
+
+HOURS_PER_DAY: Final[int] = 24
+# Consecutive polls return mostly the same timestamps, the cache holds more than
+# a year of hourly timestamps
+TIMESTAMP_CACHE_SIZE: Final[int] = 16_384
+KEY_CACHE_SIZE: Final[int] = 256
+
+_TZ: Final = ZoneInfo(TIMEZONE)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(timestamp: str) -> datetime:
+    """Return the aware datetime of the GIOS local timestamp string."""
+    return datetime.fromisoformat(timestamp).replace(tzinfo=_TZ)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def to_epoch(timestamp: str) -> int:
+    """Convert GIOS local timestamp string to Unix time."""
+    return int(parse_timestamp(timestamp).timestamp())
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def hour_number(timestamp: str) -> int:
+    """Return the ordinal hour number of the GIOS local timestamp."""
+    moment = parse_timestamp(timestamp)
+    return moment.toordinal() * HOURS_PER_DAY + moment.hour
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def pollutant_key(formula: str) -> str:
+    """Return the GiosSensors field name for the pollutant formula."""
+    return formula.lower().replace(".", "")
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def index_level_key(pollutant: str) -> str:
+    """Return the GIOS index response key of the pollutant index category."""
+    return ATTR_INDEX_LEVEL.format(pollutant.upper())
+
+
+_CACHED: Final = (
+    parse_timestamp,
+    to_epoch,
+    hour_number,
+    pollutant_key,
+    index_level_key,
+)
+
+
+def cache_info() -> dict[str, tuple[int, int, int | None, int]]:
+    """Return (hits, misses, maxsize, currsize) of normalization caches."""
+    return {function.__name__: function.cache_info() for function in _CACHED}
+
+
+def clear_caches() -> None:
+    """Clear normalization caches."""
+    for function in _CACHED:
+        function.cache_clear()
@@ -0,0 +1,49 @@
+"""Rate limiting of GIOS API requests."""
+
+import asyncio
+import time
+from types import TracebackType
+from typing import Self
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize.
+
+        `rate` is the number of requests per second, `burst` the number of
+        requests allowed at once after a quiet period.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> Self:
+        """Wait until a request is allowed."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context."""
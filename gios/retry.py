@@ -0,0 +1,109 @@
+"""Retries of failed GIOS API requests."""
+
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Final
+
+DEFAULT_ATTEMPTS: Final[int] = 3
+DEFAULT_BASE_DELAY: Final[float] = 0.5
+DEFAULT_MAX_DELAY: Final[float] = 30.0
+DEFAULT_BUDGET_RATIO: Final[float] = 0.2
+DEFAULT_BUDGET_MAX_TOKENS: Final[int] = 10
+RETRY_STATUSES: Final[frozenset[int]] = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS.value,
+        HTTPStatus.INTERNAL_SERVER_ERROR.value,
+        HTTPStatus.BAD_GATEWAY.value,
+        HTTPStatus.SERVICE_UNAVAILABLE.value,
+        HTTPStatus.GATEWAY_TIMEOUT.value,
+    }
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds from the Retry-After header value."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((moment - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Limit retries to a share of requests.
+
+    Every request adds `ratio` of a retry to the budget, every retry takes one.
+    The budget never exceeds `max_tokens` retries, which are also available at the
+    start, so a failing upstream gets at most `ratio` retries per request.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_BUDGET_RATIO,
+        max_tokens: int = DEFAULT_BUDGET_MAX_TOKENS,
+    ) -> None:
+        """Initialize."""
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget, return False if it's exhausted."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """Retry failed requests with exponential backoff and full jitter.
+
+    Responses with a status in `statuses` and connection errors are retried up
+    to `attempts` times in total, `Retry-After` of the response is respected up
+    to `max_delay`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        attempts: int = DEFAULT_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        *,
+        budget: RetryBudget | None = None,
+        statuses: frozenset[int] = RETRY_STATUSES,
+        jitter: bool = True,
+    ) -> None:
+        """Initialize."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = RetryBudget() if budget is None else budget
+        self.statuses = statuses
+        self.jitter = jitter
+
+    def retryable(self, status: int) -> bool:
+        """Return True if the response status is worth retrying."""
+        return status in self.statuses
+
+    def allow(self, attempt: int) -> bool:
+        """Return True if the failed attempt (counted from 0) can be retried."""
+        return attempt + 1 < self.attempts and self.budget.withdraw()
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Return the delay before retrying the failed attempt."""
+        if (delay := parse_retry_after(retry_after)) is not None:
+            return min(delay, self.max_delay)
+        backoff = min(self.base_delay * 2**attempt, self.max_delay)
+        return random.uniform(0, backoff) if self.jitter else backoff  # noqa: S311
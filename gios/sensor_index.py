@@ -0,0 +1,154 @@
+"""Persistent index of measuring station sensors."""
+
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Final, NamedTuple, Self
+
+from .const import POLLUTANT_MAP
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+INDEX_VERSION: Final[int] = 1
+
+
+class SensorInfo(NamedTuple):
+    """Sensor of a measuring station."""
+
+    id: int
+    indicator: str
+    formula: str
+
+
+class StationPollutant(NamedTuple):
+    """Pollutant measured by a measuring station."""
+
+    name: str
+    sensor_ids: tuple[int, ...]
+
+
+def station_pollutants(sensors: Iterable[SensorInfo]) -> dict[str, StationPollutant]:
+    """Return pollutants measured by sensors by pollutant key."""
+    names: dict[str, str] = {}
+    sensor_ids: dict[str, list[int]] = {}
+    for sensor in sensors:
+        if sensor.indicator not in POLLUTANT_MAP:
+            continue
+        key = sensor.formula.lower()
+        names.setdefault(key, POLLUTANT_MAP[sensor.indicator])
+        sensor_ids.setdefault(key, []).append(sensor.id)
+    return {
+        key: StationPollutant(name, tuple(sensor_ids[key]))
+        for key, name in names.items()
+    }
+
+
+class SensorIndex(Mapping[int, tuple[SensorInfo, ...]]):
+    """Sensors of measuring stations by station ID.
+
+    Sensors of a station older than `max_age` seconds are fetched again.
+    """
+
+    def __init__(self, max_age: float | None = None) -> None:
+        """Initialize."""
+        self.max_age = max_age
+        self._stations: dict[int, tuple[SensorInfo, ...]] = {}
+        self._updated: dict[int, float] = {}
+        self.version = 0
+
+    def __getitem__(self, station_id: int) -> tuple[SensorInfo, ...]:
+        """Return sensors of the station."""
+        return self._stations[station_id]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over station IDs."""
+        return iter(self._stations)
+
+    def __len__(self) -> int:
+        """Return the number of stations."""
+        return len(self._stations)
+
+    def set(
+        self,
+        station_id: int,
+        sensors: Iterable[SensorInfo],
+        updated: float | None = None,
+    ) -> None:
+        """Set sensors of the station."""
+        sensors = tuple(sensors)
+        if self._stations.get(station_id) != sensors:
+            self.version += 1
+        self._stations[station_id] = sensors
+        self._updated[station_id] = time.time() if updated is None else updated
+
+    def set_station_data(self, station_id: int, data: Iterable[dict[str, Any]]) -> None:
+        """Set sensors of the station from the GIOS API station sensors list."""
+        self.set(
+            station_id,
+            (
+                SensorInfo(
+                    sensor["Identyfikator stanowiska"],
+                    sensor["Wskaźnik"],
+                    sensor["Wskaźnik - wzór"],
+                )
+                for sensor in data
+            ),
+        )
+
+    def is_fresh(self, station_id: int, max_age: float | None = None) -> bool:
+        """Return True if the station sensors are known and not older than max_age.
+
+        Without `max_age` the index max_age is used.
+        """
+        if station_id not in self._stations:
+            return False
+        if max_age is None:
+            max_age = self.max_age
+        return max_age is None or time.time() - self._updated[station_id] <= max_age
+
+    def save(self, path: str | Path) -> None:
+        """Save the index to a JSON file."""
+        data = {
+            "version": INDEX_VERSION,
+            "stations": {
+                str(station_id): {
+                    "updated": self._updated[station_id],
+                    "sensors": [list(sensor) for sensor in sensors],
+                }
+                for station_id, sensors in self._stations.items()
+            },
+        }
+        target = Path(path)
+        temporary = target.with_suffix(target.suffix + ".tmp")
+        temporary.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        temporary.replace(target)
+
+    @classmethod
+    def load(cls, path: str | Path, max_age: float | None = None) -> Self:
+        """Load the index from a JSON file.
+
+        Return an empty index if the file is missing or corrupted.
+        """
+        index = cls(max_age)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return index
+        except json.JSONDecodeError as error:
+            _LOGGER.warning("Ignoring corrupted sensor index %s: %s", path, error)
+            return index
+
+        if data.get("version") != INDEX_VERSION:
+            _LOGGER.info("Ignoring sensor index %s with unsupported version", path)
+            return index
+
+        for station_id, station in data["stations"].items():
+            index.set(
+                int(station_id),
+                (SensorInfo(*sensor) for sensor in station["sensors"]),
+                station["updated"],
+            )
+        _LOGGER.debug("Loaded sensors of %s stations from %s", len(index), path)
+        return index
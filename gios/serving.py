@@ -0,0 +1,111 @@
+"""Serving of GIOS data independent of the upstream health."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Final, cast
+
+from aiohttp import ClientError
+
+from .breaker import CircuitBreaker
+from .client import Gios
+from .exceptions import GiosError
+from .model import GiosSensors
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE: Final[float] = 600.0
+
+
+@dataclass(frozen=True, slots=True)
+class ServedSensors:
+    """Data class for served sensors data.
+
+    `age` is the number of seconds since the data was fetched, `error` the
+    error of the last failed revalidation.
+    """
+
+    sensors: GiosSensors
+    age: float
+    stale: bool
+    error: str | None = None
+
+
+class StaleWhileRevalidate:
+    """Serve the last good data of a station while refreshing it in background.
+
+    Data older than `max_age` is served as stale and triggers a revalidation in
+    background. Revalidations go through the circuit breaker, so a failing
+    upstream isn't requested again until the cool-down period passes.
+    """
+
+    def __init__(
+        self,
+        gios: Gios,
+        max_age: float = DEFAULT_MAX_AGE,
+        breaker: CircuitBreaker | None = None,
+        local_indexes: bool = False,
+    ) -> None:
+        """Initialize."""
+        self.gios = gios
+        self.max_age = max_age
+        self.breaker = CircuitBreaker() if breaker is None else breaker
+        self.local_indexes = local_indexes
+        self._sensors: GiosSensors | None = None
+        self._updated = 0.0
+        self._error: str | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_get(self) -> ServedSensors:
+        """Return the last good data, start a revalidation if it's stale.
+
+        Only the first call waits for the GIOS API, it raises if the data can't
+        be fetched.
+        """
+        if self._sensors is None:
+            await self.async_revalidate(raise_errors=True)
+
+        age = time.monotonic() - self._updated
+        stale = age > self.max_age
+        if stale and not self.revalidating:
+            self._task = asyncio.create_task(self.async_revalidate())
+        return ServedSensors(cast(GiosSensors, self._sensors), age, stale, self._error)
+
+    @property
+    def revalidating(self) -> bool:
+        """Return True if a revalidation is running."""
+        return self._task is not None and not self._task.done()
+
+    async def async_revalidate(self, raise_errors: bool = False) -> None:
+        """Fetch the station data through the circuit breaker.
+
+        While the circuit is open the GIOS API isn't requested and the error is
+        CircuitOpenError.
+        """
+        try:
+            async with self.breaker:
+                sensors = await self.gios.async_update(self.local_indexes)
+        except (GiosError, ClientError, TimeoutError) as error:
+            self._error = repr(error)
+            if raise_errors:
+                raise
+            _LOGGER.info(
+                "Revalidation of station %s failed: %s", self.gios.station_id, error
+            )
+            return
+
+        self._sensors = sensors
+        self._updated = time.monotonic()
+        self._error = None
+
+    async def async_wait(self) -> None:
+        """Wait for the running revalidation."""
+        if self._task is not None:
+            await self._task
+
+    async def async_close(self) -> None:
+        """Cancel the running revalidation."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
@@ -0,0 +1,173 @@
+"""Managed, tuned HTTP connection pool for GIOS API requests."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Final, Self
+
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+)
+from yarl import URL
+
+from .const import URL_API_BASE
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_LIMIT_PER_HOST: Final[int] = 20
+DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 60.0
+DEFAULT_DNS_CACHE_TTL: Final[int] = 600
+DEFAULT_TIMEOUT: Final[float] = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Data class for connection pool statistics."""
+
+    in_use: int
+    idle: int
+    waiting: int
+    created: int
+    reused: int
+    dns_cache_hits: int
+    dns_cache_misses: int
+
+
+class ConnectionPool:
+    """Library-managed client session with a connection pool tuned for GIOS.
+
+    One pool can be shared by many Gios instances so that a fleet sweep reuses
+    warm keep-alive connections to the GIOS API host.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._session: ClientSession | None = None
+        self._connector: TCPConnector | None = None
+        self._waiting = 0
+        self._created = 0
+        self._reused = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the managed client session, create it on first access."""
+        if self._session is None or self._session.closed:
+            self._connector = TCPConnector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = ClientSession(
+                connector=self._connector,
+                timeout=ClientTimeout(total=self.timeout),
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    async def prewarm(self, connections: int | None = None) -> int:
+        """Open keep-alive connections to the GIOS API host before a poll.
+
+        Return the number of connections which were opened successfully.
+        """
+        count = self.limit_per_host if connections is None else connections
+        session = self.session
+
+        async def open_connection() -> bool:
+            try:
+                async with session.head(URL(URL_API_BASE)) as resp:
+                    await resp.read()
+            except (ClientError, TimeoutError) as error:
+                _LOGGER.debug("Connection pre-warming failed: %s", error)
+                return False
+            return True
+
+        results = await asyncio.gather(*(open_connection() for _ in range(count)))
+        _LOGGER.debug("Pre-warmed %s connections", sum(results))
+        return sum(results)
+
+    def stats(self) -> PoolStats:
+        """Return connection pool statistics."""
+        in_use = idle = 0
+        if self._connector is not None and not self._connector.closed:
+            # aiohttp doesn't expose acquired and idle connections publicly,
+            # requests waiting for a free connection aren't counted as in use
+            in_use = len(self._connector._acquired)  # noqa: SLF001
+            idle = sum(len(conns) for conns in self._connector._conns.values())  # noqa: SLF001
+        return PoolStats(
+            in_use,
+            idle,
+            self._waiting,
+            self._created,
+            self._reused,
+            self._dns_cache_hits,
+            self._dns_cache_misses,
+        )
+
+    async def close(self) -> None:
+        """Close the managed session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._connector = None
+
+    async def __aenter__(self) -> Self:
+        """Enter the runtime context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the managed session."""
+        await self.close()
+
+    def _trace_config(self) -> TraceConfig:
+        """Return trace config updating the pool statistics."""
+        trace_config = TraceConfig()
+
+        async def on_queued_start(*_: Any) -> None:
+            self._waiting += 1
+
+        async def on_queued_end(*_: Any) -> None:
+            self._waiting -= 1
+
+        async def on_create(*_: Any) -> None:
+            self._created += 1
+
+        async def on_reuse(*_: Any) -> None:
+            self._reused += 1
+
+        async def on_dns_hit(*_: Any) -> None:
+            self._dns_cache_hits += 1
+
+        async def on_dns_miss(*_: Any) -> None:
+            self._dns_cache_misses += 1
+
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_dns_cache_hit.append(on_dns_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_miss)
+        return trace_config
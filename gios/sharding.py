@@ -0,0 +1,265 @@
+"""Polling of measuring stations sharded across worker processes."""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from dataclasses import astuple, dataclass
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from typing import Final
+
+from aiohttp import ClientError, ClientSession
+
+from .catalog import StationCatalog
+from .client import Gios
+from .const import DEFAULT_CONCURRENCY
+from .exceptions import GiosError
+from .model import GiosSensors, GiosStation
+from .retry import RetryPolicy
+from .sensor_index import SensorIndex
+from .transport import Transport
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Interval of checking if workers are alive while waiting for results
+QUEUE_POLL_INTERVAL: Final[float] = 0.5
+
+TransportFactory = Callable[[ClientSession], Transport]
+
+
+@dataclass(frozen=True, slots=True)
+class StationResult:
+    """Data class for station update result of a worker process."""
+
+    station_id: int
+    sensors: GiosSensors | None
+    error: str | None
+    latency: float
+    worker: int
+
+
+class SharedCache:
+    """Stations catalog and sensor index shared with worker processes.
+
+    Both are stored in a directory once by the parent process and loaded by
+    every worker, so workers don't download the catalog themselves.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize."""
+        self.directory = Path(directory)
+        self.stations_path = self.directory / "stations.json"
+        self.sensors_path = self.directory / "sensors.json"
+
+    def save(self, stations: Iterable[GiosStation], sensor_index: SensorIndex) -> None:
+        """Save the stations catalog and the sensor index."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.stations_path.with_suffix(".json.tmp")
+        temporary.write_text(
+            json.dumps([astuple(station) for station in stations], ensure_ascii=False),
+            encoding="utf-8",
+        )
+        temporary.replace(self.stations_path)
+        sensor_index.save(self.sensors_path)
+
+    def load(self) -> tuple[StationCatalog, SensorIndex]:
+        """Load the stations catalog and the sensor index."""
+        rows = json.loads(self.stations_path.read_text(encoding="utf-8"))
+        return (
+            StationCatalog(GiosStation(*row) for row in rows),
+            SensorIndex.load(self.sensors_path),
+        )
+
+
+async def _async_poll_shard(  # noqa: PLR0913
+    worker: int,
+    station_ids: Sequence[int],
+    cache: SharedCache,
+    results: "multiprocessing.Queue[StationResult | None]",
+    *,
+    concurrency: int,
+    transport_factory: TransportFactory | None,
+    local_indexes: bool,
+    base_url: str,
+    retry: RetryPolicy | None,
+) -> None:
+    """Update stations of the shard and put results into the queue."""
+    stations, sensor_index = cache.load()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with ClientSession() as session:
+        gios = Gios(
+            None,
+            session,
+            None if transport_factory is None else transport_factory(session),
+            measurement_stations=stations,
+            sensor_index=sensor_index,
+            base_url=base_url,
+            retry=retry,
+        )
+
+        async def update(station_id: int) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    sensors = await gios.for_station(station_id).async_update(
+                        local_indexes
+                    )
+                except (GiosError, ClientError, TimeoutError) as error:
+                    sensors = None
+                    message: str | None = repr(error)
+                else:
+                    message = None
+                latency = time.perf_counter() - started
+            results.put(StationResult(station_id, sensors, message, latency, worker))
+
+        await asyncio.gather(*(update(station_id) for station_id in station_ids))
+
+
+def _poll_shard(  # noqa: PLR0913
+    worker: int,
+    station_ids: Sequence[int],
+    cache: SharedCache,
+    results: "multiprocessing.Queue[StationResult | None]",
+    *,
+    concurrency: int,
+    transport_factory: TransportFactory | None,
+    local_indexes: bool,
+    base_url: str,
+    retry: RetryPolicy | None,
+) -> None:
+    """Run the shard update loop in a worker process."""
+    try:
+        asyncio.run(
+            _async_poll_shard(
+                worker,
+                station_ids,
+                cache,
+                results,
+                concurrency=concurrency,
+                transport_factory=transport_factory,
+                local_indexes=local_indexes,
+                base_url=base_url,
+                retry=retry,
+            )
+        )
+    finally:
+        results.put(None)
+
+
+class ShardedPoller:
+    """Update measuring stations in a pool of worker processes.
+
+    Station IDs are split into one shard per process, each process runs its own
+    event loop with a Gios instance built from the shared cache. Results are
+    streamed back to the parent as soon as stations are updated. Sensors of
+    stations missing in the sensor index are fetched by the parent first, so
+    they end up in the shared cache and in the parent sensor index.
+
+    `transport_factory` must be picklable, it's called with the worker session
+    to create the worker transport.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        gios: Gios,
+        *,
+        processes: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        cache_dir: str | Path | None = None,
+        transport_factory: TransportFactory | None = None,
+        local_indexes: bool = False,
+    ) -> None:
+        """Initialize."""
+        self.gios = gios
+        self.processes = processes or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.transport_factory = transport_factory
+        self.local_indexes = local_indexes
+
+    async def async_poll(
+        self, station_ids: Iterable[int] | None = None
+    ) -> AsyncIterator[StationResult]:
+        """Update stations, yield results in the order of completion."""
+        ids = list(
+            self.gios.measurement_stations if station_ids is None else station_ids
+        )
+        shards = [ids[worker :: self.processes] for worker in range(self.processes)]
+        shards = [shard for shard in shards if shard]
+        if not shards:
+            return
+
+        await self.gios.async_prefetch_sensors(ids, self.concurrency)
+
+        with tempfile.TemporaryDirectory(prefix="gios-") as temporary:
+            cache = SharedCache(self.cache_dir or temporary)
+            cache.save(self.gios.measurement_stations.values(), self.gios.sensor_index)
+
+            context = multiprocessing.get_context("spawn")
+            results: multiprocessing.Queue[StationResult | None] = context.Queue()
+            workers = [
+                context.Process(
+                    target=_poll_shard,
+                    args=(worker, shard, cache, results),
+                    kwargs={
+                        "concurrency": self.concurrency,
+                        "transport_factory": self.transport_factory,
+                        "local_indexes": self.local_indexes,
+                        "base_url": self.gios.base_url,
+                        "retry": self.gios.retry,
+                    },
+                    daemon=True,
+                )
+                for worker, shard in enumerate(shards)
+            ]
+            for process in workers:
+                process.start()
+            _LOGGER.debug("Polling %s stations in %s processes", len(ids), len(shards))
+
+            loop = asyncio.get_running_loop()
+            finished = 0
+            try:
+                while finished < len(workers):
+                    try:
+                        result = await loop.run_in_executor(
+                            None, _next_result, results, workers
+                        )
+                    except queue.Empty:
+                        _LOGGER.warning(
+                            "%s worker processes exited without finishing",
+                            len(workers) - finished,
+                        )
+                        break
+                    if result is None:
+                        finished += 1
+                        continue
+                    yield result
+            finally:
+                for process in workers:
+                    if process.is_alive():
+                        process.terminate()
+                    process.join()
+
+
+def _next_result(
+    results: "multiprocessing.Queue[StationResult | None]",
+    workers: Sequence[SpawnProcess],
+) -> StationResult | None:
+    """Wait for the next result, return None when a worker finished.
+
+    Raise queue.Empty when no worker is alive and the queue is drained.
+    """
+    while True:
+        try:
+            return results.get(timeout=QUEUE_POLL_INTERVAL)
+        except queue.Empty:
+            if not any(process.is_alive() for process in workers):
+                # Items put by the last workers may still be arriving
+                return results.get_nowait()
@@ -0,0 +1,113 @@
+"""Local SQLite time-series store for GIOS measurements."""
+
+import logging
+import math
+import sqlite3
+from array import array
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Final, Self
+
+from .normalize import to_epoch
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS measurements (
+    sensor_id INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (sensor_id, timestamp)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS measurements_timestamp ON measurements (timestamp);
+"""
+
+# A null never overwrites a stored value, the GIOS server sends nulls for
+# measurements which are not available yet.
+UPSERT: Final[str] = """
+INSERT INTO measurements (sensor_id, timestamp, value) VALUES (?, ?, ?)
+ON CONFLICT (sensor_id, timestamp) DO UPDATE SET value = excluded.value
+WHERE excluded.value IS NOT NULL AND value IS NOT excluded.value
+"""
+
+
+class MeasurementStore:
+    """Store sensor measurements in SQLite, keyed on sensor and timestamp."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """Initialize."""
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the store."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def ingest(self, sensor_id: int, entries: Iterable[dict[str, Any]]) -> int:
+        """Store raw measurement entries of a sensor, return number of changed rows."""
+        return self.ingest_many({sensor_id: entries})
+
+    def ingest_many(self, sensors: Mapping[int, Iterable[dict[str, Any]]]) -> int:
+        """Store raw measurement entries of many sensors in one transaction.
+
+        Entries already stored with the same value are not written again.
+        """
+        rows = (
+            (sensor_id, to_epoch(entry["Data"]), entry.get("Wartość"))
+            for sensor_id, entries in sensors.items()
+            for entry in entries
+            if entry.get("Data")
+        )
+        before = self._connection.total_changes
+        with self._connection:
+            self._connection.executemany(UPSERT, rows)
+        changed = self._connection.total_changes - before
+        _LOGGER.debug("Stored %s new or corrected measurements", changed)
+        return changed
+
+    def query(
+        self, sensor_id: int, start: int | None = None, end: int | None = None
+    ) -> tuple[array[int], array[float]]:
+        """Return timestamps and values of a sensor in the [start, end] range.
+
+        Missing values are returned as NaN.
+        """
+        cursor = self._connection.execute(
+            "SELECT timestamp, value FROM measurements WHERE sensor_id = ? "
+            "AND timestamp >= ? AND timestamp <= ? ORDER BY timestamp",
+            (
+                sensor_id,
+                -(2**63) if start is None else start,
+                2**63 - 1 if end is None else end,
+            ),
+        )
+        timestamps: array[int] = array("q")
+        values: array[float] = array("d")
+        for timestamp, value in cursor:
+            timestamps.append(timestamp)
+            values.append(math.nan if value is None else value)
+        return timestamps, values
+
+    def latest_timestamp(self, sensor_id: int) -> int | None:
+        """Return the timestamp of the newest stored measurement of a sensor."""
+        row = self._connection.execute(
+            "SELECT MAX(timestamp) FROM measurements WHERE sensor_id = ?",
+            (sensor_id,),
+        ).fetchone()
+        return row[0]
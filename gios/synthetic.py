@@ -0,0 +1,261 @@
+"""Deterministic synthetic GIOS API payloads for performance testing."""
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import Any, Final
+
+from yarl import URL
+
+from .aqi import BREAKPOINTS, CATEGORIES, NO_INDEX, station_levels
+from .const import (
+    ATTR_INDEX_LEVEL,
+    STATE_MAP,
+    STATIONS_PAGE_SIZE,
+    URL_API_BASE,
+    URL_INDEXES,
+    URL_SENSOR,
+    URL_STATION,
+    URL_STATIONS,
+)
+from .normalize import pollutant_key
+from .transport import TransportResponse
+
+DEFAULT_STATIONS: Final[int] = 1000
+DEFAULT_HOURS: Final[int] = 72
+DEFAULT_NULL_RATIO: Final[float] = 0.05
+DEFAULT_END: Final = datetime(2025, 7, 4, 15)  # noqa: DTZ001
+FIRST_STATION_ID: Final[int] = 10_000
+# Sensor IDs are station ID * SENSOR_SLOTS + position of the sensor
+SENSOR_SLOTS: Final[int] = 16
+# Probability of the newest value being null, GIOS publishes nulls first
+NEWEST_NULL_RATIO: Final[float] = 0.3
+TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+ERROR_MANUAL_SENSOR: Final[dict[str, str]] = {
+    "error_result": "Przepraszamy, nie można zwrócić danych.",
+    "error_code": "API-ERR-100003",
+}
+STATE_NAMES: Final[dict[str, str]] = {value: key for key, value in STATE_MAP.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class PollutantProfile:
+    """Data class for a synthetic pollutant."""
+
+    indicator: str
+    formula: str
+    mean: float
+    probability: float
+    manual: bool = False
+
+
+PROFILES: Final[tuple[PollutantProfile, ...]] = (
+    PollutantProfile("pył zawieszony PM10", "PM10", 25, 0.9),
+    PollutantProfile("pył zawieszony PM10", "PM10", 25, 0.2, manual=True),
+    PollutantProfile("pył zawieszony PM2.5", "PM2.5", 15, 0.6),
+    PollutantProfile("dwutlenek azotu", "NO2", 20, 0.7),
+    PollutantProfile("tlenek azotu", "NO", 10, 0.4),
+    PollutantProfile("tlenki azotu", "NOx", 35, 0.4),
+    PollutantProfile("ozon", "O3", 60, 0.4),
+    PollutantProfile("dwutlenek siarki", "SO2", 5, 0.3),
+    PollutantProfile("tlenek węgla", "CO", 400, 0.2),
+    PollutantProfile("benzen", "C6H6", 1.5, 0.2),
+    PollutantProfile("benzo(a)piren w PM10", "BaP(PM10)", 1, 0.1, manual=True),
+)
+
+
+class SyntheticNetwork:
+    """Network of synthetic measuring stations.
+
+    Payloads have the structure of the GIOS API responses and are generated on
+    request, every station and sensor from its own seed, so a network of
+    thousands of stations with long histories takes no memory and the same
+    seed always gives the same payloads.
+    """
+
+    def __init__(
+        self,
+        stations: int = DEFAULT_STATIONS,
+        hours: int = DEFAULT_HOURS,
+        seed: int = 0,
+        null_ratio: float = DEFAULT_NULL_RATIO,
+        end: datetime = DEFAULT_END,
+    ) -> None:
+        """Initialize."""
+        self.stations = stations
+        self.hours = hours
+        self.seed = seed
+        self.null_ratio = null_ratio
+        self.end = end
+
+    @property
+    def station_ids(self) -> range:
+        """Return IDs of the stations."""
+        return range(FIRST_STATION_ID, FIRST_STATION_ID + self.stations)
+
+    def _random(self, *key: object) -> random.Random:
+        """Return the random generator of the network item."""
+        return random.Random(":".join(map(str, (self.seed, *key))))  # noqa: S311
+
+    def _station(self, station_id: int) -> dict[str, Any]:
+        """Return the station entry of the stations list."""
+        generator = self._random("station", station_id)
+        number = station_id - FIRST_STATION_ID
+        city = f"Miasto {number // 4}"
+        return {
+            "Identyfikator stacji": station_id,
+            "Kod stacji": f"Syn{station_id}",
+            "Nazwa stacji": f"{city}, ul. Testowa {number % 4 + 1}",
+            "WGS84 φ N": f"{generator.uniform(49.0, 54.8):.6f}",
+            "WGS84 λ E": f"{generator.uniform(14.1, 24.1):.6f}",
+            "Nazwa miasta": city,
+        }
+
+    def stations_page(
+        self, page: int, size: int = STATIONS_PAGE_SIZE
+    ) -> dict[str, Any]:
+        """Return the page of the stations list."""
+        ids = self.station_ids[page * size : (page + 1) * size]
+        return {
+            "Lista stacji pomiarowych": [
+                self._station(station_id) for station_id in ids
+            ],
+            "totalPages": max(math.ceil(self.stations / size), 1),
+        }
+
+    def _profiles(self, station_id: int) -> list[tuple[int, PollutantProfile]]:
+        """Return sensor positions and pollutants measured by the station."""
+        generator = self._random("sensors", station_id)
+        profiles = [
+            (position, profile)
+            for position, profile in enumerate(PROFILES)
+            if generator.random() < profile.probability
+        ]
+        return profiles or [(0, PROFILES[0])]
+
+    def station_sensors(self, station_id: int) -> dict[str, Any] | None:
+        """Return the sensors list of the station, None if it doesn't exist."""
+        if station_id not in self.station_ids:
+            return None
+        return {
+            "Lista stanowisk pomiarowych dla podanej stacji": [
+                {
+                    "Identyfikator stanowiska": station_id * SENSOR_SLOTS + position,
+                    "Identyfikator stacji": station_id,
+                    "Wskaźnik": profile.indicator,
+                    "Wskaźnik - wzór": profile.formula,
+                    "Wskaźnik - kod": profile.formula,
+                }
+                for position, profile in self._profiles(station_id)
+            ]
+        }
+
+    def _values(self, sensor_id: int, profile: PollutantProfile) -> list[float | None]:
+        """Return hourly values of the sensor, the newest first."""
+        generator = self._random("values", sensor_id)
+        level = profile.mean * generator.lognormvariate(0, 0.4)
+        phase = generator.uniform(0, 2 * math.pi)
+        values: list[float | None] = []
+        for hour in range(self.hours):
+            if generator.random() < (
+                NEWEST_NULL_RATIO if hour == 0 else self.null_ratio
+            ):
+                values.append(None)
+                continue
+            daily = 1 + 0.5 * math.sin(2 * math.pi * hour / 24 + phase)
+            values.append(round(level * daily * generator.lognormvariate(0, 0.2), 1))
+        return values
+
+    def sensor_data(self, sensor_id: int) -> dict[str, Any] | None:
+        """Return measurements of the sensor, None if it doesn't exist."""
+        station_id, position = divmod(sensor_id, SENSOR_SLOTS)
+        if station_id not in self.station_ids or position >= len(PROFILES):
+            return None
+        profile = PROFILES[position]
+        if (position, profile) not in self._profiles(station_id):
+            return None
+        if profile.manual:
+            return dict(ERROR_MANUAL_SENSOR)
+
+        code = f"Syn{station_id}-{profile.formula}-1g"
+        return {
+            "Lista danych pomiarowych": [
+                {
+                    "Kod stanowiska": code,
+                    "Data": (self.end - timedelta(hours=hour)).strftime(
+                        TIMESTAMP_FORMAT
+                    ),
+                    "Wartość": value,
+                }
+                for hour, value in enumerate(self._values(sensor_id, profile))
+            ]
+        }
+
+    def index(self, station_id: int) -> dict[str, Any] | None:
+        """Return the air quality index of the station, None if it doesn't exist.
+
+        Index categories are computed from the newest values of sensors.
+        """
+        if station_id not in self.station_ids:
+            return None
+        values: dict[str, list[float | None]] = {}
+        formulas: dict[str, str] = {}
+        for position, profile in self._profiles(station_id):
+            key = pollutant_key(profile.formula)
+            if profile.manual or key not in BREAKPOINTS:
+                continue
+            series = self._values(station_id * SENSOR_SLOTS + position, profile)
+            values[key] = [
+                next((value for value in series[:2] if value is not None), None)
+            ]
+            formulas[key] = profile.formula
+
+        levels, aqi = station_levels(values)
+        index: dict[str, Any] = {"Identyfikator stacji pomiarowej": station_id}
+        for key, series in levels.items():
+            index[ATTR_INDEX_LEVEL.format(formulas[key])] = (
+                None if series[0] == NO_INDEX else STATE_NAMES[CATEGORIES[series[0]]]
+            )
+        status = bool(aqi) and aqi[0] != NO_INDEX
+        index["Status indeksu ogólnego dla stacji pomiarowej"] = status
+        index["Nazwa kategorii indeksu"] = (
+            STATE_NAMES[CATEGORIES[aqi[0]]] if status else None
+        )
+        return {"AqIndex": index}
+
+
+class SyntheticTransport:
+    """Transport serving payloads of a synthetic network."""
+
+    def __init__(self, network: SyntheticNetwork, base_url: str = URL_API_BASE) -> None:
+        """Initialize."""
+        self.network = network
+        self.base_url = base_url.rstrip("/")
+
+    def _payload(self, url: URL) -> dict[str, Any] | None:
+        """Return the payload for the URL, None for unknown URLs."""
+        endpoint = str(url.with_query(None)).replace(self.base_url, URL_API_BASE, 1)
+        if endpoint == URL_STATIONS:
+            return self.network.stations_page(
+                int(url.query.get("page", 0)),
+                int(url.query.get("size", STATIONS_PAGE_SIZE)),
+            )
+
+        prefix, _, item = endpoint.rpartition("/")
+        handler = {
+            URL_INDEXES: self.network.index,
+            URL_SENSOR: self.network.sensor_data,
+            URL_STATION: self.network.station_sensors,
+        }.get(prefix)
+        if handler is None or not item.isdigit():
+            return None
+        return handler(int(item))
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Return the synthetic response for the URL."""
+        if (payload := self._payload(url)) is None:
+            return TransportResponse(HTTPStatus.NOT_FOUND.value)
+        return TransportResponse(HTTPStatus.OK.value, payload)
@@ -0,0 +1,145 @@
+"""Timeline tracing of GIOS updates in the Chrome trace format."""
+
+import asyncio
+import json
+import os
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Final, Self
+
+CATEGORY_REQUEST: Final[str] = "request"
+CATEGORY_STAGE: Final[str] = "stage"
+CATEGORY_UPDATE: Final[str] = "update"
+
+_TRACER: ContextVar["Tracer | None"] = ContextVar("gios_tracer", default=None)
+
+
+@dataclass(slots=True)
+class TraceEvent:
+    """Data class for a traced span, times in seconds since the tracer start."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    lane: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Record spans of updates, requests and processing stages.
+
+    Tracing is enabled for code running in the tracer context, including tasks
+    started there. Every asyncio task gets its own lane, so concurrent requests
+    are shown side by side.
+
+        with Tracer() as tracer:
+            await gios.async_update()
+        tracer.export("update.json")
+
+    The exported file can be opened in Perfetto or chrome://tracing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.events: list[TraceEvent] = []
+        self._origin = time.perf_counter()
+        self._lanes: weakref.WeakKeyDictionary[asyncio.Task[Any], int] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lane_count = 1
+        self._tokens: list[Token[Tracer | None]] = []
+
+    def _lane(self) -> int:
+        """Return the lane of the current task, 0 outside of tasks."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            return 0
+        if task is None:
+            return 0
+        if (lane := self._lanes.get(task)) is None:
+            lane = self._lanes[task] = self._lane_count
+            self._lane_count += 1
+        return lane
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = CATEGORY_STAGE, **args: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Record the span, yield its arguments to add details."""
+        lane = self._lane()
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            self.events.append(
+                TraceEvent(
+                    name, category, start - self._origin, end - start, lane, args
+                )
+            )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return events in the Chrome trace event format."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane,
+                "args": {"name": "main" if lane == 0 else f"task {lane}"},
+            }
+            for lane in sorted({event.lane for event in self.events})
+        ]
+        events.extend(
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": round(event.start * 1e6, 3),
+                "dur": round(event.duration * 1e6, 3),
+                "pid": pid,
+                "tid": event.lane,
+                "args": event.args,
+            }
+            for event in sorted(self.events, key=lambda event: event.start)
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str | Path) -> None:
+        """Write events to a Chrome trace JSON file."""
+        Path(path).write_text(
+            json.dumps(self.to_chrome_trace(), ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+
+    def __enter__(self) -> Self:
+        """Enable tracing in the current context."""
+        self._tokens.append(_TRACER.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Disable tracing."""
+        _TRACER.reset(self._tokens.pop())
+
+
+def span(
+    name: str, category: str = CATEGORY_STAGE, **args: Any
+) -> AbstractContextManager[dict[str, Any]]:
+    """Return the span of the active tracer, a no-op without tracing."""
+    if (tracer := _TRACER.get()) is None:
+        return nullcontext(args)
+    return tracer.span(name, category, **args)
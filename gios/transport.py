@@ -0,0 +1,325 @@
+"""Pluggable HTTP transports for GIOS API requests."""
+
+import asyncio
+import json
+import logging
+import mmap
+import struct
+import time
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Final, Protocol, Self
+
+from aiohttp import ClientSession
+from yarl import URL
+
+from .metrics import active_metrics
+from .ratelimit import RateLimiter
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+ARCHIVE_MAGIC: Final[bytes] = b"GIOSREC1"
+FOOTER: Final = struct.Struct("<Q")
+DEFAULT_CACHE_TTL: Final[float] = 60.0
+DEFAULT_CACHE_SIZE: Final[int] = 10_000
+
+
+@dataclass(slots=True)
+class TransportResponse:
+    """Data class for transport response."""
+
+    status: int
+    data: Any = None
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+class Transport(Protocol):
+    """Protocol for objects performing GET requests to the GIOS API."""
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Perform GET request and return the response."""
+        ...
+
+
+class SessionTransport:
+    """Transport using aiohttp client session."""
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize."""
+        self.session = session
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Perform GET request and return the response."""
+        async with self.session.get(url) as resp:
+            if resp.status != HTTPStatus.OK.value:
+                return TransportResponse(resp.status, None, resp.headers)
+            return TransportResponse(resp.status, await resp.json(), resp.headers)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordEntry:
+    """Data class for archive index entry."""
+
+    url: str
+    time: float
+    latency: float
+    status: int
+    offset: int
+    length: int
+
+
+class RecordingTransport:
+    """Transport saving request and response pairs to an archive file.
+
+    Response bodies are stored zlib compressed, the index of records by URL and
+    time is written at the end of the file on close.
+    """
+
+    def __init__(self, transport: Transport, path: str | Path) -> None:
+        """Initialize."""
+        self.transport = transport
+        self._file: BinaryIO = Path(path).open("wb")  # noqa: SIM115
+        self._file.write(ARCHIVE_MAGIC)
+        self._index: list[RecordEntry] = []
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Perform GET request with the wrapped transport and record it."""
+        started = time.time()
+        start = time.perf_counter()
+        response = await self.transport.get(url)
+        latency = time.perf_counter() - start
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() == "retry-after"
+        }
+        body = zlib.compress(
+            json.dumps({"data": response.data, "headers": headers}).encode()
+        )
+        self._index.append(
+            RecordEntry(
+                str(url),
+                started,
+                latency,
+                response.status,
+                self._file.tell(),
+                len(body),
+            )
+        )
+        self._file.write(body)
+
+        return response
+
+    def close(self) -> None:
+        """Write the index and close the archive."""
+        if self._file.closed:
+            return
+        offset = self._file.tell()
+        self._file.write(
+            zlib.compress(
+                json.dumps(
+                    [
+                        [
+                            entry.url,
+                            entry.time,
+                            entry.latency,
+                            entry.status,
+                            entry.offset,
+                            entry.length,
+                        ]
+                        for entry in self._index
+                    ]
+                ).encode()
+            )
+        )
+        self._file.write(FOOTER.pack(offset))
+        self._file.close()
+        _LOGGER.debug("Recorded %s responses", len(self._index))
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the archive."""
+        self.close()
+
+
+class ReplayTransport:
+    """Transport serving responses from a memory-mapped archive.
+
+    Without `speed` responses for a URL are served in the recorded order,
+    cycling when exhausted. With `speed` the recorded timeline is replayed
+    `speed` times faster than real time, each request gets the newest response
+    recorded for the URL at the current replay time and waits for the recorded
+    latency scaled by `speed`.
+    """
+
+    def __init__(self, path: str | Path, speed: float | None = None) -> None:
+        """Initialize."""
+        self.speed = speed
+        with Path(path).open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            msg = f"{path} is not a GIOS recording"
+            raise ValueError(msg)
+
+        (offset,) = FOOTER.unpack_from(self._mmap, len(self._mmap) - FOOTER.size)
+        index = json.loads(
+            zlib.decompress(self._mmap[offset : len(self._mmap) - FOOTER.size])
+        )
+
+        self._records: dict[str, list[RecordEntry]] = {}
+        for item in index:
+            entry = RecordEntry(*item)
+            self._records.setdefault(entry.url, []).append(entry)
+        for entries in self._records.values():
+            entries.sort(key=lambda entry: entry.time)
+        self._times = {
+            url: [entry.time for entry in entries]
+            for url, entries in self._records.items()
+        }
+        self._cursors: dict[str, int] = {}
+        self._start_time = min(
+            (entries[0].time for entries in self._records.values()), default=0.0
+        )
+        self._started: float | None = None
+
+    @property
+    def urls(self) -> list[str]:
+        """Return recorded URLs."""
+        return list(self._records)
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Return the recorded response for the URL."""
+        key = str(url)
+        if (entries := self._records.get(key)) is None:
+            _LOGGER.debug("No recorded response for %s", key)
+            return TransportResponse(HTTPStatus.NOT_FOUND.value)
+
+        if self.speed is None:
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = (cursor + 1) % len(entries)
+            entry = entries[cursor]
+        else:
+            if self._started is None:
+                self._started = time.monotonic()
+            replay_time = (
+                self._start_time + (time.monotonic() - self._started) * self.speed
+            )
+            position = bisect_right(self._times[key], replay_time)
+            entry = entries[max(position - 1, 0)]
+            await asyncio.sleep(entry.latency / self.speed)
+
+        record = json.loads(
+            zlib.decompress(self._mmap[entry.offset : entry.offset + entry.length])
+        )
+        return TransportResponse(entry.status, record["data"], record["headers"])
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._mmap.close()
+
+
+class CachingTransport:
+    """Transport caching responses of the wrapped transport.
+
+    Successful responses are cached for the TTL of the longest matching URL
+    prefix in `ttls` or `default_ttl`. Concurrent requests for the same URL
+    share one upstream request and upstream requests can be rate limited.
+    Cached responses are shared by all callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        limiter: RateLimiter | None = None,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.transport = transport
+        self.ttls = sorted((ttls or {}).items(), key=lambda item: -len(item[0]))
+        self.default_ttl = default_ttl
+        self.limiter = limiter
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[str, tuple[float, TransportResponse]] = OrderedDict()
+        self._pending: dict[str, asyncio.Task[TransportResponse]] = {}
+
+    def ttl(self, url: str) -> float:
+        """Return the cache TTL for the URL."""
+        for prefix, ttl in self.ttls:
+            if url.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Return the cached response or perform the request."""
+        key = str(url)
+        if (cached := self._cache.get(key)) is not None:
+            expires, response = cached
+            if time.monotonic() < expires:
+                self._cache.move_to_end(key)
+                self._count(hit=True)
+                return response
+            del self._cache[key]
+
+        if (pending := self._pending.get(key)) is not None:
+            self._count(hit=True)
+        else:
+            self._count(hit=False)
+            # The request runs in a task of its own, so a cancelled caller
+            # doesn't cancel the request for the other waiting callers
+            pending = self._pending[key] = asyncio.ensure_future(self._fetch(url, key))
+            pending.add_done_callback(_retrieve_exception)
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, url: URL, key: str) -> TransportResponse:
+        """Perform the upstream request and cache a successful response."""
+        try:
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            response = await self.transport.get(url)
+        finally:
+            del self._pending[key]
+
+        if response.status == HTTPStatus.OK.value:
+            self._cache[key] = (time.monotonic() + self.ttl(key), response)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return response
+
+    def _count(self, hit: bool) -> None:
+        """Count the cache hit or miss."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if (metrics := active_metrics()) is not None:
+            metrics.cache_requests.inc("hit" if hit else "miss")
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._cache.clear()
+
+
+def _retrieve_exception(task: asyncio.Task[TransportResponse]) -> None:
+    """Mark the exception of the request as retrieved when all callers left."""
+    if not task.cancelled():
+        task.exception()
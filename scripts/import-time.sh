@@ -0,0 +1,7 @@
+#!/bin/bash
+# Print the cumulative import time (in microseconds) of the gios package.
+
+for statement in "import gios" "from gios import Gios"; do
+	cumulative=$(python -X importtime -c "$statement" 2>&1 | awk -F'|' '$3 ~ /^ gios(\.client)?$/ {value=$2} END {print value+0}')
+	echo "$statement: ${cumulative}us"
+done
@@ -14,6 +14,8 @@ from syrupy.extensions.amber import AmberSnapshotExtension
 from syrupy.location import PyTestLocation
 
 BASE = "tests/fixtures/"
+API = "https://api.gios.gov.pl/pjp-api/v1/rest"
+STATION_ID = 552
 
 
 @pytest_asyncio.fixture(loop_scope="function")
@@ -101,6 +103,45 @@ def sensor_14688() -> dict[str, Any]:
         return json.load(file)
 
 
+@pytest.fixture
+def api_mock(
+    session_mock: aiointercept,
+    stations: dict[str, Any],
+    station: dict[str, Any],
+    indexes: dict[str, Any],
+    sensor_3759: dict[str, Any],
+    sensor_3760: dict[str, Any],
+    sensor_3761: dict[str, Any],
+    sensor_3762: dict[str, Any],
+    sensor_3764: dict[str, Any],
+    sensor_3765: dict[str, Any],
+    sensor_14688: dict[str, Any],
+) -> aiointercept:
+    """Register responses of all GIOS API endpoints for the fixture station."""
+    session_mock.get(
+        f"{API}/station/findAll?page=0&size=500", payload=stations, repeat=True
+    )
+    session_mock.get(
+        f"{API}/station/sensors/{STATION_ID}", payload=station, repeat=True
+    )
+    for sensor_id, payload in (
+        (3759, sensor_3759),
+        (3760, sensor_3760),
+        (3761, sensor_3761),
+        (3762, sensor_3762),
+        (3764, sensor_3764),
+        (3765, sensor_3765),
+        (14688, sensor_14688),
+    ):
+        session_mock.get(
+            f"{API}/data/getData/{sensor_id}", payload=payload, repeat=True
+        )
+    session_mock.get(
+        f"{API}/aqindex/getIndex/{STATION_ID}", payload=indexes, repeat=True
+    )
+    return session_mock
+
+
 @pytest.fixture
 def snapshot(snapshot: SnapshotAssertion) -> SnapshotAssertion:
     """Return snapshot assertion fixture."""
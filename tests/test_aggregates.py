@@ -0,0 +1,129 @@
+"""Tests for the rolling aggregates."""
+
+import random
+from datetime import datetime, timedelta
+
+import aiohttp
+import pytest
+
+from gios import Gios
+from gios.aggregates import (
+    AggregateEngine,
+    SensorAggregates,
+    SensorAggregator,
+    hour_number,
+)
+
+from .conftest import STATION_ID
+
+START = datetime(2025, 1, 1)  # noqa: DTZ001
+
+
+def entry(hour: int, value: float | None) -> dict[str, str | float | None]:
+    """Return a raw measurement entry for the hour since START."""
+    moment = START + timedelta(hours=hour)
+    return {"Data": moment.strftime("%Y-%m-%d %H:%M:%S"), "Wartość": value}
+
+
+def test_rolling_window_with_nulls_and_corrections() -> None:
+    """Test aggregates against a brute force computation."""
+    generator = random.Random(7)  # noqa: S311
+    aggregator = SensorAggregator(limit=50)
+    values: dict[int, float | None] = {}
+    base = hour_number(START.isoformat())
+
+    for hour in range(24 * 5):
+        value = None if generator.random() < 0.1 else generator.uniform(0, 100)
+        values[hour] = value
+        aggregator.add(base + hour, value)
+        if hour > 3 and generator.random() < 0.3:
+            corrected = hour - generator.randint(1, 3)
+            values[corrected] = generator.uniform(0, 100)
+            aggregator.add(base + corrected, values[corrected])
+
+        window = [
+            item
+            for past in range(hour - 23, hour + 1)
+            if (item := values.get(past)) is not None
+        ]
+        expected = sum(window) / len(window) if len(window) >= 18 else None
+        assert aggregator.results().mean_24h == pytest.approx(expected)
+
+    daily_means = [
+        [item for past in range(day * 24, day * 24 + 24) if (item := values[past])]
+        for day in range(5)
+    ]
+    exceedances = sum(
+        1 for day in daily_means if len(day) >= 18 and sum(day) / len(day) > 50
+    )
+    assert aggregator.results().exceedance_days == exceedances
+
+
+def test_retention() -> None:
+    """Test that days leaving the retention period are evicted."""
+    aggregator = SensorAggregator(limit=50, retention_days=2)
+    base = hour_number(START.isoformat())
+
+    for hour in range(24 * 3):
+        aggregator.add(base + hour, 100.0 if hour < 24 else 10.0)
+    assert aggregator.results().exceedance_days == 1
+
+    aggregator.add(base + 24 * 3, 10.0)
+    assert aggregator.results().exceedance_days == 0
+    assert not aggregator.add(base, 100.0)
+
+    # after a long gap only the new day is retained
+    aggregator.add(base + 24 * 30, 100.0)
+    assert aggregator.results().daily_mean == 100.0
+    assert not aggregator.add(base + 24 * 3, 100.0)
+
+
+def test_ozone_eight_hour_maximum() -> None:
+    """Test the daily maximum of 8-hour means."""
+    aggregator = SensorAggregator(limit=120, eight_hour=True)
+    base = hour_number("2025-07-04 00:00:00")
+
+    for hour in range(12):
+        aggregator.add(base + hour, 100.0 if hour < 8 else 200.0)
+
+    # hours 4-11: four values of 100 and four of 200
+    assert aggregator.results().max_8h_mean == 150.0
+    assert aggregator.results().exceedance_days == 1
+
+    for hour in range(8, 12):
+        aggregator.add(base + hour, 100.0)
+
+    assert aggregator.results().max_8h_mean == 100.0
+    assert aggregator.results().exceedance_days == 0
+
+
+def test_ingest_skips_known_entries() -> None:
+    """Test that known entries are skipped and late corrections are added."""
+    engine = AggregateEngine()
+    entries = [entry(hour, 10.0) for hour in reversed(range(72))]
+
+    assert engine.ingest(1, entries, "pm10") == 72
+    assert engine.ingest(1, entries, "pm10") == 0
+    assert engine.ingest(1, [entry(72, 34.0), *entries], "pm10") == 1
+    assert engine.results(1) == SensorAggregates(11.0, 34.0, None, 0)
+    assert engine.results(2) is None
+
+    # a correction more than 24 hours old changes the exceedance of its day
+    corrected = [entry(72, 34.0), *entries]
+    corrected[72 - 40] = entry(40, 1000.0)
+    assert engine.ingest(1, corrected, "pm10") == 1
+    assert engine.results(1) == SensorAggregates(11.0, 34.0, None, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_update_alongside_sensors(session: aiohttp.ClientSession) -> None:
+    """Test aggregates of sensors selected in the update."""
+    engine = AggregateEngine()
+    gios = await Gios.create(session, STATION_ID)
+    data = await gios.async_update()
+
+    results = engine.update(data, gios.sensor_entries)
+
+    assert set(results) == {"no", "no2", "nox", "o3", "pm10", "pm25"}
+    assert results["o3"].max_8h_mean is not None
@@ -0,0 +1,80 @@
+"""Tests for the local air quality index computation."""
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+
+from gios import Gios
+from gios.aqi import categories, index_levels, sensors_indexes, station_levels
+from gios.storage import MeasurementStore
+
+from .conftest import STATION_ID
+
+
+def test_index_levels() -> None:
+    """Test index levels at category boundaries."""
+    levels = index_levels("pm10", [0, 20, 20.1, 50, 80.1, 110, 150, 150.1, None])
+
+    assert list(levels) == [0, 0, 1, 1, 3, 3, 4, 5, -1]
+    assert categories(levels[:3]) == ["very_good", "very_good", "good"]
+    assert categories([-1]) == [None]
+
+
+def test_index_levels_history() -> None:
+    """Test that gaps in stored measurements get no index."""
+    with MeasurementStore() as store:
+        store.ingest(
+            3764,
+            [
+                {"Data": "2025-07-04 15:00:00", "Wartość": 60.0},
+                {"Data": "2025-07-04 14:00:00", "Wartość": None},
+                {"Data": "2025-07-04 13:00:00", "Wartość": 7.6},
+            ],
+        )
+        _, values = store.query(3764)
+
+    assert categories(index_levels("pm10", values)) == ["very_good", None, "moderate"]
+
+
+def test_station_levels_batch() -> None:
+    """Test the overall index across many stations."""
+    levels, aqi = station_levels(
+        {
+            "pm25": [5.0, 60.0, None],
+            "o3": [90.0, 10.0, None],
+            "no": [1.0, 2.0, 3.0],
+        }
+    )
+
+    assert set(levels) == {"pm25", "o3"}
+    assert categories(aqi) == ["good", "sufficient", None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_local_indexes(session: aiohttp.ClientSession) -> None:
+    """Test that local indexes match indexes from the GIOS API."""
+    gios = await Gios.create(session, STATION_ID)
+
+    remote = await gios.async_update()
+    local = await gios.async_update(local_indexes=True)
+
+    assert local == remote
+    assert sensors_indexes(remote) == (
+        {"no2": "very_good", "o3": "good", "pm10": "very_good", "pm25": "very_good"},
+        "good",
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_indexes_skip_request(
+    session: aiohttp.ClientSession, api_mock: aiointercept
+) -> None:
+    """Test that the index request is not sent with local indexes."""
+    gios = await Gios.create(session, STATION_ID)
+
+    await gios.async_update(local_indexes=True)
+
+    requested = {str(key[1]) for key in api_mock.requests}
+    assert any("getData" in url for url in requested)
+    assert not any("aqindex" in url for url in requested)
@@ -0,0 +1,148 @@
+"""Tests for the archival data downloader."""
+
+import csv
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import Gios
+from gios.archival import ArchivalDownloader, CsvSink
+from gios.storage import MeasurementStore
+
+from .conftest import API
+
+SENSOR_ID = 3764
+DAY_1 = datetime(2025, 1, 1)  # noqa: DTZ001
+DAY_2 = datetime(2025, 1, 2)  # noqa: DTZ001
+
+
+def archival_url(start: datetime, end: datetime, page: int) -> URL:
+    """Return the archival data URL."""
+    return URL(f"{API}/archivalData/getDataBySensor/{SENSOR_ID}").with_query(
+        dateFrom=start.strftime("%Y-%m-%d %H:%M"),
+        dateTo=end.strftime("%Y-%m-%d %H:%M"),
+        page=page,
+        size=2,
+    )
+
+
+def archival_page(start: datetime, hours: range, pages: int) -> dict[str, Any]:
+    """Return the archival data page."""
+    return {
+        "Lista archiwalnych wyników pomiarów": [
+            {
+                "Kod stanowiska": "MzWarKondrat-PM10-1g",
+                "Data": (start + timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M:%S"),
+                "Wartość": float(hour),
+            }
+            for hour in hours
+        ],
+        "totalPages": pages,
+    }
+
+
+@pytest.mark.asyncio
+async def test_download_and_resume(
+    session: aiohttp.ClientSession, session_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test that an interrupted backfill resumes with the failed window."""
+    end_1 = DAY_1 + timedelta(hours=23)
+    end_2 = DAY_2 + timedelta(hours=23)
+    session_mock.get(
+        archival_url(DAY_1, end_1, 0), payload=archival_page(DAY_1, range(2), 2)
+    )
+    session_mock.get(
+        archival_url(DAY_1, end_1, 1), payload=archival_page(DAY_1, range(2, 3), 2)
+    )
+    session_mock.get(
+        archival_url(DAY_2, end_2, 0), status=HTTPStatus.TOO_MANY_REQUESTS.value
+    )
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    gios = Gios(None, session)
+
+    with CsvSink(tmp_path / "archive.csv") as sink:
+        downloader = ArchivalDownloader(
+            gios,
+            sink,
+            checkpoint=checkpoint,
+            rate=1000,
+            window=timedelta(days=1),
+            page_size=2,
+        )
+        assert await downloader.async_download([SENSOR_ID], DAY_1, end_2) == 3
+    assert downloader.failed == [(SENSOR_ID, DAY_2, end_2)]
+
+    with (tmp_path / "archive.csv").open(encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["sensor_id", "timestamp", "value"]
+    assert sorted(row[1] for row in rows[1:]) == [
+        "2025-01-01 00:00:00",
+        "2025-01-01 01:00:00",
+        "2025-01-01 02:00:00",
+    ]
+
+    session_mock.get(
+        archival_url(DAY_2, end_2, 0), payload=archival_page(DAY_2, range(1), 1)
+    )
+    with MeasurementStore() as store:
+        downloader = ArchivalDownloader(
+            gios,
+            store,
+            checkpoint=checkpoint,
+            rate=1000,
+            window=timedelta(days=1),
+            page_size=2,
+        )
+        assert await downloader.async_download([SENSOR_ID], DAY_1, end_2) == 1
+        timestamps, _ = store.query(SENSOR_ID)
+
+    assert len(timestamps) == 1
+    assert not downloader.failed
+
+
+@pytest.mark.asyncio
+async def test_resume_failed_page(
+    session: aiohttp.ClientSession, session_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test that pages of a failed window aren't stored twice after resuming."""
+    end = DAY_1 + timedelta(hours=23)
+    session_mock.get(
+        archival_url(DAY_1, end, 0),
+        payload=archival_page(DAY_1, range(2), 2),
+        repeat=True,
+    )
+    session_mock.get(
+        archival_url(DAY_1, end, 1), status=HTTPStatus.TOO_MANY_REQUESTS.value
+    )
+    path = tmp_path / "archive.csv"
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    gios = Gios(None, session)
+
+    for expected in (0, 3):
+        with CsvSink(path) as sink:
+            downloader = ArchivalDownloader(
+                gios,
+                sink,
+                checkpoint=checkpoint,
+                rate=1000,
+                window=timedelta(days=1),
+                page_size=2,
+            )
+            assert await downloader.async_download([SENSOR_ID], DAY_1, end) == expected
+        session_mock.get(
+            archival_url(DAY_1, end, 1), payload=archival_page(DAY_1, range(2, 3), 2)
+        )
+
+    with path.open(encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file))
+    assert [row[1] for row in rows[1:]] == [
+        "2025-01-01 00:00:00",
+        "2025-01-01 01:00:00",
+        "2025-01-01 02:00:00",
+    ]
@@ -0,0 +1,53 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from gios import ApiError, CircuitOpenError
+from gios.breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
+
+
+async def fail(breaker: CircuitBreaker) -> None:
+    """Make a failing request through the breaker."""
+    with pytest.raises(ApiError):
+        async with breaker:
+            raise ApiError(str(HTTPStatus.INTERNAL_SERVER_ERROR.value))
+
+
+@pytest.mark.asyncio
+async def test_open_and_close() -> None:
+    """Test opening after failures and closing after a successful trial."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    await fail(breaker)
+    assert breaker.state == STATE_CLOSED
+    await fail(breaker)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        async with breaker:
+            pass
+
+    await asyncio.sleep(0.06)
+    assert breaker.state == STATE_HALF_OPEN
+    await fail(breaker)
+    assert breaker.state == STATE_OPEN
+
+    await asyncio.sleep(0.06)
+    async with breaker:
+        assert not breaker.allow()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_other_errors_not_counted() -> None:
+    """Test that errors other than request errors aren't failures."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(ZeroDivisionError):
+        async with breaker:
+            _ = 1 / 0
+
+    assert breaker.state == STATE_CLOSED
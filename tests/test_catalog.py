@@ -0,0 +1,45 @@
+"""Tests for the stations catalog."""
+
+from gios import GiosStation
+from gios.catalog import StationCatalog
+
+STATIONS = [
+    GiosStation(552, "Warszawa, ul. Kondratowicza", 52.290864, 21.042458),
+    GiosStation(562, "Żyrardów, ul. Roosevelta", 52.053811, 20.429892),
+    GiosStation(10121, "Kraków, ul. Bujaka", 50.010575, 19.949189),
+]
+
+
+def test_mapping_view() -> None:
+    """Test that the catalog behaves like a dict of stations."""
+    catalog = StationCatalog(STATIONS)
+
+    assert len(catalog) == 3
+    assert list(catalog) == [552, 562, 10121]
+    assert 562 in catalog
+    assert 1 not in catalog
+    assert catalog[552] == STATIONS[0]
+    assert catalog.get(1) is None
+    assert catalog == {station.id: station for station in STATIONS}
+    assert repr(catalog) == "StationCatalog(3 stations)"
+
+
+def test_replace_station() -> None:
+    """Test that adding a known station replaces it."""
+    catalog = StationCatalog(STATIONS)
+
+    catalog.add(552, "Warszawa", 52.0, 21.0)
+
+    assert len(catalog) == 3
+    assert catalog[552] == GiosStation(552, "Warszawa", 52.0, 21.0)
+
+
+def test_filters() -> None:
+    """Test bounding box and name prefix filters."""
+    catalog = StationCatalog(STATIONS)
+
+    assert catalog.within(52.0, 20.0, 53.0, 22.0) == [552, 562]
+    assert catalog.within(49.0, 14.0, 51.0, 20.0) == [10121]
+    assert catalog.name_startswith("żyr") == [562]
+    assert catalog.name_startswith("") == [552, 562, 10121]
+    assert list(catalog.latitudes) == [52.290864, 52.053811, 50.010575]
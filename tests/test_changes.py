@@ -0,0 +1,79 @@
+"""Tests for the change feed."""
+
+import json
+from dataclasses import replace
+
+import aiohttp
+import pytest
+
+from gios import Gios, GiosSensors, Sensor
+from gios.changes import ChangeFeed, PollutantChange
+
+from .conftest import STATION_ID
+
+EMPTY = GiosSensors(None, None, None, None, None, None, None, None, None, None)
+
+
+def test_diff() -> None:
+    """Test changes between consecutive updates."""
+    feed = ChangeFeed()
+    first = replace(
+        EMPTY,
+        no2=Sensor("nitrogen dioxide", 3760, "good", 15.5),
+        pm10=Sensor("particulate matter 10", 3764, "good", 20.0),
+    )
+    second = replace(
+        first,
+        no2=Sensor("nitrogen dioxide", 3760, "moderate", 15.5),
+        pm10=None,
+        o3=Sensor("ozone", 3762, None, 80.0),
+    )
+
+    assert [change.pollutant for change in feed.diff(1, first)] == ["no2", "pm10"]
+    assert feed.diff(1, first) == []
+    assert feed.diff(2, first) != []
+    assert feed.diff(1, second) == [
+        PollutantChange(1, "no2", ("index",), 15.5, "moderate", 3760),
+        PollutantChange(1, "o3", ("value", "sensor_id"), 80.0, None, 3762),
+        PollutantChange(1, "pm10", ("value", "index", "sensor_id"), None, None, None),
+    ]
+
+    feed.reset(1)
+    assert len(feed.diff(1, second)) == 2
+    feed.reset()
+    assert len(feed.diff(2, first)) == 2
+
+
+def test_serializable() -> None:
+    """Test the change as a JSON serializable dictionary."""
+    change = PollutantChange(1, "no2", ("index",), 15.5, "moderate", 3760)
+
+    assert json.loads(json.dumps(change.as_dict())) == {
+        "station_id": 1,
+        "pollutant": "no2",
+        "changed": ["index"],
+        "value": 15.5,
+        "index": "moderate",
+        "sensor_id": 3760,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_update(session: aiohttp.ClientSession) -> None:
+    """Test changes of consecutive station updates."""
+    feed = ChangeFeed()
+    gios = await Gios.create(session, STATION_ID)
+
+    changes = await feed.async_update(gios)
+
+    assert {change.pollutant for change in changes} == {
+        "aqi",
+        "no",
+        "no2",
+        "nox",
+        "o3",
+        "pm10",
+        "pm25",
+    }
+    assert await feed.async_update(gios) == []
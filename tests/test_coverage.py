@@ -0,0 +1,62 @@
+"""Tests for the pollutant coverage index."""
+
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+
+from gios import Gios, GiosStation
+from gios.catalog import StationCatalog
+from gios.coverage import CoverageIndex
+from gios.sensor_index import SensorIndex, SensorInfo
+
+from .conftest import API, STATION_ID
+
+PM25 = SensorInfo(1, "pył zawieszony PM2.5", "PM2.5")
+BENZENE = SensorInfo(2, "benzen", "C6H6")
+
+
+def test_nearest_measuring() -> None:
+    """Test nearest stations measuring a pollutant."""
+    catalog = StationCatalog(
+        [
+            GiosStation(1, "West", 52.0, 20.0),
+            GiosStation(2, "East", 52.0, 21.0),
+            GiosStation(3, "South", 50.0, 20.5),
+        ]
+    )
+    sensor_index = SensorIndex()
+    sensor_index.set(1, [PM25])
+    sensor_index.set(3, [PM25, BENZENE])
+    sensor_index.set(4, [BENZENE])
+    coverage = CoverageIndex(catalog, sensor_index)
+
+    assert coverage.stations_measuring("benzen") == [3]
+    assert coverage.stations_measuring("pm25") == [1, 3]
+    assert coverage.stations_measuring("so2") == []
+    assert [station for station, _ in coverage.nearest(52.0, 21.0, "pm25", 2)] == [
+        1,
+        3,
+    ]
+    assert coverage.nearest(52.0, 21.0, "c6h6")[0][0] == 3
+    assert coverage.nearest(52.0, 21.0, "so2") == []
+
+    sensor_index.set(2, [BENZENE])
+    assert coverage.nearest(52.0, 21.0, "c6h6")[0] == (2, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_find_nearest(
+    session: aiohttp.ClientSession, api_mock: aiointercept
+) -> None:
+    """Test finding the nearest station with sensors fetched on demand."""
+    api_mock.get(
+        f"{API}/station/sensors/562", status=HTTPStatus.NOT_FOUND.value, repeat=True
+    )
+    gios = await Gios.create(session)
+
+    nearest = await gios.async_find_nearest(52.05, 20.43, "o3")
+
+    assert [station for station, _ in nearest] == [STATION_ID]
+    assert gios.coverage is gios.coverage
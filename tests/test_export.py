@@ -0,0 +1,133 @@
+"""Tests for the columnar export."""
+
+import csv
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from gios import GiosSensors, GiosStation, Sensor
+from gios.export import COLUMNS, ExportFormat, export_snapshots
+
+TIMESTAMP = datetime(2025, 7, 4, 15, tzinfo=UTC)
+
+
+def make_sensors(**sensors: Sensor) -> GiosSensors:
+    """Return GiosSensors with the given pollutants set."""
+    data: dict[str, Sensor | None] = dict.fromkeys(
+        ("aqi", "c6h6", "co", "no", "no2", "nox", "o3", "pm10", "pm25", "so2")
+    )
+    data.update(sensors)
+    return GiosSensors(**data)
+
+
+def test_export_csv(tmp_path: Path) -> None:
+    """Test streaming CSV export of many stations."""
+    snapshots = (
+        (
+            GiosStation(552, "Warszawa, ul. Kondratowicza", 52.290864, 21.042458),
+            make_sensors(
+                aqi=Sensor("AQI", None, value="good"),
+                pm10=Sensor("particulate matter 10", 3764, "very_good", 7.6),
+            ),
+        ),
+        (
+            GiosStation(562, "Żyrardów, ul. Roosevelta", 52.053811, 20.429892),
+            make_sensors(o3=Sensor("ozone", 3770, None, 83.9)),
+        ),
+    )
+    path = tmp_path / "fleet.csv"
+
+    fmt = export_snapshots(iter(snapshots), path, TIMESTAMP, fmt="csv")
+
+    assert fmt == "csv"
+    with path.open(encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file))
+    assert tuple(rows[0]) == COLUMNS
+    assert rows[1:] == [
+        [
+            "552",
+            "Warszawa, ul. Kondratowicza",
+            "52.290864",
+            "21.042458",
+            "aqi",
+            "",
+            "good",
+            "2025-07-04T15:00:00+00:00",
+        ],
+        [
+            "552",
+            "Warszawa, ul. Kondratowicza",
+            "52.290864",
+            "21.042458",
+            "pm10",
+            "7.6",
+            "very_good",
+            "2025-07-04T15:00:00+00:00",
+        ],
+        [
+            "562",
+            "Żyrardów, ul. Roosevelta",
+            "52.053811",
+            "20.429892",
+            "o3",
+            "83.9",
+            "",
+            "2025-07-04T15:00:00+00:00",
+        ],
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_export_arrow(tmp_path: Path, fmt: ExportFormat) -> None:
+    """Test Arrow IPC and Parquet export split into record batches."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    snapshots = [
+        (
+            GiosStation(station_id, f"Station {station_id}", 52.0, 21.0),
+            make_sensors(
+                aqi=Sensor("AQI", None, value="good"),
+                pm10=Sensor("particulate matter 10", 3764, "very_good", 7.6),
+            ),
+        )
+        for station_id in range(5)
+    ]
+    path = tmp_path / f"fleet.{fmt}"
+
+    assert export_snapshots(snapshots, path, TIMESTAMP, fmt=fmt, batch_size=4) == fmt
+
+    if fmt == "parquet":
+        file = pq.ParquetFile(path)
+        batches = file.num_row_groups
+        table = file.read()
+    else:
+        reader = pa.ipc.open_file(path)
+        batches = reader.num_record_batches
+        table = reader.read_all()
+    assert batches == 3
+    assert tuple(table.column_names) == COLUMNS
+    assert table.num_rows == 10
+    rows = table.to_pylist()
+    assert rows[0]["pollutant"] == "aqi"
+    assert rows[0]["value"] is None
+    assert rows[0]["index"] == "good"
+    assert rows[1]["value"] == 7.6
+    assert rows[1]["timestamp"] == TIMESTAMP
+    assert rows[-1]["station_id"] == 4
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_export_arrow_empty(tmp_path: Path, fmt: ExportFormat) -> None:
+    """Test Arrow IPC and Parquet export without snapshots."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / f"fleet.{fmt}"
+
+    export_snapshots([], path, TIMESTAMP, fmt=fmt)
+
+    table = (
+        pq.read_table(path) if fmt == "parquet" else pa.ipc.open_file(path).read_all()
+    )
+    assert tuple(table.column_names) == COLUMNS
+    assert table.num_rows == 0
@@ -0,0 +1,145 @@
+"""Tests for the caching gateway."""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import Gios
+from gios.const import STATIONS_PAGE_SIZE
+from gios.gateway import API_PATH, Gateway
+from gios.synthetic import FIRST_STATION_ID, SyntheticNetwork, SyntheticTransport
+from gios.transport import CachingTransport, SessionTransport, TransportResponse
+
+from .conftest import API, STATION_ID
+
+
+@pytest.mark.asyncio
+async def test_gios_through_gateway(
+    session: aiohttp.ClientSession, api_mock: aiointercept
+) -> None:
+    """Test that Gios pointed at the gateway shares its cache."""
+    gateway = Gateway(session)
+    async with TestServer(gateway.app) as server:
+        base_url = str(server.make_url(API_PATH))
+        gios = await Gios.create(session, STATION_ID, base_url=base_url)
+        first = await gios.async_update()
+
+        other = await Gios.create(session, STATION_ID, base_url=base_url)
+        assert await other.async_update() == first
+
+        async with session.get(server.make_url(f"/snapshot/{STATION_ID}")) as resp:
+            snapshot = await resp.json()
+        async with session.get(server.make_url("/snapshot/1")) as resp:
+            assert resp.status == HTTPStatus.NOT_FOUND.value
+
+    assert snapshot["name"] == "Warszawa, ul. Kondratowicza"
+    assert snapshot["sensors"]["pm10"]["value"] == 7.6
+    assert "so2" not in snapshot["sensors"]
+    requests = api_mock.requests[("GET", URL(f"{API}/data/getData/3764"))]
+    assert len(requests) == 1
+    assert gateway.transport.hits > gateway.transport.misses
+
+
+@pytest.mark.asyncio
+async def test_gateway_errors(
+    session: aiohttp.ClientSession, session_mock: aiointercept
+) -> None:
+    """Test passing upstream errors through the gateway."""
+    session_mock.get(
+        f"{API}/aqindex/getIndex/{STATION_ID}",
+        status=HTTPStatus.TOO_MANY_REQUESTS.value,
+        headers={"Retry-After": "30"},
+    )
+    gateway = Gateway(session)
+    async with TestServer(gateway.app) as server:
+        url = server.make_url(f"{API_PATH}/aqindex/getIndex/{STATION_ID}")
+        async with session.get(url) as resp:
+            assert resp.status == HTTPStatus.TOO_MANY_REQUESTS.value
+            assert resp.headers["Retry-After"] == "30"
+        async with session.get(url) as resp:
+            assert resp.status == HTTPStatus.BAD_GATEWAY.value
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_caching_transport_coalescing(session: aiohttp.ClientSession) -> None:
+    """Test that concurrent requests share one upstream request."""
+    upstream = SessionTransport(session)
+    transport = CachingTransport(upstream, {API: 0}, default_ttl=60)
+    url = URL(f"{API}/aqindex/getIndex/{STATION_ID}")
+
+    responses = await asyncio.gather(*(transport.get(url) for _ in range(5)))
+
+    assert all(response.data == responses[0].data for response in responses)
+    assert transport.misses == 1
+    assert transport.ttl(str(url)) == 0
+    assert transport.ttl("http://localhost/") == 60
+    await transport.get(url)
+    assert transport.misses == 2
+
+
+class GatedTransport:
+    """Transport answering the requests once released."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requested = asyncio.Event()
+        self.released = asyncio.Event()
+        self.requests = 0
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Wait for the release and return the response."""
+        self.requests += 1
+        self.requested.set()
+        await self.released.wait()
+        return TransportResponse(HTTPStatus.OK.value, {"url": str(url)})
+
+
+@pytest.mark.asyncio
+async def test_caching_transport_cancelled_caller() -> None:
+    """Test that a cancelled caller doesn't cancel the request for others."""
+    upstream = GatedTransport()
+    transport = CachingTransport(upstream)
+    url = URL(f"{API}/aqindex/getIndex/{STATION_ID}")
+
+    first = asyncio.create_task(transport.get(url))
+    await upstream.requested.wait()
+    second = asyncio.create_task(transport.get(url))
+    await asyncio.sleep(0)
+    first.cancel()
+    upstream.released.set()
+
+    response = await second
+    assert first.cancelled()
+    assert response.data == {"url": str(url)}
+    assert upstream.requests == 1
+    assert await transport.get(url) is response
+
+
+@pytest.mark.asyncio
+async def test_stations_pages_through_gateway(session: aiohttp.ClientSession) -> None:
+    """Test that cached stations pages aren't modified by catalog refreshes."""
+    network = SyntheticNetwork(stations=STATIONS_PAGE_SIZE + 100)
+    gateway = Gateway(session, transport=SyntheticTransport(network))
+    async with TestServer(gateway.app) as server:
+        async with session.get(
+            server.make_url(f"/snapshot/{FIRST_STATION_ID}")
+        ) as resp:
+            assert resp.status == HTTPStatus.OK.value
+        # refresh the catalog from the cached pages
+        gios = await Gios.create(session, transport=gateway.transport)
+        assert len(gios.measurement_stations) == network.stations
+
+        url = server.make_url(f"{API_PATH}/station/findAll").with_query(
+            page=0, size=STATIONS_PAGE_SIZE
+        )
+        async with session.get(url) as resp:
+            page = await resp.json()
+
+    assert len(page["Lista stacji pomiarowych"]) == STATIONS_PAGE_SIZE
+    assert gateway.transport.hits
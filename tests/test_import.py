@@ -0,0 +1,51 @@
+"""Import time benchmarks for gios package."""
+
+import subprocess
+import sys
+
+import pytest
+
+HTTP_STACK = ("aiohttp", "dacite", "yarl")
+
+
+def import_time(statement: str) -> dict[str, int]:
+    """Return cumulative import time in microseconds per imported module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import gios",
+        "from gios import ApiError, GiosSensors, GiosStation",
+        "import gios.const, gios.exceptions, gios.model",
+    ],
+)
+def test_import_without_http_stack(statement: str) -> None:
+    """Test that models, exceptions and constants don't load the HTTP stack."""
+    modules = import_time(statement)
+
+    assert "gios" in modules
+    for name in modules:
+        assert name.split(".")[0] not in HTTP_STACK
+
+
+def test_import_client_defers_dacite() -> None:
+    """Test that the client loads aiohttp but defers dacite."""
+    modules = import_time("from gios import Gios")
+
+    assert "gios.client" in modules
+    assert "aiohttp" in modules
+    assert "dacite" not in modules
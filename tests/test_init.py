@@ -1,5 +1,6 @@
 """Tests for gios package."""
 
+import asyncio
 from http import HTTPStatus
 from typing import Any
 
@@ -7,8 +8,12 @@ import aiohttp
 import pytest
 from aiointercept import aiointercept
 from syrupy import SnapshotAssertion
+from yarl import URL
 
 from gios import ApiError, Gios, InvalidSensorsDataError, NoStationError
+from gios.transport import SessionTransport, TransportResponse
+
+from .conftest import API
 
 INVALID_STATION_ID = 0
 
@@ -40,7 +45,7 @@ async def test_init_only(
     assert gios.station_id is None
     assert gios.latitude is None
     assert gios.longitude is None
-    assert gios.measurement_stations == snapshot
+    assert dict(gios.measurement_stations) == snapshot
 
 
 @pytest.mark.asyncio
@@ -108,8 +113,9 @@ async def test_valid_data_first_value(
     assert gios.station_id == VALID_STATION_ID
     assert gios.latitude == VALID_LATITUDE
     assert gios.longitude == VALID_LONGITUDE
-    assert gios.measurement_stations == snapshot
+    assert dict(gios.measurement_stations) == snapshot
     assert data == snapshot
+    assert set(gios.sensor_entries) == {3759, 3760, 3761, 3762, 3764, 14688}
 
 
 @pytest.mark.asyncio
@@ -198,7 +204,7 @@ async def test_valid_data_second_value(
     assert gios.station_id == VALID_STATION_ID
     assert gios.latitude == VALID_LATITUDE
     assert gios.longitude == VALID_LONGITUDE
-    assert gios.measurement_stations == snapshot
+    assert dict(gios.measurement_stations) == snapshot
     assert data == snapshot
 
 
@@ -266,7 +272,7 @@ async def test_no_indexes_data(
     assert gios.station_id == VALID_STATION_ID
     assert gios.latitude == VALID_LATITUDE
     assert gios.longitude == VALID_LONGITUDE
-    assert gios.measurement_stations == snapshot
+    assert dict(gios.measurement_stations) == snapshot
     assert data == snapshot
 
 
@@ -774,3 +780,124 @@ async def test_zero_value_not_treated_as_missing(
 
     assert data.no is not None
     assert data.no.value == 0.0
+
+
+class SlowTransport(SessionTransport):
+    """Transport delaying responses of selected URLs."""
+
+    def __init__(self, session: aiohttp.ClientSession, slow: set[str]) -> None:
+        """Initialize."""
+        super().__init__(session)
+        self.slow = slow
+        self.requests: list[str] = []
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Retrieve data, wait first if the URL is slow."""
+        self.requests.append(str(url))
+        if str(url) in self.slow:
+            await asyncio.sleep(10)
+        return await super().get(url)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_partial_update_complete(session: aiohttp.ClientSession) -> None:
+    """Test partial update with all stages in time."""
+    gios = await Gios.create(session, VALID_STATION_ID)
+
+    result = await gios.async_update_partial(5)
+
+    assert result.complete
+    assert result.sensors == await gios.async_update()
+    assert result.measured["pm25"] == "2025-07-04 15:00:00"
+    assert set(result.measured) == {"no", "no2", "nox", "o3", "pm10", "pm25"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_partial_update_slow_stages(session: aiohttp.ClientSession) -> None:
+    """Test partial update with slow sensor and indexes requests."""
+    transport = SlowTransport(
+        session,
+        {f"{API}/data/getData/3764", f"{API}/aqindex/getIndex/{VALID_STATION_ID}"},
+    )
+    gios = await Gios.create(session, VALID_STATION_ID, transport)
+
+    result = await gios.async_update_partial(0.2)
+
+    assert not result.complete
+    assert result.errors == {"pm10": "Timeout", "indexes": "Timeout"}
+    assert result.sensors is not None
+    assert result.sensors.pm10 is None
+    assert result.sensors.aqi is None
+    assert result.sensors.no2 is not None
+    assert result.sensors.no2.value is not None
+    assert result.sensors.no2.index is None
+
+
+@pytest.mark.asyncio
+async def test_partial_update_api_errors(
+    session: aiohttp.ClientSession,
+    session_mock: aiointercept,
+    stations: dict[str, Any],
+) -> None:
+    """Test partial update when the station request fails."""
+    session_mock.get(f"{API}/station/findAll?page=0&size=500", payload=stations)
+    session_mock.get(
+        f"{API}/station/sensors/{VALID_STATION_ID}",
+        status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
+    )
+    gios = await Gios.create(session, VALID_STATION_ID)
+
+    result = await gios.async_update_partial(1)
+
+    assert result.sensors is None
+    assert result.errors == {"station": "500"}
+
+
+@pytest.mark.asyncio
+async def test_iter_updates(
+    session: aiohttp.ClientSession, api_mock: aiointercept
+) -> None:
+    """Test streaming results of many stations."""
+    api_mock.get(
+        f"{API}/station/sensors/562",
+        status=HTTPStatus.NOT_FOUND.value,
+        repeat=True,
+    )
+    gios = await Gios.create(session)
+    expected = await gios.for_station(VALID_STATION_ID).async_update()
+
+    results = dict(
+        [item async for item in gios.async_iter_updates([VALID_STATION_ID, 562, 1])]
+    )
+
+    assert results[VALID_STATION_ID] == expected
+    assert isinstance(results[562], ApiError)
+    assert isinstance(results[1], NoStationError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_iter_updates_backpressure(session: aiohttp.ClientSession) -> None:
+    """Test that updates wait for a slow consumer and stop when it's done."""
+    transport = SlowTransport(session, set())
+    gios = await Gios.create(session, transport=transport)
+    updates = gios.async_iter_updates([VALID_STATION_ID] * 10, concurrency=2)
+
+    index_url = f"{API}/aqindex/getIndex/{VALID_STATION_ID}"
+
+    station_id, _ = await anext(updates)
+    await asyncio.sleep(0.1)
+
+    assert station_id == VALID_STATION_ID
+    # the consumed result and one waiting for the consumer
+    assert transport.requests.count(index_url) == 2
+
+    await anext(updates)
+    await asyncio.sleep(0.1)
+    assert transport.requests.count(index_url) == 3
+
+    await updates.aclose()
+    await asyncio.sleep(0.1)
+    assert transport.requests.count(index_url) == 3
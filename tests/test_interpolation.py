@@ -0,0 +1,82 @@
+"""Tests for the spatial interpolation."""
+
+import math
+
+import pytest
+
+from gios import GiosSensors, GiosStation, Sensor
+from gios.catalog import StationCatalog
+from gios.interpolation import IdwEstimator
+
+STATIONS = {
+    1: GiosStation(1, "West", 52.0, 20.0),
+    2: GiosStation(2, "East", 52.0, 21.0),
+    3: GiosStation(3, "South", 50.0, 20.5),
+}
+
+
+def test_distances() -> None:
+    """Test great-circle distances from a point."""
+    distances = StationCatalog(STATIONS.values()).distances(52.0, 20.0)
+
+    assert distances[0] == 0
+    assert distances[1] == pytest.approx(68.5, abs=0.1)
+    assert distances[2] == pytest.approx(225.1, abs=0.1)
+
+
+def test_estimate() -> None:
+    """Test inverse distance weighting with a neighbor cutoff."""
+    estimator = IdwEstimator(STATIONS, neighbors=2)
+    weights = estimator.weights([(52.0, 20.5), (52.0, 20.0), (50.0, 20.5)])
+
+    assert len(weights) == 3
+    assert list(estimator.estimate(weights, {1: 10.0, 2: 20.0, 3: 100.0})) == [
+        pytest.approx(15.0),
+        10.0,
+        100.0,
+    ]
+    # a station without value is skipped
+    assert list(estimator.estimate(weights, {1: 10.0, 3: None}))[:2] == [10.0, 10.0]
+    # a station at the query point without value falls back to other neighbors
+    assert estimator.estimate(weights, {1: None, 2: 20.0})[1] == 20.0
+    assert math.isnan(estimator.estimate(weights, {})[0])
+
+
+def test_candidate_stations() -> None:
+    """Test that neighbors are chosen among the given stations."""
+    estimator = IdwEstimator(STATIONS, neighbors=1)
+    values = {3: 100.0}
+
+    assert math.isnan(estimator.estimate(estimator.weights([(52.0, 20.0)]), values)[0])
+    weights = estimator.weights([(52.0, 20.0)], [3, 4])
+    assert list(weights.indices) == [2]
+    assert estimator.estimate(weights, values)[0] == 100.0
+
+
+def test_max_distance() -> None:
+    """Test that stations beyond the maximum distance are ignored."""
+    estimator = IdwEstimator(STATIONS, max_distance=50)
+    weights = estimator.weights([(52.0, 20.1), (54.0, 20.0)])
+
+    result = estimator.estimate(weights, {1: 10.0, 2: 20.0, 3: 30.0})
+
+    assert result[0] == 10.0
+    assert math.isnan(result[1])
+
+
+def test_estimate_pollutant() -> None:
+    """Test estimation from GiosSensors of many stations."""
+    empty = dict.fromkeys(
+        ("aqi", "c6h6", "co", "no", "no2", "nox", "o3", "pm10", "pm25", "so2")
+    )
+    sensors = {
+        1: GiosSensors(**{**empty, "pm10": Sensor("pm10", 11, value=10.0)}),
+        2: GiosSensors(**{**empty, "pm10": Sensor("pm10", 12, value=30.0)}),
+        3: GiosSensors(**empty),
+    }
+    estimator = IdwEstimator(STATIONS, neighbors=3)
+    weights = estimator.weights([(52.0, 20.5)])
+
+    assert estimator.estimate_pollutant(weights, sensors, "pm10")[0] == pytest.approx(
+        20.0
+    )
@@ -0,0 +1,84 @@
+"""Tests for the command line interface."""
+
+import io
+import json
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+
+from gios.__main__ import parse_args, run
+
+from .conftest import API, STATION_ID
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_dump_stations(session: aiohttp.ClientSession) -> None:
+    """Test dumping the stations catalog."""
+    out = io.StringIO()
+
+    assert await run(parse_args(["stations"]), session, out) == 0
+
+    stations = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [station["id"] for station in stations] == [552, 562]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_dump_station(session: aiohttp.ClientSession) -> None:
+    """Test dumping one station readings."""
+    out = io.StringIO()
+    err = io.StringIO()
+
+    assert await run(parse_args(["station", str(STATION_ID)]), session, out, err) == 0
+
+    (record,) = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert record["station_id"] == STATION_ID
+    assert record["data"]["pm10"]["value"] == 7.6
+    summary = json.loads(err.getvalue())
+    assert summary["stations"] == 1
+    assert summary["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dump_all(session: aiohttp.ClientSession, api_mock: aiointercept) -> None:
+    """Test dumping all stations with failures reported per station."""
+    api_mock.get(f"{API}/station/sensors/562", status=HTTPStatus.NOT_FOUND.value)
+    out = io.StringIO()
+    err = io.StringIO()
+
+    exit_code = await run(parse_args(["--concurrency", "2", "all"]), session, out, err)
+
+    assert exit_code == 0
+    records = {
+        record["station_id"]: record
+        for record in map(json.loads, out.getvalue().splitlines())
+    }
+    assert records[STATION_ID]["data"]["o3"]["value"] == 83.9
+    assert "ApiError" in records[562]["error"]
+    summary = json.loads(err.getvalue())
+    assert summary["stations"] == 2
+    assert summary["failed"] == 1
+    assert "latency_p95" in summary
+
+
+@pytest.mark.asyncio
+async def test_dump_nothing(
+    session: aiohttp.ClientSession, session_mock: aiointercept
+) -> None:
+    """Test that an empty stations catalog isn't a failure."""
+    session_mock.get(
+        f"{API}/station/findAll?page=0&size=500",
+        payload={"Lista stacji pomiarowych": [], "totalPages": 1},
+    )
+    out = io.StringIO()
+    err = io.StringIO()
+
+    assert await run(parse_args(["all"]), session, out, err) == 0
+
+    assert not out.getvalue()
+    summary = json.loads(err.getvalue())
+    assert summary["stations"] == 0
+    assert "stations_per_second" not in summary
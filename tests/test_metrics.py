@@ -0,0 +1,111 @@
+"""Tests for library metrics."""
+
+from collections.abc import Generator
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import ApiError, Gios
+from gios.gateway import API_PATH, Gateway
+from gios.metrics import (
+    GiosMetrics,
+    MetricsRegistry,
+    disable_metrics,
+    enable_metrics,
+    endpoint_name,
+)
+
+from .conftest import API, STATION_ID
+
+
+@pytest.fixture
+def metrics() -> Generator[GiosMetrics]:
+    """Enable library metrics for the test."""
+    yield enable_metrics()
+    disable_metrics()
+
+
+def test_render() -> None:
+    """Test the OpenMetrics text format."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ("status",))
+    histogram = registry.histogram("latency_seconds", "Latency.", (), (0.1, 1))
+    counter.inc("200")
+    counter.inc("200")
+    counter.inc('5"0\\0', amount=0.5)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(2)
+
+    assert registry.counter("requests", "Requests.") is counter
+    with pytest.raises(TypeError):
+        registry.histogram("requests", "Requests.")
+    assert registry.render() == (
+        "# TYPE requests counter\n"
+        "# HELP requests Requests.\n"
+        'requests_total{status="200"} 2\n'
+        'requests_total{status="5\\"0\\\\0"} 0.5\n'
+        "# TYPE latency_seconds histogram\n"
+        "# HELP latency_seconds Latency.\n"
+        'latency_seconds_bucket{le="0.1"} 1\n'
+        'latency_seconds_bucket{le="1"} 2\n'
+        'latency_seconds_bucket{le="+Inf"} 3\n'
+        "latency_seconds_count 3\n"
+        "latency_seconds_sum 2.55\n"
+        "# EOF\n"
+    )
+
+
+def test_endpoint_name() -> None:
+    """Test endpoint labels without IDs."""
+    assert endpoint_name(URL(f"{API}/data/getData/3764")) == "data/getData"
+    assert (
+        endpoint_name(URL(f"{API}/station/findAll?page=0&size=500"))
+        == "station/findAll"
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_metrics(
+    session: aiohttp.ClientSession, api_mock: aiointercept, metrics: GiosMetrics
+) -> None:
+    """Test metrics of requests, updates and the gateway cache."""
+    api_mock.get(
+        f"{API}/station/sensors/562",
+        status=HTTPStatus.NOT_FOUND.value,
+    )
+    gateway = Gateway(session)
+    async with TestServer(gateway.app) as server:
+        gios = await Gios.create(
+            session, STATION_ID, base_url=str(server.make_url(API_PATH))
+        )
+        await gios.async_update()
+        await gios.async_update()
+        with pytest.raises(ApiError, match="404"):
+            await gios.for_station(562).async_update()
+
+        async with session.get(server.make_url("/metrics")) as resp:
+            text = await resp.text()
+
+    assert metrics.requests.value("data/getData", "200") == 14
+    assert metrics.requests.value("station/sensors", "404") == 1
+    assert metrics.request_duration.count("aqindex/getIndex") == 2
+    assert metrics.updates.value("ok") == 2
+    assert metrics.updates.value("error") == 1
+    assert metrics.cache_requests.value("hit") > 0
+    assert 'gios_updates_total{result="ok"} 2' in text
+    assert text.endswith("# EOF\n")
+
+
+@pytest.mark.asyncio
+async def test_gateway_without_metrics(session: aiohttp.ClientSession) -> None:
+    """Test that the gateway doesn't serve disabled metrics."""
+    async with (
+        TestServer(Gateway(session).app) as server,
+        session.get(server.make_url("/metrics")) as resp,
+    ):
+        assert resp.status == HTTPStatus.NOT_FOUND.value
@@ -0,0 +1,47 @@
+"""Tests for normalization of GIOS API data."""
+
+from datetime import datetime
+
+from gios.const import ATTR_INDEX_LEVEL
+from gios.normalize import (
+    cache_info,
+    clear_caches,
+    hour_number,
+    index_level_key,
+    parse_timestamp,
+    pollutant_key,
+    to_epoch,
+)
+
+
+def test_timestamps() -> None:
+    """Test conversion of timestamps."""
+    moment = parse_timestamp("2025-07-04 15:00:00")
+
+    assert moment.replace(tzinfo=None) == datetime(2025, 7, 4, 15)  # noqa: DTZ001
+    assert moment.utcoffset() is not None
+    assert to_epoch("2025-07-04 15:00:00") == 1751634000
+    assert hour_number("2025-07-04 15:00:00") == hour_number("2025-07-03 15:00:00") + 24
+
+
+def test_keys() -> None:
+    """Test pollutant keys."""
+    assert pollutant_key("PM2.5") == "pm25"
+    assert pollutant_key("pm2.5") == "pm25"
+    assert index_level_key("pm2.5") == ATTR_INDEX_LEVEL.format("PM2.5")
+
+
+def test_cache() -> None:
+    """Test that repeated timestamps are parsed once."""
+    clear_caches()
+
+    for _ in range(3):
+        to_epoch("2025-07-04 14:00:00")
+        to_epoch("2025-07-04 15:00:00")
+
+    info = cache_info()
+    assert info["to_epoch"][:2] == (4, 2)
+    assert info["parse_timestamp"][:2] == (0, 2)
+
+    clear_caches()
+    assert cache_info()["to_epoch"][3] == 0
@@ -0,0 +1,20 @@
+"""Tests for the rate limiter."""
+
+import time
+
+import pytest
+
+from gios.ratelimit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter() -> None:
+    """Test that requests beyond the burst are spaced by the rate."""
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+
+    for _ in range(4):
+        async with limiter:
+            pass
+
+    assert time.monotonic() - start >= 0.035
@@ -0,0 +1,100 @@
+"""Tests for retries of failed requests."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from yarl import URL
+
+from gios import ApiError, Gios
+from gios.retry import RetryBudget, RetryPolicy, parse_retry_after
+from gios.transport import SessionTransport, TransportResponse
+
+from .conftest import API, STATION_ID
+
+SENSOR_URL = f"{API}/data/getData/3764"
+
+
+class FailingTransport(SessionTransport):
+    """Transport failing the first requests of a URL."""
+
+    def __init__(self, session: aiohttp.ClientSession, url: str, failures: int) -> None:
+        """Initialize."""
+        super().__init__(session)
+        self.url = url
+        self.failures = failures
+        self.requests: list[str] = []
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Retrieve data or fail."""
+        self.requests.append(str(url))
+        if str(url) == self.url and self.failures:
+            self.failures -= 1
+            return TransportResponse(
+                HTTPStatus.SERVICE_UNAVAILABLE.value, headers={"Retry-After": "0"}
+            )
+        return await super().get(url)
+
+
+def test_delay() -> None:
+    """Test backoff delays and Retry-After."""
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    moment = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+
+    assert [policy.delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    assert policy.delay(0, "2") == 2
+    assert policy.delay(0, moment) == 5
+    assert 0 <= RetryPolicy(base_delay=1).delay(3) <= 8
+    assert parse_retry_after("invalid") is None
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("-1") == 0
+
+
+def test_budget() -> None:
+    """Test that retries are limited to a share of requests."""
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+    policy = RetryPolicy(attempts=5, budget=budget)
+
+    assert policy.allow(0)
+    assert not policy.allow(0)
+    budget.deposit()
+    assert not policy.allow(0)
+    budget.deposit()
+    assert policy.allow(0)
+    assert not policy.allow(4)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_retry_failed_request(session: aiohttp.ClientSession) -> None:
+    """Test that only the failed request is repeated."""
+    transport = FailingTransport(session, SENSOR_URL, failures=2)
+    gios = await Gios.create(
+        session, STATION_ID, transport, retry=RetryPolicy(base_delay=0)
+    )
+
+    data = await gios.async_update()
+
+    assert data.pm10 is not None
+    assert data.pm10.value == 7.6
+    assert transport.requests.count(SENSOR_URL) == 3
+    assert transport.requests.count(f"{API}/data/getData/3760") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_retries_exhausted(session: aiohttp.ClientSession) -> None:
+    """Test the error after the last attempt."""
+    url = f"{API}/aqindex/getIndex/{STATION_ID}"
+    transport = FailingTransport(session, url, failures=3)
+    gios = await Gios.create(
+        session, STATION_ID, transport, retry=RetryPolicy(attempts=2)
+    )
+
+    with pytest.raises(ApiError, match="503"):
+        await gios.async_update()
+
+    assert transport.requests.count(url) == 2
+    assert gios.for_station(STATION_ID).retry is gios.retry
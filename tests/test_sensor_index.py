@@ -0,0 +1,106 @@
+"""Tests for the sensor index."""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import Gios
+from gios.sensor_index import (
+    SensorIndex,
+    SensorInfo,
+    StationPollutant,
+    station_pollutants,
+)
+
+from .conftest import API, STATION_ID
+
+
+@pytest.mark.asyncio
+async def test_prefetch_and_persist(
+    session: aiohttp.ClientSession, api_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test that a persisted index saves station sensors requests."""
+    path = tmp_path / "sensors.json"
+    api_mock.get(
+        f"{API}/station/sensors/562", status=HTTPStatus.NOT_FOUND.value, repeat=True
+    )
+
+    gios = await Gios.create(session)
+    assert await gios.async_prefetch_sensors(concurrency=2) == 1
+    assert await gios.async_prefetch_sensors() == 0
+    assert gios.sensor_index[STATION_ID][0] == SensorInfo(3759, "tlenek azotu", "NO")
+    gios.sensor_index.save(path)
+
+    api_mock.requests.clear()
+    index = SensorIndex.load(path)
+    assert dict(index) == dict(gios.sensor_index)
+
+    gios = await Gios.create(session, STATION_ID, sensor_index=index)
+    data = await gios.async_update()
+
+    assert data.pm10 is not None
+    assert ("GET", URL(f"{API}/station/sensors/{STATION_ID}")) not in api_mock.requests
+
+
+def test_load_missing_or_outdated(tmp_path: Path) -> None:
+    """Test loading a missing or unsupported index file."""
+    path = tmp_path / "sensors.json"
+    assert len(SensorIndex.load(path)) == 0
+
+    path.write_text('{"version": 0, "stations": {}}', encoding="utf-8")
+    assert len(SensorIndex.load(path)) == 0
+
+    path.write_text('{"version": 1, "stat', encoding="utf-8")
+    assert len(SensorIndex.load(path)) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_station_refetched(
+    session: aiohttp.ClientSession, api_mock: aiointercept
+) -> None:
+    """Test that station sensors older than max_age are fetched again."""
+    index = SensorIndex(max_age=3600)
+    index.set(STATION_ID, [SensorInfo(1, "pył zawieszony PM10", "PM10")], updated=0)
+
+    gios = await Gios.create(session, STATION_ID, sensor_index=index)
+    data = await gios.async_update()
+
+    assert data.pm10 is not None
+    assert ("GET", URL(f"{API}/station/sensors/{STATION_ID}")) in api_mock.requests
+    assert index.is_fresh(STATION_ID)
+    assert index[STATION_ID][0] == SensorInfo(3759, "tlenek azotu", "NO")
+
+
+def test_freshness() -> None:
+    """Test station freshness and index version."""
+    index = SensorIndex()
+    sensor = SensorInfo(3764, "pył zawieszony PM10", "PM10")
+
+    index.set(STATION_ID, [sensor], updated=0)
+    index.set(STATION_ID, [sensor])
+
+    assert index.version == 1
+    assert index.is_fresh(STATION_ID)
+    assert index.is_fresh(STATION_ID, max_age=60)
+    assert not index.is_fresh(562)
+
+
+def test_station_pollutants() -> None:
+    """Test grouping station sensors by pollutant."""
+    pollutants = station_pollutants(
+        [
+            SensorInfo(3764, "pył zawieszony PM10", "PM10"),
+            SensorInfo(3765, "pył zawieszony PM10", "PM10"),
+            SensorInfo(14688, "pył zawieszony PM2.5", "PM2.5"),
+            SensorInfo(1, "benzo(a)piren w PM10", "BaP(PM10)"),
+        ]
+    )
+
+    assert pollutants == {
+        "pm10": StationPollutant("particulate matter 10", (3764, 3765)),
+        "pm2.5": StationPollutant("particulate matter 2.5", (14688,)),
+    }
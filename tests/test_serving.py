@@ -0,0 +1,98 @@
+"""Tests for serving stale data while revalidating."""
+
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from yarl import URL
+
+from gios import ApiError, Gios, GiosStation
+from gios.breaker import STATE_OPEN, CircuitBreaker
+from gios.serving import StaleWhileRevalidate
+from gios.transport import SessionTransport, TransportResponse
+
+from .conftest import STATION_ID
+
+
+class FlakyTransport(SessionTransport):
+    """Transport failing on demand and counting requests."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Initialize."""
+        super().__init__(session)
+        self.failing = False
+        self.requests = 0
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Retrieve data or fail."""
+        self.requests += 1
+        if self.failing:
+            return TransportResponse(HTTPStatus.SERVICE_UNAVAILABLE.value)
+        return await super().get(url)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_serve_stale_while_failing(session: aiohttp.ClientSession) -> None:
+    """Test serving the last good data while the upstream fails."""
+    transport = FlakyTransport(session)
+    gios = await Gios.create(session, STATION_ID, transport)
+    serving = StaleWhileRevalidate(
+        gios, max_age=0, breaker=CircuitBreaker(failure_threshold=2)
+    )
+
+    first = await serving.async_get()
+    assert first.error is None
+
+    transport.failing = True
+    for _ in range(4):
+        served = await serving.async_get()
+        assert served.sensors == first.sensors
+        assert served.stale
+        await serving.async_wait()
+
+    assert serving.breaker.state == STATE_OPEN
+    requests = transport.requests
+    served = await serving.async_get()
+    await serving.async_wait()
+    assert transport.requests == requests
+    assert "CircuitOpenError" in (served.error or "")
+    assert served.age > first.age
+    await serving.async_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_revalidate(session: aiohttp.ClientSession) -> None:
+    """Test that revalidation refreshes the data."""
+    gios = await Gios.create(session, STATION_ID)
+    serving = StaleWhileRevalidate(gios, max_age=0)
+
+    await serving.async_get()
+    await serving.async_get()
+    assert serving.revalidating
+    await serving.async_wait()
+
+    served = await serving.async_get()
+    assert served.error is None
+    await serving.async_close()
+    assert not serving.revalidating
+
+
+@pytest.mark.asyncio
+async def test_first_request_fails(session: aiohttp.ClientSession) -> None:
+    """Test that the first request raises without data to serve."""
+    transport = FlakyTransport(session)
+    transport.failing = True
+    gios = Gios(
+        STATION_ID,
+        session,
+        transport,
+        measurement_stations={
+            STATION_ID: GiosStation(STATION_ID, "Warszawa", 52.29, 21.04)
+        },
+    )
+    serving = StaleWhileRevalidate(gios)
+
+    with pytest.raises(ApiError):
+        await serving.async_get()
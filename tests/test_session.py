@@ -0,0 +1,84 @@
+"""Tests for the managed connection pool."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aiointercept import aiointercept
+
+from gios import Gios
+from gios.session import ConnectionPool
+
+from .conftest import API, STATION_ID
+
+
+@pytest.mark.asyncio
+async def test_shared_pool(api_mock: aiointercept) -> None:
+    """Test that Gios instances share the managed session."""
+    api_mock.head(API, status=HTTPStatus.NOT_FOUND.value, repeat=True)
+
+    async with ConnectionPool(limit_per_host=4) as pool:
+        assert await pool.prewarm(2) == 2
+
+        gios = await Gios.create(pool.session, STATION_ID)
+        other = gios.for_station(562)
+        await gios.async_update()
+
+        assert other.session is pool.session
+        stats = pool.stats()
+        assert stats.in_use == 0
+        assert stats.waiting == 0
+
+    assert pool.stats().idle == 0
+
+
+@pytest.mark.asyncio
+async def test_prewarm_failure(session_mock: aiointercept) -> None:
+    """Test that failed pre-warming is not fatal."""
+    session_mock.head(API, exception=TimeoutError())
+
+    async with ConnectionPool() as pool:
+        assert await pool.prewarm(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_stats() -> None:
+    """Test pool statistics against a real server."""
+    release = asyncio.Event()
+    busy = asyncio.Event()
+    started = 0
+
+    async def handler(_: web.Request) -> web.Response:
+        nonlocal started
+        started += 1
+        if started == 2:
+            busy.set()
+        await release.wait()
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+
+    async with TestServer(app) as server, ConnectionPool(limit_per_host=2) as pool:
+        url = server.make_url("/")
+
+        async def fetch() -> None:
+            async with pool.session.get(url) as resp:
+                await resp.read()
+
+        tasks = [asyncio.create_task(fetch()) for _ in range(5)]
+        await busy.wait()
+
+        stats = pool.stats()
+        assert (stats.in_use, stats.idle, stats.waiting) == (2, 0, 3)
+        assert stats.created == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        stats = pool.stats()
+        assert (stats.in_use, stats.idle, stats.waiting) == (0, 2, 0)
+        assert stats.created == 2
+        assert stats.reused == 3
@@ -0,0 +1,174 @@
+"""Tests for sharded polling."""
+
+import multiprocessing
+import queue
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import Gios, GiosStation
+from gios.retry import RetryPolicy
+from gios.sensor_index import SensorIndex
+from gios.sharding import ShardedPoller, SharedCache, StationResult, _next_result
+from gios.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    SessionTransport,
+    TransportResponse,
+)
+
+from .conftest import STATION_ID
+
+
+class LateQueue:
+    """Queue whose items arrive just after the first wait times out."""
+
+    def __init__(self, *items: StationResult | None) -> None:
+        """Initialize."""
+        self.items = list(items)
+        self.waited = False
+
+    def get(self, timeout: float) -> StationResult | None:  # noqa: ARG002
+        """Time out on the first call."""
+        if not self.waited:
+            self.waited = True
+            raise queue.Empty
+        return self.get_nowait()
+
+    def get_nowait(self) -> StationResult | None:
+        """Return the next item."""
+        if not self.items:
+            raise queue.Empty
+        return self.items.pop(0)
+
+
+def test_next_result_drains_queue() -> None:
+    """Test that results of exited workers aren't lost."""
+    process = multiprocessing.get_context("spawn").Process(target=int)
+    process.start()
+    process.join()
+    result = StationResult(STATION_ID, None, "error", 0.1, 0)
+    results = LateQueue(result, None)
+
+    assert _next_result(results, [process]) == result  # ty: ignore[invalid-argument-type]
+    assert _next_result(results, [process]) is None  # ty: ignore[invalid-argument-type]
+    with pytest.raises(queue.Empty):
+        _next_result(results, [process])  # ty: ignore[invalid-argument-type]
+
+
+def replay_transport(path: Path, session: aiohttp.ClientSession) -> ReplayTransport:  # noqa: ARG001
+    """Return the worker transport replaying the recording."""
+    return ReplayTransport(path)
+
+
+class FlakyTransport:
+    """Transport failing the first request for every URL."""
+
+    def __init__(self, transport: ReplayTransport) -> None:
+        """Initialize."""
+        self.transport = transport
+        self.failed: set[URL] = set()
+
+    async def get(self, url: URL) -> TransportResponse:
+        """Return 503 for the first request, then the replayed response."""
+        if url not in self.failed:
+            self.failed.add(url)
+            return TransportResponse(HTTPStatus.SERVICE_UNAVAILABLE.value)
+        return await self.transport.get(url)
+
+
+def flaky_transport(path: Path, session: aiohttp.ClientSession) -> FlakyTransport:  # noqa: ARG001
+    """Return the worker transport failing the first request for every URL."""
+    return FlakyTransport(ReplayTransport(path))
+
+
+def test_shared_cache(tmp_path: Path) -> None:
+    """Test saving and loading the shared cache."""
+    cache = SharedCache(tmp_path / "cache")
+    sensor_index = SensorIndex()
+    sensor_index.set_station_data(
+        STATION_ID,
+        [
+            {
+                "Identyfikator stanowiska": 3764,
+                "Wskaźnik": "pył zawieszony PM10",
+                "Wskaźnik - wzór": "PM10",
+            }
+        ],
+    )
+    station = GiosStation(STATION_ID, "Warszawa, ul. Kondratowicza", 52.29, 21.04)
+
+    cache.save([station], sensor_index)
+    stations, loaded_index = cache.load()
+
+    assert stations[STATION_ID] == station
+    assert dict(loaded_index) == dict(sensor_index)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(60)
+async def test_poll_in_processes(
+    session: aiohttp.ClientSession, api_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test streaming results of stations updated in worker processes."""
+    path = tmp_path / "gios.rec"
+    with RecordingTransport(SessionTransport(session), path) as recorder:
+        gios = await Gios.create(session, STATION_ID, recorder)
+        expected = await gios.async_update()
+    api_mock.clear()
+
+    replay = ReplayTransport(path)
+    poller = ShardedPoller(
+        Gios(
+            None,
+            session,
+            replay,
+            measurement_stations=gios.measurement_stations,
+        ),
+        processes=2,
+        cache_dir=tmp_path / "cache",
+        transport_factory=partial(replay_transport, path),
+    )
+    results = {result.station_id: result async for result in poller.async_poll()}
+
+    assert results[STATION_ID].sensors == expected
+    assert results[STATION_ID].error is None
+    assert results[562].sensors is None
+    assert "ApiError" in (results[562].error or "")
+    assert {result.worker for result in results.values()} == {0, 1}
+    assert (tmp_path / "cache" / "stations.json").exists()
+    replay.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(60)
+async def test_poll_with_retry(
+    session: aiohttp.ClientSession, api_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test that workers retry failed requests with the retry policy."""
+    path = tmp_path / "gios.rec"
+    with RecordingTransport(SessionTransport(session), path) as recorder:
+        gios = await Gios.create(session, STATION_ID, recorder)
+        expected = await gios.async_update()
+    api_mock.clear()
+
+    poller = ShardedPoller(
+        Gios(
+            None,
+            session,
+            measurement_stations=gios.measurement_stations,
+            sensor_index=gios.sensor_index,
+            retry=RetryPolicy(base_delay=0, jitter=False),
+        ),
+        processes=1,
+        transport_factory=partial(flaky_transport, path),
+    )
+    results = [result async for result in poller.async_poll([STATION_ID])]
+
+    assert results[0].error is None
+    assert results[0].sensors == expected
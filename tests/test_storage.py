@@ -0,0 +1,59 @@
+"""Tests for the SQLite measurement store."""
+
+import math
+from pathlib import Path
+from typing import Any
+
+from gios.storage import MeasurementStore, to_epoch
+
+SENSOR_ID = 3759
+
+
+def test_to_epoch() -> None:
+    """Test conversion of GIOS local time to Unix time."""
+    assert to_epoch("2025-07-04 15:00:00") == 1751634000
+    assert to_epoch("2025-01-04 15:00:00") == 1735999200
+
+
+def test_ingest_deduplicates(
+    tmp_path: Path, sensor_3759: dict[str, Any], sensor_3760: dict[str, Any]
+) -> None:
+    """Test that stored entries are not written again."""
+    entries = sensor_3759["Lista danych pomiarowych"]
+
+    with MeasurementStore(tmp_path / "gios.db") as store:
+        assert store.ingest(SENSOR_ID, entries) == len(entries)
+        assert store.ingest(SENSOR_ID, entries) == 0
+        assert store.ingest_many({3760: sensor_3760["Lista danych pomiarowych"]}) > 0
+
+        corrected = [{**entries[0], "Wartość": 1.5}, dict(entries[1])]
+        corrected[1]["Wartość"] = None
+        assert store.ingest(SENSOR_ID, corrected) == 1
+
+        timestamps, values = store.query(SENSOR_ID)
+        assert len(timestamps) == len(entries)
+        assert list(timestamps) == sorted(timestamps)
+        assert values[-1] == 1.5
+        assert values[-2] == entries[1]["Wartość"]
+        assert store.latest_timestamp(SENSOR_ID) == to_epoch(entries[0]["Data"])
+        assert store.latest_timestamp(1) is None
+
+
+def test_query_range() -> None:
+    """Test range query with missing values."""
+    entries = [
+        {"Data": "2025-07-04 15:00:00", "Wartość": None},
+        {"Data": "2025-07-04 14:00:00", "Wartość": 2.0},
+        {"Data": "2025-07-04 13:00:00", "Wartość": 1.0},
+    ]
+
+    with MeasurementStore() as store:
+        store.ingest(SENSOR_ID, entries)
+
+        timestamps, values = store.query(
+            SENSOR_ID, start=to_epoch("2025-07-04 14:00:00")
+        )
+
+    assert list(timestamps) == [1751630400, 1751634000]
+    assert values[0] == 2.0
+    assert math.isnan(values[1])
@@ -0,0 +1,116 @@
+"""Tests for the synthetic GIOS API payloads."""
+
+import aiohttp
+import pytest
+from yarl import URL
+
+from gios import Gios
+from gios.const import URL_SENSOR, URL_STATION, URL_STATIONS
+from gios.synthetic import (
+    ERROR_MANUAL_SENSOR,
+    FIRST_STATION_ID,
+    PROFILES,
+    SENSOR_SLOTS,
+    SyntheticNetwork,
+    SyntheticTransport,
+)
+
+
+def test_deterministic() -> None:
+    """Test that the same seed gives the same payloads."""
+    first = SyntheticNetwork(stations=20, seed=7)
+    second = SyntheticNetwork(stations=20, seed=7)
+    other = SyntheticNetwork(stations=20, seed=8)
+    station_id = FIRST_STATION_ID + 5
+
+    sensors = first.station_sensors(station_id)
+    assert sensors is not None
+    assert sensors == second.station_sensors(station_id)
+    assert first.index(station_id) == second.index(station_id)
+    for sensor in sensors["Lista stanowisk pomiarowych dla podanej stacji"]:
+        sensor_id = sensor["Identyfikator stanowiska"]
+        assert first.sensor_data(sensor_id) == second.sensor_data(sensor_id)
+    assert first.stations_page(0) != other.stations_page(0)
+
+
+def test_stations_pages() -> None:
+    """Test pagination of the stations list."""
+    network = SyntheticNetwork(stations=25)
+
+    first = network.stations_page(0, 10)
+    last = network.stations_page(2, 10)
+
+    assert first["totalPages"] == 3
+    assert len(first["Lista stacji pomiarowych"]) == 10
+    assert len(last["Lista stacji pomiarowych"]) == 5
+    assert (
+        last["Lista stacji pomiarowych"][-1]["Identyfikator stacji"]
+        == FIRST_STATION_ID + 24
+    )
+
+
+def test_sensor_data() -> None:
+    """Test measurements, missing values and manual sensors."""
+    network = SyntheticNetwork(stations=2, hours=48, null_ratio=0.5)
+    station_id = FIRST_STATION_ID
+
+    data = network.sensor_data(station_id * SENSOR_SLOTS)
+    assert data is not None
+    entries = data["Lista danych pomiarowych"]
+
+    assert len(entries) == 48
+    assert entries[0]["Data"] == "2025-07-04 15:00:00"
+    assert entries[-1]["Data"] == "2025-07-02 16:00:00"
+    assert any(entry["Wartość"] is None for entry in entries)
+    assert any(entry["Wartość"] is not None for entry in entries)
+    assert network.sensor_data(station_id * SENSOR_SLOTS + SENSOR_SLOTS - 1) is None
+    assert network.sensor_data(1) is None
+
+
+def test_manual_sensors() -> None:
+    """Test that manual sensors return the API error payload."""
+    network = SyntheticNetwork(stations=2)
+    # the second station of the default seed has the manual PM10 sensor
+    station_id = FIRST_STATION_ID + 1
+    sensors = network.station_sensors(station_id)
+    assert sensors is not None
+
+    manual = [
+        sensor["Identyfikator stanowiska"]
+        for sensor in sensors["Lista stanowisk pomiarowych dla podanej stacji"]
+        if PROFILES[sensor["Identyfikator stanowiska"] % SENSOR_SLOTS].manual
+    ]
+
+    assert manual == [station_id * SENSOR_SLOTS + 1]
+    assert network.sensor_data(manual[0]) == ERROR_MANUAL_SENSOR
+
+
+@pytest.mark.asyncio
+async def test_unknown_urls() -> None:
+    """Test that unknown URLs return 404."""
+    transport = SyntheticTransport(SyntheticNetwork(stations=2))
+
+    assert (await transport.get(URL(URL_STATIONS))).status == 200
+    assert (await transport.get(URL(f"{URL_STATION}/1"))).status == 404
+    assert (await transport.get(URL(f"{URL_SENSOR}/abc"))).status == 404
+    assert (await transport.get(URL("https://example.com/other"))).status == 404
+
+
+@pytest.mark.asyncio
+async def test_update(session: aiohttp.ClientSession) -> None:
+    """Test updates of the synthetic network with the client."""
+    network = SyntheticNetwork(stations=600)
+    transport = SyntheticTransport(network)
+    gios = await Gios.create(session, transport=transport)
+
+    assert len(gios.measurement_stations) == 600
+
+    station_ids = list(network.station_ids)[:: network.stations // 5]
+    results = dict(
+        [item async for item in gios.async_iter_updates(station_ids, concurrency=2)]
+    )
+
+    assert results.keys() == set(station_ids)
+    for result in results.values():
+        assert not isinstance(result, Exception)
+        assert result.aqi is not None
@@ -0,0 +1,78 @@
+"""Tests for timeline tracing."""
+
+import json
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from gios import Gios
+from gios.tracing import Tracer, span
+
+from .conftest import STATION_ID
+
+
+def test_disabled_without_tracer() -> None:
+    """Test that spans are no-ops outside of the tracer context."""
+    tracer = Tracer()
+
+    with span("stage", value=1) as details:
+        assert details == {"value": 1}
+    with tracer, span("stage"):
+        pass
+    with span("stage"):
+        pass
+
+    assert [event.name for event in tracer.events] == ["stage"]
+    assert tracer.events[0].lane == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_trace_update(session: aiohttp.ClientSession, tmp_path: Path) -> None:
+    """Test tracing the update and exporting it."""
+    gios = await Gios.create(session, STATION_ID)
+    path = tmp_path / "trace.json"
+
+    with Tracer() as tracer:
+        await gios.async_update()
+        async for _ in gios.async_iter_updates([STATION_ID], concurrency=2):
+            pass
+    tracer.export(path)
+
+    names = [event.name for event in tracer.events]
+    assert names.count("async_update") == 2
+    assert {"station", "sensors", "values", "indexes", "build", "fleet"} <= set(names)
+    requests = [event for event in tracer.events if event.category == "request"]
+    assert all(event.args["status"] == 200 for event in requests)
+    # sensor requests are gathered, each one runs in its own task lane
+    assert len({event.lane for event in requests}) > 1
+
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert len(events) == len(tracer.events)
+    assert events == sorted(events, key=lambda event: event["ts"])
+    assert {event["ph"] for event in trace["traceEvents"]} == {"M", "X"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("api_mock")
+async def test_trace_partial_update(session: aiohttp.ClientSession) -> None:
+    """Test tracing stages of the deadline-bounded update."""
+    gios = await Gios.create(session, STATION_ID)
+
+    with Tracer() as tracer:
+        await gios.async_update_partial(10)
+
+    stages = {event.name: event for event in tracer.events}
+    assert {
+        "async_update_partial",
+        "station",
+        "sensors",
+        "values",
+        "indexes",
+        "build",
+    } <= stages.keys()
+    assert stages["station"].args["timeout"] <= 10
+    assert stages["sensors"].args["errors"] == 0
+    assert "error" not in stages["indexes"].args
@@ -0,0 +1,69 @@
+"""Tests for GIOS transports."""
+
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiointercept import aiointercept
+from yarl import URL
+
+from gios import ApiError, Gios
+from gios.transport import RecordingTransport, ReplayTransport, SessionTransport
+
+from .conftest import API, STATION_ID
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(
+    session: aiohttp.ClientSession, api_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test that a replayed update returns the recorded data."""
+    path = tmp_path / "gios.rec"
+
+    with RecordingTransport(SessionTransport(session), path) as recorder:
+        gios = await Gios.create(session, STATION_ID, recorder)
+        recorded = await gios.async_update()
+
+    api_mock.clear()
+
+    replay = ReplayTransport(path)
+    assert f"{API}/station/sensors/{STATION_ID}" in replay.urls
+    gios = await Gios.create(session, STATION_ID, replay)
+
+    assert await gios.async_update() == recorded
+    assert await gios.async_update() == recorded
+
+    with pytest.raises(ApiError, match="404"):
+        await gios._async_get(URL(f"{API}/station/sensors/1"))  # noqa: SLF001
+
+    replay.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_with_speed(
+    session: aiohttp.ClientSession, api_mock: aiointercept, tmp_path: Path
+) -> None:
+    """Test replaying the recorded timeline faster than real time."""
+    path = tmp_path / "gios.rec"
+    url = URL(f"{API}/aqindex/getIndex/{STATION_ID}")
+
+    with RecordingTransport(SessionTransport(session), path) as recorder:
+        recorded = await recorder.get(url)
+
+    api_mock.clear()
+
+    replay = ReplayTransport(path, speed=1000)
+    response = await replay.get(url)
+
+    assert response.status == recorded.status
+    assert response.data == recorded.data
+    replay.close()
+
+
+def test_replay_invalid_archive(tmp_path: Path) -> None:
+    """Test that a file which is not a recording is rejected."""
+    path = tmp_path / "invalid.rec"
+    path.write_bytes(b"not a recording archive")
+
+    with pytest.raises(ValueError, match="is not a GIOS recording"):
+        ReplayTransport(path)